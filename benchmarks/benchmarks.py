@@ -0,0 +1,415 @@
+"""
+Benchmark suite for growing meshes, collision checks, fitness functions and evolution throughput.
+
+Every benchmark runs on a fixed corpus of grammars: the example grammar from model/grow_mesh_test.py, and
+divide-heavy, grow-heavy and relabel-cycle grammars that stress one operation each. Each measurement is the
+median of several repeats. Results are written as JSON, and comparing them against a baseline file flags
+every metric that got worse by more than a tolerance:
+    python benchmarks/benchmarks.py --output before.json
+    python benchmarks/benchmarks.py --baseline before.json --output after.json
+Exits with status 1 if a metric regressed against the baseline.
+
+October 19th, 2026
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import statistics
+import contextlib
+from datetime import datetime
+from pathlib import Path
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+# pylint: disable=wrong-import-position
+from model.grammar import Grammar
+from model.tetrahedral_mesh import TetrahedralMesh, OPERATIONS
+import evolutionary_alg
+import default_args as D
+
+SUITES = ["growth", "collision", "fitness", "evolution"]
+FITNESS_FUNCTIONS = ["dist_to_point", "out_there_score", "num_faces", "hull_volume"]
+ALPHABET = ["A", "B", "C", "D", "E", "F", "G"]
+ITERS = 300 # Rule applications per grown mesh
+FACE_COUNTS = [100, 300, 1000] # Mesh sizes to time collision checks at
+REPEATS = 3
+MIN_SAMPLE = 0.02 # Seconds each timed sample of a fast call runs for at least
+TOLERANCE = 0.2 # Fraction a metric may get worse by before it counts as a regression
+OUTPUT = os.path.join(ROOT, "benchmarks", "results.json")
+
+# Seeded run timed by the evolution suite
+EVOLUTION_SETTINGS = {
+    "generations": 5,
+    "population_size": 16,
+    "num_elites": 4,
+    "iters_per_run": 80,
+    "mutuation_rate": 0.2,
+    "crossover_rate": 0.5,
+    "crossover_strategy": "uniform",
+    "fitness_function": "dist_to_point",
+    "sort_reverse": False,
+    "check_collision": True,
+    "export_generations": False,
+    "export_stl": False,
+    "export_extension": ".stl",
+    "alphabet": ALPHABET,
+    "workers": 1,
+    "seed": 0,
+    "checkpoint_interval": 0,
+    "register_runs": False
+}
+
+
+def example_grammar() -> Grammar:
+    """
+    Returns:
+        Grammar: The example grammar from model/grow_mesh_test.py.
+    """
+
+    sys.path.insert(0, str(ROOT / "model")) # grow_mesh_test imports its neighbours as top-level modules
+    from grow_mesh_test import make_example_grammar  # pylint: disable=import-outside-toplevel,import-error
+
+    grammar = Grammar(ALPHABET, OPERATIONS)
+    grammar.add_from_dict(make_example_grammar().to_dict())
+
+    return grammar
+
+
+def make_grammar(rules: list[tuple[str, str, str]]) -> Grammar:
+    """
+    Parameters:
+        rules (list[tuple[str, str, str]]): (lhs, operation, rhs) of each rule.
+
+    Returns:
+        Grammar: A grammar with the given rules.
+    """
+
+    grammar = Grammar(ALPHABET, OPERATIONS)
+
+    for lhs, operation, rhs in rules:
+        grammar.add_rule(lhs, operation, list(rhs))
+
+    return grammar
+
+
+def corpus() -> dict[str, Grammar]:
+    """
+    Returns:
+        dict[str, Grammar]: The benchmark grammars by name.
+    """
+
+    return {
+        "example": example_grammar(),
+        # Mostly divides, so faces multiply without new geometry to check for collisions
+        "divide_heavy": make_grammar([("A", "divide", "BCDE"), ("B", "divide", "CDEA"), ("C", "divide", "DEAB"),
+                                      ("D", "divide", "EABC"), ("E", "grow", "ABF"), ("F", "divide", "GABC"),
+                                      ("G", "relabel", "A")]),
+        # Every face grows a tetrahedron, the worst case for collision checks
+        "grow_heavy": make_grammar([("A", "grow", "BCD"), ("B", "grow", "CDE"), ("C", "grow", "DEF"),
+                                    ("D", "grow", "EFG"), ("E", "grow", "FGA"), ("F", "grow", "GAB"),
+                                    ("G", "grow", "ABC")]),
+        # Faces only change labels, so this times the rule lookup and queue alone
+        "relabel_cycle": make_grammar([("A", "relabel", "B"), ("B", "relabel", "C"), ("C", "relabel", "D"),
+                                       ("D", "relabel", "E"), ("E", "relabel", "F"), ("F", "relabel", "G"),
+                                       ("G", "relabel", "A")])
+    }
+
+
+def grow(grammar: Grammar, iters: int, check_collision: bool) -> tuple[TetrahedralMesh, int]:
+    """
+    Parameters:
+        grammar (Grammar): Grammar to grow.
+        iters (int): Number of rules to apply. Stops early if every face was blocked by a collision.
+        check_collision (bool): Whether grows are checked for collisions.
+
+    Returns:
+        tuple[TetrahedralMesh, int]: The grown mesh, and the number of rules applied.
+    """
+
+    mesh = TetrahedralMesh(grammar, check_collision)
+
+    for i in range(iters):
+        if not mesh.queue:
+            return mesh, i
+        mesh.apply_rule()
+
+    return mesh, iters
+
+
+def median_seconds(function, repeats: int, min_sample: float = 0.0) -> float:
+    """
+    Parameters:
+        function: Function to time, called without arguments.
+        repeats (int): Number of samples to take.
+        min_sample (float): Seconds each sample runs for at least. Fast functions are called several
+                            times per sample, so timer resolution doesn't swamp them.
+
+    Returns:
+        float: Median wall-clock seconds of one call.
+    """
+
+    calls = 1
+    start = time.perf_counter()
+    function()
+    first = time.perf_counter() - start
+    if first < min_sample:
+        calls = int(min_sample / max(first, 1e-7)) + 1
+
+    times = []
+
+    for i in range(repeats):
+        start = time.perf_counter()
+        for j in range(calls):
+            function()
+        times.append((time.perf_counter() - start) / calls)
+
+    return statistics.median(times)
+
+
+def metric(value: float, unit: str, higher_is_better: bool, **details) -> dict:
+    """
+    Parameters:
+        value (float): The measurement.
+        unit (str): Its unit.
+        higher_is_better (bool): Whether a larger value is an improvement.
+        **details: Context to record with it, such as face counts.
+
+    Returns:
+        dict: The metric as stored in the results file.
+    """
+
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better, **details}
+
+
+def bench_growth(grammars: dict[str, Grammar], iters: int, repeats: int) -> dict:
+    """
+    Times apply_rule on every grammar, with and without collision checks.
+
+    Returns:
+        dict: "growth/GRAMMAR/collision" and "growth/GRAMMAR/no_collision" metrics in steps per second.
+    """
+
+    results = {}
+
+    for name, grammar in grammars.items():
+        for check_collision in [False, True]:
+            mesh, steps = grow(grammar, iters, check_collision)
+            seconds = median_seconds(lambda: grow(grammar, iters, check_collision), repeats, MIN_SAMPLE)
+            key = "growth/{}/{}".format(name, "collision" if check_collision else "no_collision")
+            results[key] = metric(steps / seconds, "steps/s", True, faces=mesh.get_num_faces())
+
+    return results
+
+
+def bench_collision(grammars: dict[str, Grammar], face_counts: list[int], repeats: int) -> dict:
+    """
+    Times check_face_intersection against meshes of growing size. The probe triangle is far from the mesh,
+    so every face is tested, the cost of a grow that doesn't collide.
+
+    Returns:
+        dict: "collision/FACES" metrics in microseconds per check, with the cost per face.
+    """
+
+    results = {}
+    probe = np.array([[1000.0, 1000.0, 1000.0], [1001.0, 1000.0, 1000.0], [1000.0, 1001.0, 1000.0]])
+
+    for face_count in face_counts:
+        mesh = TetrahedralMesh(grammars["grow_heavy"], False)
+        while mesh.get_num_faces() < face_count:
+            mesh.apply_rule()
+
+        seconds = median_seconds(lambda: mesh.check_face_intersection(probe), repeats, MIN_SAMPLE)
+        microseconds = seconds * 1e6
+        results["collision/{}".format(face_count)] = metric(microseconds, "us/check", False,
+                                                            faces=mesh.get_num_faces(),
+                                                            us_per_face=microseconds / mesh.get_num_faces())
+
+    return results
+
+
+def bench_fitness(grammars: dict[str, Grammar], iters: int, repeats: int) -> dict:
+    """
+    Times every fitness function on the mesh each grammar grows.
+
+    Returns:
+        dict: "fitness/FUNCTION/GRAMMAR" metrics in microseconds per call.
+    """
+
+    results = {}
+
+    for name, grammar in grammars.items():
+        mesh = grow(grammar, iters, True)[0]
+        for fitness_function in FITNESS_FUNCTIONS:
+            seconds = median_seconds(lambda: evolutionary_alg.compute_fitness(mesh, fitness_function), repeats,
+                                     MIN_SAMPLE)
+            results["fitness/{}/{}".format(fitness_function, name)] = metric(seconds * 1e6, "us", False,
+                                                                            faces=mesh.get_num_faces())
+
+    return results
+
+
+def bench_evolution(repeats: int) -> dict:
+    """
+    Times a seeded EvolutionRun, see EVOLUTION_SETTINGS. Its output goes to a temporary directory.
+
+    Returns:
+        dict: The "evolution" metric in evaluations per second, with the run's final best fitness so a
+              change in results is noticed too.
+    """
+
+    times = []
+    symlink = os.path.join(ROOT, "latest_run")
+    latest_run = os.readlink(symlink) if os.path.islink(symlink) else None
+
+    for i in range(repeats):
+        with tempfile.TemporaryDirectory() as data_path, open(os.devnull, 'w') as devnull:
+            run = evolutionary_alg.EvolutionRun(**EVOLUTION_SETTINGS, data_path=data_path, run_name="benchmark")
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(devnull):
+                run.run()
+            times.append(time.perf_counter() - start)
+
+    # Point latest_run back at the last real run instead of a deleted temporary one
+    if os.path.islink(symlink):
+        os.remove(symlink)
+    if latest_run is not None:
+        os.symlink(latest_run, symlink)
+
+    seconds = statistics.median(times)
+
+    return {"evolution": metric(run.evaluations / seconds, "evals/s", True, evaluations=run.evaluations,
+                                best_fitness=run.best_fitness[-1])}
+
+
+def run_suites(suites: list[str], iters: int, repeats: int) -> dict:
+    """
+    Runs the benchmark suites, printing each metric as it is measured.
+
+    Parameters:
+        suites (list[str]): Suites to run, from SUITES.
+        iters (int): Rule applications per grown mesh.
+        repeats (int): Number of repeats to take the median of.
+
+    Returns:
+        dict: The results file contents, "environment" and "metrics".
+    """
+
+    grammars = corpus()
+    metrics = {}
+
+    for suite in suites:
+        match suite:
+            case "growth":
+                results = bench_growth(grammars, iters, repeats)
+            case "collision":
+                results = bench_collision(grammars, FACE_COUNTS, repeats)
+            case "fitness":
+                results = bench_fitness(grammars, iters, repeats)
+            case "evolution":
+                results = bench_evolution(repeats)
+            case _:
+                raise ValueError("Unexpected suite {}. Try one of {}".format(suite, SUITES))
+
+        for key, result in results.items():
+            print("{:<40} {:12.3f} {}".format(key, result["value"], result["unit"]))
+        metrics.update(results)
+
+    environment = {
+        "time": datetime.now().isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "iters": iters,
+        "repeats": repeats,
+        "point": D.POINT
+    }
+
+    return {"environment": environment, "metrics": metrics}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Compares results against a baseline, printing the change of every metric both have.
+
+    Parameters:
+        results (dict): Results of run_suites().
+        baseline (dict): Earlier results to compare against.
+        tolerance (float): Fraction a metric may get worse by before it counts as a regression.
+
+    Returns:
+        list[str]: The metrics that regressed.
+    """
+
+    regressions = []
+
+    print("\n{:<40} {:>12} {:>12} {:>8}".format("metric", "baseline", "current", "change"))
+
+    for key, result in results["metrics"].items():
+        if key not in baseline["metrics"]:
+            continue
+
+        before = baseline["metrics"][key]["value"]
+        after = result["value"]
+        change = (after - before) / before if before else 0.0
+        worse = -change if result["higher_is_better"] else change
+        regressed = worse > tolerance
+
+        if regressed:
+            regressions.append(key)
+
+        print("{:<40} {:12.3f} {:12.3f} {:+7.1%}{}".format(key, before, after, change,
+                                                           "  REGRESSED" if regressed else ""))
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark mesh growth, collision checks, fitness and evolution')
+    parser.add_argument('--suites',
+                        type=str,
+                        nargs='+',
+                        choices=SUITES,
+                        help='suites to run',
+                        default=SUITES)
+    parser.add_argument('--iters',
+                        type=int,
+                        help='rule applications per grown mesh',
+                        default=ITERS)
+    parser.add_argument('--repeats',
+                        type=int,
+                        help='number of repeats to take the median of',
+                        default=REPEATS)
+    parser.add_argument('--output',
+                        type=str,
+                        help='path of the JSON file to write results to',
+                        default=OUTPUT)
+    parser.add_argument('--baseline',
+                        type=str,
+                        help='JSON results of an earlier run to compare against',
+                        default=None)
+    parser.add_argument('--tolerance',
+                        type=float,
+                        help='fraction a metric may get worse by before it counts as a regression',
+                        default=TOLERANCE)
+    args = parser.parse_args()
+
+    results = run_suites(args.suites, args.iters, args.repeats)
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=4)
+    print("Wrote {}".format(args.output))
+
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("{} metrics regressed by more than {:.0%}".format(len(regressions), args.tolerance))
+            sys.exit(1)
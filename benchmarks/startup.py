@@ -0,0 +1,97 @@
+"""
+Startup-time benchmark. Times how long the entry points take to import in a fresh interpreter, and checks
+that none of them load pandas, trimesh or scipy, which are only imported on the code paths that use them.
+Exits with status 1 if a heavy dependency is loaded at import or an import goes over its budget, so it can
+guard against regressions. Run from the repository root:
+    python benchmarks/startup.py
+
+October 19th, 2026
+"""
+
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+MODULES = ["evolutionary_alg", "grow_mesh", "model.tetrahedral_mesh", "model.triangle_intersect",
+           "evolution.evaluator"]
+HEAVY_MODULES = ["pandas", "trimesh", "scipy"]
+REPEATS = 7
+BUDGET = 250 # Milliseconds each import may take, not counting interpreter startup
+
+
+def time_import(module: str, repeats: int) -> tuple[float, list[str]]:
+    """
+    Imports a module in fresh interpreters.
+
+    Parameters:
+        module (str): Module to import, or None to time starting the interpreter alone.
+        repeats (int): Number of interpreters to start.
+
+    Returns:
+        tuple[float, list[str]]: Median wall-clock milliseconds, and the heavy modules the import loaded.
+    """
+
+    code = "import sys, time, json; start = time.perf_counter()\n"
+    if module is not None:
+        code += "import {}\n".format(module)
+    code += ("print(json.dumps([(time.perf_counter() - start) * 1000, "
+             "[m for m in {} if m in sys.modules]]))".format(HEAVY_MODULES))
+
+    times = []
+    loaded = []
+    for i in range(repeats):
+        output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        milliseconds, loaded = json.loads(output.stdout.strip().splitlines()[-1])
+        times.append(milliseconds)
+
+    return statistics.median(times), loaded
+
+
+def run_benchmark(modules: list[str], repeats: int, budget: float) -> bool:
+    """
+    Times and checks each module, printing one line per module.
+
+    Parameters:
+        modules (list[str]): Modules to import.
+        repeats (int): Number of imports to take the median of.
+        budget (float): Milliseconds each import may take.
+
+    Returns:
+        bool: Whether every module stayed under budget without loading a heavy dependency.
+    """
+
+    passed = True
+
+    for module in modules:
+        milliseconds, loaded = time_import(module, repeats)
+        ok = milliseconds <= budget and not loaded
+        passed &= ok
+
+        print("{:<28} {:8.1f} ms  {}{}".format(module, milliseconds, "ok" if ok else "FAIL",
+                                               "  loaded " + ", ".join(loaded) if loaded else ""))
+
+    return passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Time and check the imports of the entry points')
+    parser.add_argument('--modules',
+                        type=str,
+                        nargs='+',
+                        help='modules to import',
+                        default=MODULES)
+    parser.add_argument('--repeats',
+                        type=int,
+                        help='number of fresh interpreters to time each import in',
+                        default=REPEATS)
+    parser.add_argument('--budget',
+                        type=float,
+                        help='milliseconds each import may take',
+                        default=BUDGET)
+    args = parser.parse_args()
+
+    sys.exit(0 if run_benchmark(args.modules, args.repeats, args.budget) else 1)
@@ -11,6 +11,50 @@ NUM_ELITES: int = 10
 MUTATION_RATE: float = 0.2
 CROSSOVER_RATE: float = 0.5
 CROSSOVER_STRATEGY: str = "uniform" # Options: "one", "two", "uniform"
+GENOME_BACKEND: str = "grammar" # Options: "grammar", "matrix". "matrix" breeds the whole population at once with NumPy
+
+# Parallelism & seeding
+MODE: str = "generational" # Options: "generational", "steady_state", "islands"
+WORKERS: int = 1 # Worker processes to evaluate each generation on, 1 evaluates in the main process
+SCHEDULE: str = "fifo" # Options: "fifo", "longest_first", "chunked". The last two order work by predicted growth cost
+BROKER_ADDRESS: str = None # "host:port" to serve an evaluation broker on, e.g. "0.0.0.0:50000". No broker when None
+BROKER_AUTHKEY: str = None # Key broker workers need to connect. Required off loopback, random on loopback when None
+BROKER_TIMEOUT: float = 300 # Seconds to wait for results with no live broker worker before failing the run
+SEED: int = None # Seed for a single run, or the batch seed per-run seeds are derived from. Random when None
+
+# Warm start settings
+WARM_START: list[str] = None # run.csv or genX.csv files to seed the initial population with. Random when None
+WARM_START_TOP: int = 0 # Maximum number of grammars to seed with, 0 seeds up to POPULATION_SIZE
+WARM_START_FITNESS: bool = False # Reuse the recorded fitnesses of seeded grammars instead of evaluating them
+
+# Stopping criteria, checked after every generation
+TARGET_FITNESS: float = None # Stop once the best fitness reaches this. Not checked when None
+PATIENCE: int = 0 # Stop after this many generations without a new best fitness. 0 disables
+MAX_EVALUATIONS: int = 0 # Stop once this many genomes were evaluated. 0 disables
+TIME_BUDGET: float = 0 # Stop once this many seconds of wall-clock time passed. 0 disables
+
+# Racing settings, offspring are grown further only while they stay in the best RACING_KEEP fraction
+RACING_LEVELS: int = 1 # Fidelity levels, each growing twice as far as the last up to ITERS_PER_RUN. 1 disables racing
+RACING_KEEP: float = 0.5 # Fraction of racers that move on to the next level
+
+# Surrogate settings
+SURROGATE_OVERSAMPLE: int = 1 # Breed this many times more offspring and only evaluate the most promising. 1 disables
+
+# Novelty search settings
+NOVELTY_WEIGHT: float = 0.0 # Weight of novelty against fitness in selection. 0 disables novelty search, 1 selects on novelty alone
+NOVELTY_K: int = 15 # Number of nearest neighbours novelty is averaged over
+NOVELTY_ADD: int = 2 # Most novel individuals added to the novelty archive per generation
+NOVELTY_REBUILD: int = 1000 # Archive entries added between rebuilds of its k-d tree
+
+# Island settings, used when MODE is "islands"
+ISLANDS: int = 4 # Number of island populations, each in its own process
+MIGRATION_INTERVAL: int = 5 # Generations between migrations
+MIGRATION_SIZE: int = 2 # Best individuals each island sends to each of its targets
+MIGRATION_TOPOLOGY: str = "ring" # Options: "ring", "full"
+
+# Evaluation service settings, see evolution/service.py
+SERVICE_ADDRESS: str = "127.0.0.1:50800" # "host:port" or "unix:/path/to.sock"
+SERVICE_WORKERS: int = 4 # Worker processes the service evaluates on
 
 # Mesh & Grammar settings
 ITERS_PER_RUN: int = 100
@@ -24,12 +68,22 @@ POINT: list[float] = [25, 0, 25] # Point for mesh to grow toward for "dist_to_po
 
 # Export settings
 EXPORT_GENERATIONS: bool = True
+GENERATION_FORMAT: str = "csv" # How generations are exported. Options: "csv" (one genX.csv each), "archive" (one archive.bin)
 EXPORT_STL: bool = True
 DATA_PATH: bool = None # Expects path-like string, defaults to /runs when None
 RUN_NAME: str = None # Defaults to current timestamp when None
 EXPORT_EXTENSION: str = ".stl" # .stl or .obj
+EXPORT_QUEUE: int = 0 # Exports that may wait for a background writer thread. 0 exports on the main thread
+EXPORT_BACKPRESSURE: str = "block" # When the export queue is full. Options: "block" (wait), "drop" (skip meshes and printing)
+KEEP_MESHES: int = 1 # Number of best meshes kept in memory for export, 0 regrows the best mesh instead
+CHECKPOINT_INTERVAL: int = None # Generations between checkpoints, the last is always checkpointed. 0 disables. None: 5, or 0 in steady-state mode
+RESUME: bool = False # Continue the run named RUN_NAME (or batch named BATCH_NAME) from its checkpoints
+CATALOG: str = None # Path of the SQLite run catalog, see evolution/catalog.py. Defaults to /runs/catalog.sqlite for every run when None
+REGISTER_RUNS: bool = True # Whether finished runs add themselves to the catalog
 
 # Run batch settings
 RUNS: int = 1
+BATCH_WORKERS: int = 1 # Number of runs in a batch to perform at once on a process pool
 BATCH_PATH: str = None # Expects path-like string, defaults to /batches when None
 BATCH_NAME: str = None # Defaults to current timestamp when None
+SWEEP: str = None # Path of a JSON hyperparameter sweep spec, see evolution/sweep.py. Runs the sweep as a batch instead
@@ -0,0 +1,287 @@
+"""
+Binary archive of every generation of a run, as an alternative to one genX.csv file per generation.
+
+archive.bin starts with a HEADER_SIZE byte JSON header holding the alphabet, operations and record
+layout, followed by one fixed-size record per individual: its generation (the evaluation count in the
+steady-state mode), its id within the generation, its fitness (NaN if it has none, and read back as an int
+if the header says the fitness function is integer-valued), and its rules packed into integers the way
+evolution/genome_matrix.py packs them. archive.idx holds one (generation, start, count) row per generation,
+so any individual is found with one dict lookup and one offset, and whole columns are read through a memory
+map without parsing text.
+
+Grammars decoded from the archive have their rules in alphabet order. To get .csv files back, run
+    python -m evolution.archive --data_path runs/RUN_NAME
+which writes the genX.csv files the run would have written.
+
+October 19th, 2026
+"""
+
+import os
+import json
+import argparse
+import numpy as np
+from model.grammar import Grammar
+from evolution.genome_matrix import GenomeMatrix, GENE_DTYPE
+from evolution.writers import write_csv
+
+ARCHIVE_FILE = "archive.bin"
+INDEX_FILE = "archive.idx"
+HEADER_SIZE = 4096
+MAGIC = "tetra-archive"
+ARCHIVE_VERSION = 1
+INDEX_DTYPE = np.dtype([("generation", np.int64), ("start", np.int64), ("count", np.int64)])
+
+
+def record_dtype(num_rules: int, num_fields: int) -> np.dtype:
+    """
+    Parameters:
+        num_rules (int): Number of rules per genome, the size of the alphabet.
+        num_fields (int): Number of integers per rule, see GenomeMatrix.num_fields().
+
+    Returns:
+        np.dtype: Structured dtype of one archive record.
+    """
+
+    return np.dtype([("generation", np.int32), ("id", np.int32), ("fitness", np.float64),
+                     ("genes", GENE_DTYPE, (num_rules, num_fields))])
+
+
+def read_header(file_path: str) -> dict:
+    """
+    Parameters:
+        file_path (str): Path of an archive.bin file.
+
+    Returns:
+        dict: The archive's header.
+    """
+
+    with open(file_path, 'rb') as f:
+        header = json.loads(f.read(HEADER_SIZE).rstrip(b"\0"))
+
+    if header.get("magic") != MAGIC or header.get("version") != ARCHIVE_VERSION:
+        raise ValueError("{} is not a version {} generation archive.".format(file_path, ARCHIVE_VERSION))
+
+    return header
+
+
+class ArchiveWriter:
+    """
+    Appends generations to a run's archive.
+
+    Attributes:
+        alphabet (list[str]): Possible labels for faces.
+        operations (dict[str, int]): Operations with the number of rhs labels each takes.
+        file_path (str): Path of archive.bin.
+        index_path (str): Path of archive.idx.
+        dtype (np.dtype): Dtype of one record.
+    """
+
+    def __init__(self, data_path: str, alphabet: list[str], operations: dict[str, int], integer_fitness: bool = False):
+        """
+        Opens the archive in a run directory, creating it if it doesn't exist.
+
+        Parameters:
+            data_path (str): Directory of the run.
+            alphabet (list[str]): Possible labels for faces.
+            operations (dict[str, int]): Operations with the number of rhs labels each takes.
+            integer_fitness (bool): Whether the fitness function is integer-valued, like num_faces, so
+                                    fitnesses are read back as ints. Only recorded for a new archive.
+        """
+
+        self.alphabet = alphabet
+        self.operations = operations
+        self.file_path = os.path.join(data_path, ARCHIVE_FILE)
+        self.index_path = os.path.join(data_path, INDEX_FILE)
+        self.dtype = record_dtype(len(alphabet), GenomeMatrix.num_fields(operations))
+
+        if os.path.exists(self.file_path):
+            header = read_header(self.file_path)
+            if header["alphabet"] != list(alphabet) or header["operations"] != dict(operations):
+                raise ValueError("Archive {} was written with a different alphabet or operations.".format(self.file_path))
+            return
+
+        header = json.dumps({"magic": MAGIC, "version": ARCHIVE_VERSION, "alphabet": list(alphabet),
+                             "operations": dict(operations), "record_size": self.dtype.itemsize,
+                             "integer_fitness": integer_fitness}).encode()
+        if len(header) > HEADER_SIZE:
+            raise ValueError("Alphabet is too large for the archive header.")
+
+        with open(self.file_path, 'wb') as f:
+            f.write(header.ljust(HEADER_SIZE, b"\0"))
+        open(self.index_path, 'wb').close()
+
+    def append(self, generation: int, population: list):
+        """
+        Appends one generation. Records are written before the index row that points to them, so a crash
+        can't leave the index pointing past the end of the data.
+
+        Parameters:
+            generation (int): Generation of the population, or evaluation count in the steady-state mode.
+            population (list[Grammar, float]): The (genome, fitness) pairs, in id order.
+        """
+
+        records = np.zeros(len(population), dtype=self.dtype)
+        records["generation"] = generation
+        records["id"] = np.arange(len(population))
+        records["fitness"] = [np.nan if fitness is None else fitness for genome, fitness in population]
+        records["genes"] = GenomeMatrix.from_grammars([genome for genome, fitness in population], self.alphabet,
+                                                      self.operations).genes
+
+        with open(self.file_path, 'ab') as f:
+            start = (f.tell() - HEADER_SIZE) // self.dtype.itemsize
+            f.write(records.tobytes())
+
+        with open(self.index_path, 'ab') as f:
+            f.write(np.array([(generation, start, len(records))], dtype=INDEX_DTYPE).tobytes())
+
+    def truncate(self, generation: int):
+        """
+        Drops every generation from generation on, so a resumed run doesn't archive them twice.
+
+        Parameters:
+            generation (int): First generation to drop.
+        """
+
+        index = np.fromfile(self.index_path, dtype=INDEX_DTYPE)
+        keep = index[index["generation"] < generation]
+
+        if len(keep) == len(index):
+            return
+
+        end = int(keep["start"][-1] + keep["count"][-1]) if len(keep) else 0
+
+        with open(self.file_path, 'r+b') as f:
+            f.truncate(HEADER_SIZE + end * self.dtype.itemsize)
+
+        keep.tofile(self.index_path)
+
+
+class ArchiveReader:
+    """
+    Random and bulk access to a run's archive.
+
+    Attributes:
+        alphabet (list[str]): Possible labels for faces.
+        operations (dict[str, int]): Operations with the number of rhs labels each takes.
+        integer_fitness (bool): Whether fitnesses are ints, as the run wrote them to genX.csv files.
+        records (np.memmap): Every record of the archive, memory-mapped.
+        index (dict[int, tuple[int, int]]): Generation -> (first record, number of records).
+    """
+
+    def __init__(self, data_path: str):
+        """
+        Opens the archive in a run directory.
+
+        Parameters:
+            data_path (str): Directory of the run, or the path of its archive.bin.
+        """
+
+        file_path = data_path if data_path.endswith(ARCHIVE_FILE) else os.path.join(data_path, ARCHIVE_FILE)
+        index_path = os.path.join(os.path.dirname(file_path), INDEX_FILE)
+
+        header = read_header(file_path)
+        self.alphabet = header["alphabet"]
+        self.operations = header["operations"]
+        self.integer_fitness = header.get("integer_fitness", False)
+        dtype = record_dtype(len(self.alphabet), GenomeMatrix.num_fields(self.operations))
+
+        num_records = (os.path.getsize(file_path) - HEADER_SIZE) // dtype.itemsize
+        self.records = np.memmap(file_path, dtype=dtype, mode='r', offset=HEADER_SIZE, shape=(num_records,)) \
+                       if num_records > 0 else np.zeros(0, dtype=dtype)
+        self.index = {int(generation): (int(start), int(count))
+                      for generation, start, count in np.fromfile(index_path, dtype=INDEX_DTYPE)}
+
+    def generations(self) -> list[int]:
+        """
+        Returns:
+            list[int]: The archived generations, in order.
+        """
+
+        return list(self.index)
+
+    def generation(self, generation: int) -> np.ndarray:
+        """
+        Parameters:
+            generation (int): An archived generation.
+
+        Returns:
+            np.ndarray: The generation's records, a view into the memory map.
+        """
+
+        if generation not in self.index:
+            raise ValueError("Generation {} is not in the archive.".format(generation))
+
+        start, count = self.index[generation]
+
+        return self.records[start:start + count]
+
+    def get(self, generation: int, id: int) -> tuple[Grammar, float]:
+        """
+        Parameters:
+            generation (int): An archived generation.
+            id (int): Id of the individual within the generation.
+
+        Returns:
+            tuple[Grammar, float]: The individual's genome and fitness, None if it had none.
+        """
+
+        records = self.generation(generation)
+
+        if not 0 <= id < len(records):
+            raise ValueError("Generation {} has no individual {}.".format(generation, id))
+
+        return self.decode(records[id:id + 1])[0]
+
+    def decode(self, records: np.ndarray) -> list:
+        """
+        Parameters:
+            records (np.ndarray): Archive records.
+
+        Returns:
+            list[Grammar, float]: The records' (genome, fitness) pairs.
+        """
+
+        genomes = GenomeMatrix(self.alphabet, self.operations, np.asarray(records["genes"])).to_grammars()
+        cast = int if self.integer_fitness else float
+        fitnesses = [None if np.isnan(fitness) else cast(fitness) for fitness in records["fitness"].tolist()]
+
+        return [[genome, fitness] for genome, fitness in zip(genomes, fitnesses)]
+
+    def export_csv(self, generation: int, file_path: str):
+        """
+        Writes one generation in the genX.csv format.
+
+        Parameters:
+            generation (int): An archived generation.
+            file_path (str): Path of the .csv file.
+        """
+
+        columns = ["id", "fitness", "num_rules"]
+        columns += [item + str(i) for i in range(len(self.alphabet)) for item in ['lhs', 'operation', 'rhs']]
+        rows = []
+
+        for id, (genome, fitness) in enumerate(self.decode(self.generation(generation))):
+            row = {"id": id, "fitness": fitness, "num_rules": len(self.alphabet)}
+            row.update(genome.to_dict())
+            rows.append(row)
+
+        write_csv(file_path, columns, rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Export a generation archive to .csv files')
+    parser.add_argument('--data_path',
+                        type=str,
+                        help='directory of the run with the archive',
+                        required=True)
+    parser.add_argument('--prefix',
+                        type=str,
+                        help='file name prefix, "gen" or "eval" for steady-state runs',
+                        default="gen")
+    args = parser.parse_args()
+
+    reader = ArchiveReader(args.data_path)
+    for archived in reader.generations():
+        reader.export_csv(archived, os.path.join(args.data_path, "{}{}.csv".format(args.prefix, archived)))
+
+    print("Exported {} generations from {}".format(len(reader.generations()), args.data_path))
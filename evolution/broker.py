@@ -0,0 +1,480 @@
+"""
+Spread genome evaluation over several machines through a broker.
+
+The broker is a multiprocessing manager serving a TaskBroker over TCP. The evolution run submits genomes
+in their to_dict() form, workers on any machine pull batches of them, grow and score them, and push the
+fitnesses back. Workers send heartbeats while they work, and the tasks of a worker that stops sending
+them are put back in the queue for another worker.
+
+Start workers with:
+    python -m evolution.broker --address HOST:PORT --authkey KEY
+
+Workers send and receive pickles, so anyone with the authkey can run code on the broker and its workers.
+A broker on a non-loopback address needs an explicit authkey, and a broker on a loopback address without
+one gets a random key, printed for its workers.
+
+October 19th, 2026
+"""
+
+import os
+import time
+import secrets
+import ipaddress
+import uuid
+import socket
+import argparse
+import threading
+import multiprocessing as mp
+from collections import deque
+from multiprocessing.managers import BaseManager
+from model.grammar import Grammar
+from evolution.evaluator import evaluate_rules, warm_worker
+
+HEARTBEAT_INTERVAL = 5 # Seconds between worker heartbeats
+HEARTBEAT_TIMEOUT = 30 # Seconds without a heartbeat before a worker's tasks are requeued
+POLL_INTERVAL = 0.05 # Seconds between checks for new tasks or finished results
+BATCH_SIZE = 4 # Tasks a worker pulls at once
+WORKER_TIMEOUT = 300 # Seconds evaluate() waits without a live worker before giving up
+
+
+class TaskBroker:
+    """
+    Queue of evaluation tasks shared between one submitting run and any number of workers. Lives in the
+    broker's server process, and every method is called through a proxy.
+    """
+
+    def __init__(self):
+        """
+        Returns an empty TaskBroker.
+        """
+
+        self.lock = threading.Lock()
+        self.pending = deque() # (task_id, payload) waiting for a worker
+        self.leases = {} # task_id -> (worker_id, payload)
+        self.results = {} # task_id -> (result, error)
+        self.heartbeats = {} # worker_id -> time of last heartbeat
+        self.closed = False
+
+    def submit(self, tasks: list):
+        """
+        Add tasks to the queue.
+
+        Parameters:
+            tasks (list[tuple[str, dict]]): (task_id, payload) pairs. The payload holds the arguments of
+                                            evolution.evaluator.evaluate_rules().
+        """
+
+        with self.lock:
+            self.pending.extend(tasks)
+
+    def pull(self, worker_id: str, max_tasks: int) -> list:
+        """
+        Lease tasks to a worker. Also counts as a heartbeat.
+
+        Parameters:
+            worker_id (str): Id of the worker.
+            max_tasks (int): Maximum number of tasks to lease.
+
+        Returns:
+            list[tuple[str, dict]]: The leased (task_id, payload) pairs. Empty if there is no work.
+        """
+
+        with self.lock:
+            self.heartbeats[worker_id] = time.time()
+            self.requeue_lost()
+
+            tasks = []
+            while self.pending and len(tasks) < max_tasks:
+                task_id, payload = self.pending.popleft()
+                self.leases[task_id] = (worker_id, payload)
+                tasks.append((task_id, payload))
+
+            return tasks
+
+    def push(self, worker_id: str, results: list):
+        """
+        Hand back results of leased tasks. Results of tasks that already have one are ignored, which happens
+        when a slow worker's tasks were requeued and finished elsewhere.
+
+        Parameters:
+            worker_id (str): Id of the worker.
+            results (list[tuple[str, float, str]]): (task_id, fitness, error) triples. error is None on success.
+        """
+
+        with self.lock:
+            self.heartbeats[worker_id] = time.time()
+            pending_ids = {task_id for task_id, _ in self.pending}
+
+            for task_id, result, error in results:
+                if task_id in self.leases:
+                    del self.leases[task_id]
+                elif task_id in pending_ids: # Requeued, but the original worker got there first
+                    self.pending = deque(task for task in self.pending if task[0] != task_id)
+                else:
+                    continue
+
+                self.results[task_id] = (result, error)
+
+    def heartbeat(self, worker_id: str):
+        """
+        Tell the broker a worker is still alive.
+
+        Parameters:
+            worker_id (str): Id of the worker.
+        """
+
+        with self.lock:
+            self.heartbeats[worker_id] = time.time()
+
+    def collect(self, task_ids: list) -> dict:
+        """
+        Take the finished results among the given tasks.
+
+        Parameters:
+            task_ids (list[str]): Ids of the tasks to collect.
+
+        Returns:
+            dict: Maps task ids to (fitness, error) pairs, for finished tasks only.
+        """
+
+        with self.lock:
+            self.requeue_lost()
+
+            finished = {}
+            for task_id in task_ids:
+                if task_id in self.results:
+                    finished[task_id] = self.results.pop(task_id)
+
+            return finished
+
+    def requeue_lost(self):
+        """
+        Put the tasks of workers that stopped sending heartbeats back at the front of the queue.
+        Expects the lock to be held.
+        """
+
+        now = time.time()
+        lost_workers = {worker_id for worker_id, last in self.heartbeats.items() if now - last > HEARTBEAT_TIMEOUT}
+
+        if not lost_workers:
+            return
+
+        for task_id, (worker_id, payload) in list(self.leases.items()):
+            if worker_id in lost_workers:
+                del self.leases[task_id]
+                self.pending.appendleft((task_id, payload))
+
+        for worker_id in lost_workers:
+            del self.heartbeats[worker_id]
+
+    def live_workers(self) -> int:
+        """
+        Returns:
+            int: Number of workers that sent a heartbeat within HEARTBEAT_TIMEOUT.
+        """
+
+        with self.lock:
+            self.requeue_lost()
+            return len(self.heartbeats)
+
+    def close(self):
+        """
+        Tell the workers there will be no more tasks.
+        """
+
+        with self.lock:
+            self.closed = True
+
+    def is_closed(self) -> bool:
+        """
+        Returns:
+            bool: Whether the broker was closed.
+        """
+
+        return self.closed
+
+
+_broker = None
+
+
+def get_broker() -> TaskBroker:
+    """
+    Get the TaskBroker of this server process, creating it on first use.
+
+    Returns:
+        TaskBroker: The broker.
+    """
+
+    global _broker  # pylint: disable=global-statement
+
+    if _broker is None:
+        _broker = TaskBroker()
+
+    return _broker
+
+
+class BrokerManager(BaseManager):
+    """
+    Manager that serves the TaskBroker over TCP.
+    """
+
+
+BrokerManager.register("broker", callable=get_broker)
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    """
+    Parse a "host:port" string.
+
+    Parameters:
+        address (str): The address.
+
+    Returns:
+        tuple[str, int]: The host and port.
+    """
+
+    host, port = address.rsplit(":", 1)
+    return host, int(port)
+
+
+def is_loopback(host: str) -> bool:
+    """
+    Parameters:
+        host (str): Host name or IP address.
+
+    Returns:
+        bool: Whether the host can only be reached from this machine.
+    """
+
+    if host == "localhost":
+        return True
+
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def resolve_authkey(address: str, authkey: bytes = None) -> bytes:
+    """
+    Picks the key of a broker about to be started.
+
+    Parameters:
+        address (str): "host:port" the broker will serve on.
+        authkey (bytes): Key given by the user, or None.
+
+    Returns:
+        bytes: The given key, or a random one for a loopback address, which is printed for the workers.
+    """
+
+    if authkey is not None:
+        return authkey
+
+    host, port = parse_address(address)
+    if not is_loopback(host):
+        raise ValueError("A broker on {} can be reached from other machines, so it needs an explicit "
+                         "--broker_authkey.".format(address))
+
+    authkey = secrets.token_hex(16)
+    print("Broker authkey: {}".format(authkey))
+
+    return authkey.encode()
+
+
+def connect(address: tuple[str, int], authkey: bytes):
+    """
+    Connect to a running broker.
+
+    Parameters:
+        address (tuple[str, int]): Host and port of the broker.
+        authkey (bytes): Key shared by the broker and its clients.
+
+    Returns:
+        TaskBroker: A proxy for the broker.
+    """
+
+    manager = BrokerManager(address=address, authkey=authkey)
+    manager.connect()
+
+    return manager.broker()
+
+
+def run_worker(address: tuple[str, int], authkey: bytes, batch_size: int = BATCH_SIZE):
+    """
+    Pull and evaluate tasks until the broker closes or goes away.
+
+    Parameters:
+        address (tuple[str, int]): Host and port of the broker.
+        authkey (bytes): Key shared by the broker and its clients.
+        batch_size (int): Number of tasks to pull at once.
+    """
+
+    warm_worker()
+
+    worker_id = "{}-{}-{}".format(socket.gethostname(), os.getpid(), uuid.uuid4().hex[:8])
+    broker = connect(address, authkey)
+    stop = threading.Event()
+
+    def send_heartbeats():
+        heartbeat_broker = connect(address, authkey) # Proxies shouldn't be shared between threads
+        while not stop.wait(HEARTBEAT_INTERVAL):
+            try:
+                heartbeat_broker.heartbeat(worker_id)
+            except (EOFError, OSError):
+                return
+
+    heartbeat_thread = threading.Thread(target=send_heartbeats, daemon=True)
+    heartbeat_thread.start()
+
+    try:
+        while not broker.is_closed():
+            tasks = broker.pull(worker_id, batch_size)
+
+            if not tasks:
+                time.sleep(POLL_INTERVAL)
+                continue
+
+            results = []
+            for task_id, payload in tasks:
+                try:
+                    fitness, _ = evaluate_rules(**payload)
+                    results.append((task_id, fitness, None))
+                except Exception as e:  # pylint: disable=broad-except
+                    results.append((task_id, None, repr(e)))
+
+            broker.push(worker_id, results)
+    except (EOFError, OSError):
+        pass # The broker went away, so the run is over
+    finally:
+        stop.set()
+
+
+class BrokerEvaluator:
+    """
+    Evaluates genomes on broker workers. Has the same evaluate() interface as ParallelEvaluator, but never
+    returns meshes since workers may be on other machines.
+    """
+
+    def __init__(self, address: str, authkey: bytes, iters_per_run: int, check_collision: bool,
+                 fitness_function: str, local_workers: int = 0, worker_timeout: float = WORKER_TIMEOUT):
+        """
+        Starts a broker on the given address and returns a BrokerEvaluator using it.
+
+        Parameters:
+            address (str): "host:port" to serve the broker on. Port 0 picks a free port.
+            authkey (bytes): Key workers need to connect. None generates one if address is a loopback
+                             address, see resolve_authkey().
+            iters_per_run (int): Number of grammar rules to apply per individual.
+            check_collision (bool): Whether the mesh should block grow commands that overlap with the mesh.
+            fitness_function (str): What fitness function to use.
+            local_workers (int): Number of workers to start on this machine.
+            worker_timeout (float): Seconds evaluate() waits with no live worker and no new results before
+                                    raising, so a run without workers fails instead of hanging.
+        """
+
+        authkey = resolve_authkey(address, authkey)
+
+        self.iters_per_run = iters_per_run
+        self.check_collision = check_collision
+        self.fitness_function = fitness_function
+        self.authkey = authkey
+        self.worker_timeout = worker_timeout
+
+        self.manager = BrokerManager(address=parse_address(address), authkey=authkey)
+        self.manager.start()
+        self.address = self.manager.address
+        self.broker = self.manager.broker()
+
+        print("Broker listening on {}:{}".format(*self.address))
+
+        self.local_workers = []
+        for i in range(local_workers):
+            process = mp.Process(target=run_worker, args=(self.address, authkey), daemon=True)
+            process.start()
+            self.local_workers.append(process)
+
+    def evaluate(self, genomes: list[Grammar], share_meshes: bool = False,
+                 iters_per_run: int = None) -> list[tuple[float, None]]:
+        """
+        Evaluate genomes on the broker's workers.
+
+        Parameters:
+            genomes (list[Grammar]): The genomes to evaluate.
+            share_meshes (bool): Ignored, meshes can't be shared across machines.
+            iters_per_run (int): Number of grammar rules to apply. Defaults to the evaluator's.
+
+        Returns:
+            list[tuple[float, None]]: (fitness, None) for each genome, in order.
+        """
+
+        prefix = uuid.uuid4().hex
+        task_ids = [prefix + "-" + str(i) for i in range(len(genomes))]
+        iters_per_run = self.iters_per_run if iters_per_run is None else iters_per_run
+        payload = {"iters_per_run": iters_per_run, "check_collision": self.check_collision,
+                   "fitness_function": self.fitness_function}
+
+        self.broker.submit([(task_id, dict(payload, rules=genome.to_dict()))
+                            for task_id, genome in zip(task_ids, genomes)])
+
+        results = {}
+        last_alive = time.time()
+        while len(results) < len(task_ids):
+            finished = self.broker.collect([task_id for task_id in task_ids if task_id not in results])
+            results.update(finished)
+
+            if finished or self.broker.live_workers() > 0:
+                last_alive = time.time()
+            elif time.time() - last_alive > self.worker_timeout:
+                raise RuntimeError("No live broker workers for {} seconds, {} of {} tasks unfinished.".format(
+                                   self.worker_timeout, len(task_ids) - len(results), len(task_ids)))
+
+            time.sleep(POLL_INTERVAL)
+
+        fitnesses = []
+        for task_id in task_ids:
+            fitness, error = results[task_id]
+            if error is not None:
+                raise RuntimeError("Broker worker failed to evaluate task {}: {}".format(task_id, error))
+            fitnesses.append((fitness, None))
+
+        return fitnesses
+
+    def shutdown(self):
+        """
+        Closes the broker, which stops the workers, then stops the broker's server.
+        """
+
+        self.broker.close()
+
+        for process in self.local_workers:
+            process.join(timeout=HEARTBEAT_INTERVAL)
+
+        self.manager.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Evaluate genomes for a broker')
+    parser.add_argument('--address',
+                        type=str,
+                        help='"host:port" of the broker',
+                        required=True)
+    parser.add_argument('--authkey',
+                        type=str,
+                        help='key shared by the broker and its workers',
+                        required=True)
+    parser.add_argument('--processes',
+                        type=int,
+                        help='number of worker processes to start on this machine',
+                        default=1)
+    parser.add_argument('--batch_size',
+                        type=int,
+                        help='number of tasks to pull at once',
+                        default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    workers = [mp.Process(target=run_worker, args=(parse_address(args.address), args.authkey.encode(),
+                                                   args.batch_size)) for i in range(args.processes)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
@@ -0,0 +1,301 @@
+"""
+A SQLite catalog of finished runs, so runs with given settings can be found without opening every
+info.json and run.csv under the data root.
+
+Every run registers itself when it finishes, with its info.json settings and a summary: final and best
+fitness, generations run, evaluations, stop reason and wall time. Single, batch, sweep and island runs all
+register in one catalog, runs/catalog.sqlite unless another is given. Settings are kept as JSON and queried
+with SQLite's json_extract, so new settings need no schema change. Query from Python:
+    find_runs(fitness_function="hull_volume", mutation_rate=0.2)
+or from the command line:
+    python -m evolution.catalog query fitness_function=hull_volume mutation_rate=0.2 "best_fitness<1.5"
+Runs from before the catalog existed can be added with
+    python -m evolution.catalog scan runs batches
+
+October 19th, 2026
+"""
+
+import os
+import re
+import json
+import sqlite3
+import argparse
+import datetime as dt
+from pathlib import Path
+
+CATALOG_FILE = "catalog.sqlite"
+DEFAULT_CATALOG = os.path.join(Path(__file__).resolve().parent.parent, "runs", CATALOG_FILE)
+SUMMARY_COLUMNS = ["best_fitness", "best_ever_fitness", "generations_run", "evaluations", "stop_reason", "wall_time"]
+OPERATORS = ["<=", ">=", "!=", "=", "<", ">"]
+TIMEOUT = 30 # Seconds to wait for another process registering a run at the same time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    path TEXT PRIMARY KEY,
+    run_name TEXT,
+    registered TEXT,
+    best_fitness REAL,
+    best_ever_fitness REAL,
+    generations_run INTEGER,
+    evaluations INTEGER,
+    stop_reason TEXT,
+    wall_time REAL,
+    info TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_fitness_function ON runs (json_extract(info, '$.fitness_function'));
+CREATE INDEX IF NOT EXISTS runs_mode ON runs (json_extract(info, '$.mode'));
+"""
+
+
+def resolve_catalog(catalog: str = None) -> str:
+    """
+    Parameters:
+        catalog (str): Path of a catalog, a directory holding one, or None for the default.
+
+    Returns:
+        str: The path of the catalog, runs/catalog.sqlite in the repository by default.
+    """
+
+    if catalog is None or catalog == "None":
+        return DEFAULT_CATALOG
+
+    if os.path.isdir(catalog):
+        return os.path.join(catalog, CATALOG_FILE)
+
+    return catalog
+
+
+def connect(catalog: str = None) -> sqlite3.Connection:
+    """
+    Opens a catalog, creating it if it doesn't exist.
+
+    Parameters:
+        catalog (str): Path of the catalog, or None for the default.
+
+    Returns:
+        sqlite3.Connection: Connection to the catalog, with rows as sqlite3.Row.
+    """
+
+    path = resolve_catalog(catalog)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+    connection = sqlite3.connect(path, timeout=TIMEOUT)
+    connection.row_factory = sqlite3.Row
+    connection.executescript(SCHEMA)
+
+    return connection
+
+
+def register_run(data_path: str, info: dict, summary: dict, catalog: str = None):
+    """
+    Adds a run to the catalog, replacing its entry if it was registered before.
+
+    Parameters:
+        data_path (str): Directory of the run.
+        info (dict): The run's info.json.
+        summary (dict): The run's final summary, with the SUMMARY_COLUMNS keys.
+        catalog (str): Path of the catalog, or None for the default.
+    """
+
+    row = {column: summary.get(column) for column in SUMMARY_COLUMNS}
+    row.update(path=str(Path(data_path).resolve()), run_name=Path(data_path).name,
+               registered=dt.datetime.now().isoformat(timespec='seconds'), info=json.dumps(info))
+
+    with connect(catalog) as connection:
+        connection.execute("INSERT OR REPLACE INTO runs ({}) VALUES ({})".format(
+                           ", ".join(row), ", ".join("?" for column in row)), list(row.values()))
+    connection.close()
+
+
+def summarize_files(data_path: str) -> tuple[dict, dict]:
+    """
+    Reads a finished run's info.json and summarizes its run.csv, for runs that didn't register themselves.
+
+    Parameters:
+        data_path (str): Directory of the run.
+
+    Returns:
+        tuple[dict, dict]: The run's info.json and summary.
+    """
+
+    with open(os.path.join(data_path, "info.json")) as f:
+        info = json.load(f)
+
+    best_fitness = []
+    run_csv = os.path.join(data_path, "run.csv")
+    if os.path.exists(run_csv):
+        import csv  # pylint: disable=import-outside-toplevel
+        with open(run_csv, newline='') as f:
+            best_fitness = [float(row["fitness"]) for row in csv.DictReader(f) if row["fitness"] != ""]
+
+    best_ever = None
+    if best_fitness:
+        best_ever = max(best_fitness) if info.get("sort_reverse") else min(best_fitness)
+
+    summary = {
+        "best_fitness": best_fitness[-1] if best_fitness else None,
+        "best_ever_fitness": best_ever,
+        "generations_run": info.get("generations_run", len(best_fitness)),
+        "evaluations": info.get("evaluations"),
+        "stop_reason": info.get("stop_reason"),
+        "wall_time": info.get("wall_time")
+    }
+
+    return info, summary
+
+
+def scan(roots: list[str], catalog: str = None) -> int:
+    """
+    Registers every run under some directories, found by their info.json files.
+
+    Parameters:
+        roots (list[str]): Directories to search.
+        catalog (str): Path of the catalog, or None for the default.
+
+    Returns:
+        int: Number of runs registered.
+    """
+
+    count = 0
+
+    for root in roots:
+        for info_path in sorted(Path(root).rglob("info.json")):
+            info, summary = summarize_files(info_path.parent)
+            register_run(info_path.parent, info, summary, catalog)
+            count += 1
+
+    return count
+
+
+def parse_filter(text: str) -> tuple[str, str, object]:
+    """
+    Parses a command line filter like "mutation_rate=0.2" or "best_fitness<1.5".
+
+    Parameters:
+        text (str): The filter.
+
+    Returns:
+        tuple[str, str, object]: The key, operator, and value, parsed as JSON if possible.
+    """
+
+    match = re.match(r"^([A-Za-z_][A-Za-z0-9_]*)({})(.*)$".format("|".join(re.escape(op) for op in OPERATORS)), text)
+    if match is None:
+        raise ValueError("Unexpected filter {}. Expected KEY=VALUE, or another of {}".format(text, OPERATORS))
+
+    key, operator, value = match.groups()
+
+    try:
+        value = json.loads(value)
+    except json.JSONDecodeError:
+        pass # Plain strings like hull_volume
+
+    return key, operator, value
+
+
+def find_runs(catalog: str = None, filters: list[tuple[str, str, object]] = (), order_by: str = None,
+              descending: bool = False, limit: int = None, **settings) -> list[dict]:
+    """
+    Finds runs by their settings and summary.
+
+    Parameters:
+        catalog (str): Path of the catalog, or None for the default.
+        filters (list[tuple[str, str, object]]): (key, operator, value) conditions, see parse_filter().
+        order_by (str): Key to sort by. Runs are in the order they were registered when None.
+        descending (bool): Whether to sort in descending order, e.g. best first when fitness is maximized.
+        limit (int): Maximum number of runs to return.
+        **settings: Keys that must equal the given values, like fitness_function="hull_volume".
+
+    Returns:
+        list[dict]: The matching runs, each with its path, run_name, summary columns and info.json settings.
+    """
+
+    conditions = list(filters) + [(key, "=", value) for key, value in settings.items()]
+    where = []
+    parameters = []
+
+    for key, operator, value in conditions:
+        if operator not in OPERATORS:
+            raise ValueError("Unexpected operator {}. Try one of {}".format(operator, OPERATORS))
+        where.append("{} {} ?".format(column_expression(key), operator))
+        parameters.append(json.dumps(value) if isinstance(value, (list, dict)) else value)
+
+    query = "SELECT * FROM runs"
+    if where:
+        query += " WHERE " + " AND ".join(where)
+    if order_by is not None:
+        query += " ORDER BY {} {}".format(column_expression(order_by), "DESC" if descending else "ASC")
+    if limit is not None:
+        query += " LIMIT {}".format(int(limit))
+
+    connection = connect(catalog)
+    rows = connection.execute(query, parameters).fetchall()
+    connection.close()
+
+    runs = []
+    for row in rows:
+        run = dict(json.loads(row["info"]))
+        run.update({key: row[key] for key in row.keys() if key != "info"})
+        runs.append(run)
+
+    return runs
+
+
+def column_expression(key: str) -> str:
+    """
+    Parameters:
+        key (str): A summary column or an info.json setting.
+
+    Returns:
+        str: SQL for the key's value.
+    """
+
+    if not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", key):
+        raise ValueError("Unexpected key {}.".format(key))
+
+    if key in SUMMARY_COLUMNS or key in ["path", "run_name", "registered"]:
+        return key
+
+    return "json_extract(info, '$.{}')".format(key)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Query or fill the run catalog')
+    parser.add_argument('command',
+                        type=str,
+                        choices=["query", "scan"],
+                        help='"query" to find runs, "scan" to register every run under some directories')
+    parser.add_argument('arguments',
+                        type=str,
+                        nargs='*',
+                        help='filters like fitness_function=hull_volume or "best_fitness<1.5" to query, directories to scan')
+    parser.add_argument('--catalog',
+                        type=str,
+                        help='path of the catalog or of a directory holding one, defaults to runs/catalog.sqlite',
+                        default=None)
+    parser.add_argument('--order_by',
+                        type=str,
+                        help='key to sort matching runs by',
+                        default=None)
+    parser.add_argument('--descending',
+                        action='store_true',
+                        help='sort in descending order')
+    parser.add_argument('--limit',
+                        type=int,
+                        help='maximum number of runs to list',
+                        default=None)
+    parser.add_argument('--columns',
+                        type=str,
+                        nargs='+',
+                        help='columns to print for each matching run',
+                        default=["run_name", "fitness_function", "best_fitness", "generations_run", "wall_time", "path"])
+    args = parser.parse_args()
+
+    if args.command == "scan":
+        print("Registered {} runs".format(scan(args.arguments, args.catalog)))
+    else:
+        matches = find_runs(args.catalog, [parse_filter(text) for text in args.arguments], args.order_by,
+                            args.descending, args.limit)
+        print("\t".join(args.columns))
+        for match in matches:
+            print("\t".join(str(match.get(column)) for column in args.columns))
+        print("{} runs".format(len(matches)))
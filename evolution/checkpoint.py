@@ -0,0 +1,88 @@
+"""
+Checkpoints of an evolution run, so a preempted run can continue exactly where it left off.
+
+A checkpoint holds everything the next generation depends on: the population and its fitnesses, the
+generation counter, the best-of-generation histories, and the state of the random and NumPy generators.
+It is pickled to checkpoint.pkl in the run directory, through a temporary file that replaces the old
+checkpoint in one step, so a run killed mid-write still has its previous checkpoint.
+
+October 19th, 2026
+"""
+
+import os
+import pickle
+import tempfile
+
+CHECKPOINT_FILE = "checkpoint.pkl"
+CHECKPOINT_VERSION = 1
+
+
+def checkpoint_path(data_path: str) -> str:
+    """
+    Parameters:
+        data_path (str): Directory of the run.
+
+    Returns:
+        str: Path of the run's checkpoint.
+    """
+
+    return os.path.join(data_path, CHECKPOINT_FILE)
+
+
+def save_checkpoint(data_path: str, state: dict):
+    """
+    Atomically write a checkpoint.
+
+    Parameters:
+        data_path (str): Directory of the run.
+        state (dict): The run's state, see EvolutionRun.checkpoint_state().
+    """
+
+    state = dict(state, version=CHECKPOINT_VERSION)
+
+    with tempfile.NamedTemporaryFile(dir=data_path, prefix=".checkpoint", delete=False) as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(f.name, checkpoint_path(data_path))
+
+
+def load_checkpoint(data_path: str) -> dict:
+    """
+    Read a run's checkpoint.
+
+    Parameters:
+        data_path (str): Directory of the run.
+
+    Returns:
+        dict: The run's state, or None if it has no checkpoint.
+    """
+
+    path = checkpoint_path(data_path)
+
+    if not os.path.exists(path):
+        return None
+
+    with open(path, 'rb') as f:
+        state = pickle.load(f)
+
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError("Checkpoint {} has version {}, expected {}.".format(path, state.get("version"),
+                                                                             CHECKPOINT_VERSION))
+
+    return state
+
+
+def is_finished(data_path: str) -> bool:
+    """
+    Parameters:
+        data_path (str): Directory of the run.
+
+    Returns:
+        bool: Whether the run's checkpoint says it ran to completion.
+    """
+
+    state = load_checkpoint(data_path)
+
+    return state is not None and state["finished"]
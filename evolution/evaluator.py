@@ -0,0 +1,273 @@
+"""
+Evaluate genomes on a pool of worker processes.
+
+Genomes travel to the workers in their to_dict() form. Workers can hand grown meshes back through
+shared memory, see evolution/shared_mesh.py.
+
+Evaluation cost varies by orders of magnitude between grammars, so a generation can optionally be
+scheduled by predicted cost (see model/growth_cost.py): longest first, or in chunks of equal predicted
+cost, one per worker.
+
+October 19th, 2026
+"""
+
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from model.grammar import Grammar
+from model.tetrahedral_mesh import TetrahedralMesh
+from model.growth_cost import predict_growth
+from evolution.shared_mesh import SharedMeshHandle, share_mesh
+
+SCHEDULES = ["fifo", "longest_first", "chunked"]
+
+
+def warm_worker():
+    """
+    Imports the evolution code once when a worker starts so that tasks don't pay for it. scipy and trimesh
+    are left to load on first use, since most fitness functions never need them.
+    """
+
+    # pylint: disable=import-outside-toplevel,unused-import
+    import evolutionary_alg
+
+
+def evaluate_rules(rules: dict, iters_per_run: int, check_collision: bool, fitness_function: str,
+                   share: bool = False) -> tuple[float, SharedMeshHandle]:
+    """
+    Grow and score one genome. Runs in a worker process.
+
+    Parameters:
+        rules (dict): The genome in Grammar.to_dict() form.
+        iters_per_run (int): Number of grammar rules to apply.
+        check_collision (bool): Whether the mesh should block grow commands that overlap with the mesh.
+        fitness_function (str): What fitness function to use.
+        share (bool): Whether to return the grown mesh through shared memory.
+
+    Returns:
+        tuple[float, SharedMeshHandle]: The fitness and, if share is set, a handle to the grown mesh.
+    """
+
+    fitness, handle, _, _ = timed_evaluate_rules(rules, iters_per_run, check_collision, fitness_function, share)
+
+    return fitness, handle
+
+
+def timed_evaluate_rules(rules: dict, iters_per_run: int, check_collision: bool, fitness_function: str,
+                         share: bool = False) -> tuple[float, SharedMeshHandle, float, int]:
+    """
+    Grow and score one genome, and measure how long it took. Runs in a worker process.
+
+    Parameters:
+        rules (dict): The genome in Grammar.to_dict() form.
+        iters_per_run (int): Number of grammar rules to apply.
+        check_collision (bool): Whether the mesh should block grow commands that overlap with the mesh.
+        fitness_function (str): What fitness function to use.
+        share (bool): Whether to return the grown mesh through shared memory.
+
+    Returns:
+        tuple[float, SharedMeshHandle, float, int]: The fitness, a handle to the grown mesh if share is set,
+                                                    the seconds spent growing and scoring, and the number
+                                                    of faces grown.
+    """
+
+    from evolutionary_alg import compute_fitness  # pylint: disable=import-outside-toplevel
+
+    start = time.perf_counter()
+
+    grammar = Grammar()
+    grammar.add_from_dict(rules)
+
+    mesh = TetrahedralMesh(grammar, check_collision)
+
+    for i in range(iters_per_run):
+        mesh.apply_rule()
+
+    fitness = compute_fitness(mesh, fitness_function)
+    seconds = time.perf_counter() - start
+
+    return fitness, share_mesh(mesh) if share else None, seconds, mesh.get_num_faces()
+
+
+def timed_evaluate_rules_batch(rules_list: list[dict], iters_per_run: int, check_collision: bool,
+                               fitness_function: str, share: bool = False) -> list[tuple]:
+    """
+    Grow and score several genomes in one task. Runs in a worker process.
+
+    Parameters:
+        rules_list (list[dict]): The genomes in Grammar.to_dict() form.
+        iters_per_run (int): Number of grammar rules to apply.
+        check_collision (bool): Whether the mesh should block grow commands that overlap with the mesh.
+        fitness_function (str): What fitness function to use.
+        share (bool): Whether to return the grown meshes through shared memory.
+
+    Returns:
+        list[tuple]: The timed_evaluate_rules() result of each genome, in order.
+    """
+
+    return [timed_evaluate_rules(rules, iters_per_run, check_collision, fitness_function, share)
+            for rules in rules_list]
+
+
+def balance_chunks(costs: list[float], num_chunks: int) -> list[list[int]]:
+    """
+    Split items into chunks of about equal total cost, by giving the most expensive remaining item to the
+    cheapest chunk so far.
+
+    Parameters:
+        costs (list[float]): Cost of each item.
+        num_chunks (int): Number of chunks to make.
+
+    Returns:
+        list[list[int]]: Indices of the items in each non-empty chunk.
+    """
+
+    chunks = [[] for i in range(num_chunks)]
+    totals = [0.0] * num_chunks
+
+    for index in sorted(range(len(costs)), key=lambda i: costs[i], reverse=True):
+        cheapest = totals.index(min(totals))
+        chunks[cheapest].append(index)
+        totals[cheapest] += costs[index]
+
+    return [chunk for chunk in chunks if chunk]
+
+
+class ParallelEvaluator:
+    """
+    Evaluates genomes on a persistent pool of worker processes.
+    """
+
+    def __init__(self, workers: int, iters_per_run: int, check_collision: bool, fitness_function: str,
+                 schedule: str = "fifo"):
+        """
+        Returns a ParallelEvaluator and starts its workers.
+
+        Parameters:
+            workers (int): Number of worker processes.
+            iters_per_run (int): Number of grammar rules to apply per individual.
+            check_collision (bool): Whether the mesh should block grow commands that overlap with the mesh.
+            fitness_function (str): What fitness function to use.
+            schedule (str): Order genomes are dispatched in. "fifo" dispatches them in order, "longest_first"
+                            by decreasing predicted cost, and "chunked" in one chunk of about equal predicted
+                            cost per worker.
+        """
+
+        if schedule not in SCHEDULES:
+            raise ValueError('Unexpected schedule {}. Try "fifo", "longest_first", or "chunked"'.format(schedule))
+
+        self.workers = workers
+        self.iters_per_run = iters_per_run
+        self.check_collision = check_collision
+        self.fitness_function = fitness_function
+        self.schedule = schedule
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=warm_worker)
+
+        # Predicted vs actual cost of the last evaluate() call, and a seconds-per-cost-unit rate fit on all calls
+        self.cost_log = []
+        self.cost_time_sum = 0.0
+        self.cost_squared_sum = 0.0
+
+    def submit(self, genome: Grammar, share_mesh: bool = False, iters_per_run: int = None) -> Future:
+        """
+        Start evaluating a genome.
+
+        Parameters:
+            genome (Grammar): The genome to evaluate.
+            share_mesh (bool): Whether the worker should return the grown mesh through shared memory.
+            iters_per_run (int): Number of grammar rules to apply. Defaults to the evaluator's.
+
+        Returns:
+            Future: Resolves to a (fitness, SharedMeshHandle or None) tuple.
+        """
+
+        iters_per_run = self.iters_per_run if iters_per_run is None else iters_per_run
+
+        return self.executor.submit(evaluate_rules, genome.to_dict(), iters_per_run, self.check_collision,
+                                    self.fitness_function, share_mesh)
+
+    def evaluate(self, genomes: list[Grammar], share_meshes: bool = False,
+                 iters_per_run: int = None) -> list[tuple[float, SharedMeshHandle]]:
+        """
+        Evaluate genomes in parallel.
+
+        Parameters:
+            genomes (list[Grammar]): The genomes to evaluate.
+            share_meshes (bool): Whether workers should return the grown meshes through shared memory. The
+                                 caller is responsible for releasing every returned handle.
+            iters_per_run (int): Number of grammar rules to apply. Defaults to the evaluator's.
+
+        Returns:
+            list[tuple[float, SharedMeshHandle]]: (fitness, handle or None) for each genome, in order.
+        """
+
+        iters_per_run = self.iters_per_run if iters_per_run is None else iters_per_run
+
+        if self.schedule == "fifo":
+            futures = [self.submit(genome, share_meshes, iters_per_run) for genome in genomes]
+            return [future.result() for future in futures]
+
+        predictions = [predict_growth(genome, iters_per_run, self.check_collision) for genome in genomes]
+        costs = [cost for _, cost in predictions]
+        args = (iters_per_run, self.check_collision, self.fitness_function, share_meshes)
+        results = [None] * len(genomes)
+
+        if self.schedule == "longest_first":
+            order = sorted(range(len(genomes)), key=lambda i: costs[i], reverse=True)
+            futures = {i: self.executor.submit(timed_evaluate_rules, genomes[i].to_dict(), *args) for i in order}
+            for i, future in futures.items():
+                results[i] = future.result()
+        else:
+            chunks = balance_chunks(costs, self.workers)
+            futures = [self.executor.submit(timed_evaluate_rules_batch, [genomes[i].to_dict() for i in chunk], *args)
+                       for chunk in chunks]
+            for chunk, future in zip(chunks, futures):
+                for i, result in zip(chunk, future.result()):
+                    results[i] = result
+
+        self.log_costs(predictions, results)
+
+        return [(fitness, handle) for fitness, handle, _, _ in results]
+
+    def log_costs(self, predictions: list[tuple[int, float]], results: list[tuple]):
+        """
+        Records predicted against actual cost, and refits the seconds-per-cost-unit rate used to turn
+        predicted costs into predicted seconds.
+
+        Parameters:
+            predictions (list[tuple[int, float]]): predict_growth() result of each genome.
+            results (list[tuple]): timed_evaluate_rules() result of each genome.
+        """
+
+        rate = self.seconds_per_cost()
+        self.cost_log = []
+
+        for (predicted_faces, predicted_cost), (_, _, seconds, faces) in zip(predictions, results):
+            self.cost_log.append({
+                "predicted_faces": predicted_faces,
+                "faces": faces,
+                "predicted_cost": predicted_cost,
+                "predicted_seconds": None if rate is None else predicted_cost * rate,
+                "seconds": seconds
+            })
+            self.cost_time_sum += predicted_cost * seconds
+            self.cost_squared_sum += predicted_cost * predicted_cost
+
+    def seconds_per_cost(self) -> float:
+        """
+        Least-squares fit of seconds = rate * predicted cost over every genome evaluated so far.
+
+        Returns:
+            float: The rate, or None before anything was evaluated.
+        """
+
+        if self.cost_squared_sum == 0:
+            return None
+
+        return self.cost_time_sum / self.cost_squared_sum
+
+    def shutdown(self):
+        """
+        Stops the worker processes.
+        """
+
+        self.executor.shutdown()
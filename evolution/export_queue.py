@@ -0,0 +1,121 @@
+"""
+Run exports on a background writer thread, so writing generation files, run.csv rows and meshes of
+generation g overlaps with evaluating generation g + 1 instead of holding up the workers.
+
+Jobs run one at a time in the order they were submitted, so appends to the same file stay in order. The
+queue is bounded: when it is full, submitting blocks until the writer catches up, or with the "drop"
+backpressure policy, droppable jobs like mesh exports and progress printing are skipped instead.
+
+October 19th, 2026
+"""
+
+import queue
+import threading
+
+BACKPRESSURE = ["block", "drop"]
+
+
+class ExportQueue:
+    """
+    Bounded queue of export jobs served by one writer thread.
+
+    Attributes:
+        backpressure (str): What to do when the queue is full, "block" or "drop".
+        jobs (queue.Queue): Pending (function, args) jobs. None stops the writer.
+        dropped (int): Number of droppable jobs skipped because the queue was full.
+        error (BaseException): First exception raised by a job, raised again by the next submit(), flush()
+                               or close(). Cleared once it has been raised.
+        failed (bool): Whether a job has failed. Stays set, so every job after a failed one is skipped.
+        thread (threading.Thread): The writer thread.
+    """
+
+    def __init__(self, max_pending: int, backpressure: str = "block"):
+        """
+        Returns an ExportQueue and starts its writer thread.
+
+        Parameters:
+            max_pending (int): Maximum number of jobs waiting to run.
+            backpressure (str): "block" to wait for room when the queue is full, or "drop" to skip droppable
+                                jobs instead.
+        """
+
+        if backpressure not in BACKPRESSURE:
+            raise ValueError("Unexpected backpressure policy {}. Try one of {}".format(backpressure, BACKPRESSURE))
+
+        self.backpressure = backpressure
+        self.jobs = queue.Queue(maxsize=max_pending)
+        self.dropped = 0
+        self.error = None
+        self.failed = False
+        self.thread = threading.Thread(target=self.serve, name="export-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, function, *args, droppable: bool = False):
+        """
+        Queues a job.
+
+        Parameters:
+            function: Function to call on the writer thread.
+            *args: Arguments to call it with. They must not be modified after submitting.
+            droppable (bool): Whether the job may be skipped when the queue is full and backpressure is "drop".
+        """
+
+        self.raise_error()
+
+        if droppable and self.backpressure == "drop":
+            try:
+                self.jobs.put_nowait((function, args))
+            except queue.Full:
+                self.dropped += 1
+            return
+
+        self.jobs.put((function, args))
+
+    def serve(self):
+        """
+        Runs jobs until it gets None. Runs on the writer thread.
+        """
+
+        while True:
+            job = self.jobs.get()
+
+            try:
+                if job is None:
+                    return
+
+                function, args = job
+                if not self.failed:
+                    function(*args)
+            except BaseException as e:  # pylint: disable=broad-except
+                self.error = e
+                self.failed = True
+            finally:
+                self.jobs.task_done()
+
+    def flush(self):
+        """
+        Waits until every queued job has run.
+        """
+
+        self.jobs.join()
+        self.raise_error()
+
+    def close(self):
+        """
+        Runs the remaining jobs and stops the writer thread. Safe to call more than once.
+        """
+
+        if self.thread.is_alive():
+            self.jobs.put(None)
+            self.thread.join()
+
+        self.raise_error()
+
+    def raise_error(self):
+        """
+        Raises the first exception a job raised, if any, on the calling thread.
+        """
+
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise RuntimeError("An export job failed") from error
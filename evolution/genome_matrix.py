@@ -0,0 +1,383 @@
+"""
+A population of genomes held in one integer array, so selection, crossover and mutation run as batched
+NumPy operations instead of per-Grammar Python loops.
+
+The array has shape (population, rules, fields). Rule i is the rule for alphabet[i], field 0 is the index
+of its operation in the operations dict, and fields 1 and up are the indices of its rhs labels in the
+alphabet, padded with -1 past the operation's number of rhs labels.
+
+Converting to and from Grammar objects goes through rule codes, one integer per rule. There are only a few
+thousand distinct rules, so each is decoded into a Rule once, and grammars share the decoded Rules.
+
+October 19th, 2026
+"""
+
+import numpy as np
+from model.grammar import Grammar, Rule
+
+GENE_DTYPE = np.int16
+PADDING = -1
+
+
+class RuleTable:
+    """
+    Two-way mapping between Rules and rule codes for one alphabet and set of operations. A rule's code packs
+    its fields, each shifted up by one so padding is 0, as digits in base len(alphabet) + 1.
+
+    Attributes:
+        alphabet (list[str]): Possible labels for faces.
+        operations (dict[str, int]): Operations with the number of rhs labels each takes.
+        base (int): Base of the code digits.
+        weights (np.ndarray): Place value of each field.
+        rules (dict[int, Rule]): Code -> Rule, for the rules decoded so far.
+        codes (dict[Rule, int]): Rule -> code, for the rules encoded or decoded so far.
+        ids (dict[int, int]): id() -> code of the decoded Rules. They are kept alive by rules, so their
+                              ids stay valid, and looking them up skips hashing the Rule.
+    """
+
+    def __init__(self, alphabet: list[str], operations: dict[str, int]):
+        """
+        Returns an empty RuleTable.
+
+        Parameters:
+            alphabet (list[str]): Possible labels for faces.
+            operations (dict[str, int]): Operations with the number of rhs labels each takes.
+        """
+
+        self.alphabet = alphabet
+        self.operations = operations
+        self.base = max(len(alphabet), len(operations)) + 1
+        self.weights = self.base ** np.arange(GenomeMatrix.num_fields(operations), dtype=np.int64)
+        self.rules = {}
+        self.codes = {}
+        self.ids = {}
+
+    def encode(self, genes: np.ndarray) -> np.ndarray:
+        """
+        Parameters:
+            genes (np.ndarray): (..., fields) genes.
+
+        Returns:
+            np.ndarray: The code of each rule, shape genes.shape[:-1].
+        """
+
+        return (genes.astype(np.int64) + 1) @ self.weights
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Parameters:
+            codes (np.ndarray): Rule codes.
+
+        Returns:
+            np.ndarray: The genes of each rule, shape codes.shape + (fields,).
+        """
+
+        return (codes[..., None] // self.weights % self.base - 1).astype(GENE_DTYPE)
+
+    def rule(self, code: int) -> Rule:
+        """
+        Parameters:
+            code (int): A rule code.
+
+        Returns:
+            Rule: The rule, shared by every grammar decoded with this table.
+        """
+
+        if code not in self.rules:
+            fields = self.decode(np.array(code)).tolist()
+            operation = list(self.operations)[fields[0]]
+            rule = Rule(operation, tuple(self.alphabet[label] for label in fields[1:1 + self.operations[operation]]))
+            self.rules[code] = rule
+            self.codes[rule] = code
+            self.ids[id(rule)] = code
+
+        return self.rules[code]
+
+    def code(self, rule: Rule) -> int:
+        """
+        Parameters:
+            rule (Rule): A rule.
+
+        Returns:
+            int: The rule's code.
+        """
+
+        code = self.ids.get(id(rule))
+        if code is not None:
+            return code
+
+        if rule not in self.codes:
+            genes = np.full(GenomeMatrix.num_fields(self.operations), PADDING, dtype=GENE_DTYPE)
+            genes[0] = list(self.operations).index(rule.operation)
+            genes[1:1 + len(rule.rhs)] = [self.alphabet.index(label) for label in rule.rhs]
+            self.codes[rule] = int(self.encode(genes))
+
+        return self.codes[rule]
+
+
+_rule_tables = {}
+
+
+def rule_table(alphabet: list[str], operations: dict[str, int]) -> RuleTable:
+    """
+    Parameters:
+        alphabet (list[str]): Possible labels for faces.
+        operations (dict[str, int]): Operations with the number of rhs labels each takes.
+
+    Returns:
+        RuleTable: The table for the alphabet and operations, created on first use.
+    """
+
+    key = (tuple(alphabet), tuple(operations.items()))
+
+    if key not in _rule_tables:
+        _rule_tables[key] = RuleTable(list(alphabet), dict(operations))
+
+    return _rule_tables[key]
+
+
+class GenomeMatrix:
+    """
+    Genomes of a population as one (population, rules, fields) integer array.
+
+    Attributes:
+        alphabet (list[str]): Possible labels for faces. Rule i has lhs alphabet[i].
+        operations (dict[str, int]): Operations with the number of rhs labels each takes.
+        genes (np.ndarray): The genomes.
+    """
+
+    def __init__(self, alphabet: list[str], operations: dict[str, int], genes: np.ndarray):
+        """
+        Returns a GenomeMatrix around an existing array.
+
+        Parameters:
+            alphabet (list[str]): Possible labels for faces.
+            operations (dict[str, int]): Operations with the number of rhs labels each takes.
+            genes (np.ndarray): Array of shape (population, len(alphabet), 1 + max rhs length).
+        """
+
+        self.alphabet = alphabet
+        self.operations = operations
+        self.genes = genes
+
+    @staticmethod
+    def num_fields(operations: dict[str, int]) -> int:
+        """
+        Parameters:
+            operations (dict[str, int]): Operations with the number of rhs labels each takes.
+
+        Returns:
+            int: Number of fields per rule, the operation plus the longest rhs.
+        """
+
+        return 1 + max(operations.values())
+
+    @classmethod
+    def random(cls, alphabet: list[str], operations: dict[str, int], count: int, rng=np.random):
+        """
+        Generate random genomes, like Grammar.generate_random().
+
+        Parameters:
+            alphabet (list[str]): Possible labels for faces.
+            operations (dict[str, int]): Operations with the number of rhs labels each takes.
+            count (int): Number of genomes.
+            rng: np.random or a np.random.RandomState to draw from.
+
+        Returns:
+            GenomeMatrix: The random genomes.
+        """
+
+        shape = (count, len(alphabet), cls.num_fields(operations))
+        genes = np.full(shape, PADDING, dtype=GENE_DTYPE)
+        random_rules(genes, np.ones(shape[:2], dtype=bool), len(alphabet), operations, rng)
+
+        return cls(alphabet, operations, genes)
+
+    @classmethod
+    def from_grammars(cls, grammars: list[Grammar], alphabet: list[str], operations: dict[str, int]):
+        """
+        Encode Grammar objects.
+
+        Parameters:
+            grammars (list[Grammar]): Grammars with one rule per label in alphabet.
+            alphabet (list[str]): Possible labels for faces.
+            operations (dict[str, int]): Operations with the number of rhs labels each takes.
+
+        Returns:
+            GenomeMatrix: The encoded grammars.
+        """
+
+        table = rule_table(alphabet, operations)
+        code = table.code
+        codes = np.fromiter((code(grammar.rules[lhs]) for grammar in grammars for lhs in alphabet), dtype=np.int64,
+                            count=len(grammars) * len(alphabet))
+
+        return cls(alphabet, operations, table.decode(codes.reshape(len(grammars), len(alphabet))))
+
+    def to_grammar(self, index: int) -> Grammar:
+        """
+        Decode one genome. Its rules are in alphabet order.
+
+        Parameters:
+            index (int): Index of the genome in the population.
+
+        Returns:
+            Grammar: The decoded genome.
+        """
+
+        return GenomeMatrix(self.alphabet, self.operations, self.genes[index:index + 1]).to_grammars()[0]
+
+    def to_grammars(self) -> list[Grammar]:
+        """
+        Decode every genome. Each distinct rule is decoded once, and its Rule is shared by every genome
+        that has it.
+
+        Returns:
+            list[Grammar]: The decoded genomes, in population order.
+        """
+
+        table = rule_table(self.alphabet, self.operations)
+        unique, inverse = np.unique(table.encode(self.genes), return_inverse=True)
+        rules = np.array([table.rule(code) for code in unique.tolist()] + [None], dtype=object)[:-1]
+
+        grammars = []
+        for row in rules[inverse.reshape(self.genes.shape[:2])].tolist():
+            grammar = Grammar(self.alphabet, self.operations)
+            grammar.rules = dict(zip(self.alphabet, row))
+            grammars.append(grammar)
+
+        return grammars
+
+    def __len__(self) -> int:
+        return self.genes.shape[0]
+
+
+def random_rules(genes: np.ndarray, mask: np.ndarray, alphabet_size: int, operations: dict[str, int], rng=np.random):
+    """
+    Replace the masked rules with random ones, in place. Like Grammar.regenerate_random(), each new rule has a
+    uniformly random operation and distinct rhs labels.
+
+    Parameters:
+        genes (np.ndarray): (population, rules, fields) genes to modify.
+        mask (np.ndarray): (population, rules) booleans, True for the rules to replace.
+        alphabet_size (int): Number of labels.
+        operations (dict[str, int]): Operations with the number of rhs labels each takes.
+        rng: np.random or a np.random.RandomState to draw from.
+    """
+
+    num_new = int(mask.sum())
+    if num_new == 0:
+        return
+
+    arities = np.array(list(operations.values()))
+    new_operations = rng.randint(0, len(arities), size=num_new)
+
+    # Distinct labels per rule: the first few columns of a random permutation of the alphabet
+    max_rhs = genes.shape[2] - 1
+    new_rhs = np.argsort(rng.random_sample((num_new, alphabet_size)), axis=1)[:, :max_rhs]
+    new_rhs[np.arange(max_rhs) >= arities[new_operations][:, None]] = PADDING
+
+    genes[mask, 0] = new_operations
+    genes[mask, 1:] = new_rhs
+
+
+def select_parents(fitnesses: np.ndarray, count: int, rng=np.random) -> np.ndarray:
+    """
+    Fitness-proportional selection of parents in one draw.
+
+    Parameters:
+        fitnesses (np.ndarray): Fitness of each individual.
+        count (int): Number of parents to select.
+        rng: np.random or a np.random.RandomState to draw from.
+
+    Returns:
+        np.ndarray: Indices of the selected parents.
+    """
+
+    fitnesses = np.asarray(fitnesses, dtype=float)
+
+    return rng.choice(len(fitnesses), size=count, p=fitnesses / fitnesses.sum())
+
+
+def crossover(first: np.ndarray, second: np.ndarray, strategy: str, rate: float, rng=np.random):
+    """
+    Cross pairs of genomes over, in place, like Grammar's crossover methods. Each pair crosses over with
+    probability rate.
+
+    Parameters:
+        first (np.ndarray): (pairs, rules, fields) genes of the first parents.
+        second (np.ndarray): (pairs, rules, fields) genes of the second parents.
+        strategy (str): "one" or "two" for single or double point crossover, "uniform" for uniform crossover.
+        rate (float): Probability that a pair crosses over.
+        rng: np.random or a np.random.RandomState to draw from.
+    """
+
+    pairs, rules = first.shape[:2]
+    crossing = rng.random_sample(pairs) < rate
+    positions = np.arange(rules)
+
+    match strategy:
+        case "one":
+            pivot = rng.randint(0, rules, size=pairs)
+            swap = positions[None, :] >= pivot[:, None]
+        case "two":
+            pivot1 = rng.randint(0, rules - 1, size=pairs)
+            pivot2 = pivot1 + (rng.random_sample(pairs) * (rules - pivot1)).astype(int)
+            swap = (positions[None, :] >= pivot1[:, None]) & (positions[None, :] < pivot2[:, None])
+        case "uniform":
+            swap = rng.random_sample((pairs, rules)) < 0.5
+        case _:
+            raise ValueError('Unexpected crossover strategy {}. Try "one", "two", or "uniform"'.format(strategy))
+
+    swap &= crossing[:, None]
+
+    swapped = first[swap]
+    first[swap] = second[swap]
+    second[swap] = swapped
+
+
+def mutate(genes: np.ndarray, rate: float, alphabet_size: int, operations: dict[str, int], rng=np.random):
+    """
+    Regenerate each rule with probability rate, in place.
+
+    Parameters:
+        genes (np.ndarray): (population, rules, fields) genes to mutate.
+        rate (float): Chance to regenerate each rule.
+        alphabet_size (int): Number of labels.
+        operations (dict[str, int]): Operations with the number of rhs labels each takes.
+        rng: np.random or a np.random.RandomState to draw from.
+    """
+
+    random_rules(genes, rng.random_sample(genes.shape[:2]) < rate, alphabet_size, operations, rng)
+
+
+def breed_genes(population: GenomeMatrix, fitnesses: np.ndarray, count: int, crossover_rate: float,
+                crossover_strategy: str, mutation_rate: float, rng=np.random) -> GenomeMatrix:
+    """
+    Breed offspring the way EvolutionRun.breed() does, for the whole population at once: pairs of parents
+    are selected by fitness, crossed over, and mutated.
+
+    Parameters:
+        population (GenomeMatrix): Parents to select from.
+        fitnesses (np.ndarray): Fitness of each parent.
+        count (int): Number of offspring.
+        crossover_rate (float): Rate at which to crossover.
+        crossover_strategy (str): "one", "two", or "uniform".
+        mutation_rate (float): Rate at which to mutate.
+        rng: np.random or a np.random.RandomState to draw from.
+
+    Returns:
+        GenomeMatrix: The offspring.
+    """
+
+    pairs = (count + 1) // 2
+    parents = select_parents(fitnesses, 2 * pairs, rng)
+    first = population.genes[parents[:pairs]]
+    second = population.genes[parents[pairs:]]
+
+    crossover(first, second, crossover_strategy, crossover_rate, rng)
+
+    offspring = np.concatenate([first, second])[:count]
+    mutate(offspring, mutation_rate, len(population.alphabet), population.operations, rng)
+
+    return GenomeMatrix(population.alphabet, population.operations, offspring)
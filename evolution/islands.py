@@ -0,0 +1,253 @@
+"""
+Island-model evolution. Several EvolutionRun populations evolve in separate processes and exchange their
+best individuals every few generations.
+
+October 19th, 2026
+"""
+
+import os
+import json
+import multiprocessing as mp
+import pandas as pd
+from model.grammar import Grammar
+from model.tetrahedral_mesh import OPERATIONS
+from evolutionary_alg import EvolutionRun, GENOME_INDEX, FITNESS_INDEX, derive_seeds, resolve_batch_path
+
+MIGRATION_TIMEOUT = 3600 # Seconds to wait for immigrants before giving up on the other islands
+TOPOLOGIES = ["ring", "full"]
+
+
+def migration_targets(topology: str, index: int, num_islands: int) -> list[int]:
+    """
+    Get the islands an island sends its emigrants to.
+
+    Parameters:
+        topology (str): "ring" to send to the next island, or "full" to send to every other island.
+        index (int): Index of the sending island.
+        num_islands (int): Number of islands.
+
+    Returns:
+        list[int]: Indices of the receiving islands.
+    """
+
+    match topology:
+        case "ring":
+            return [(index + 1) % num_islands] if num_islands > 1 else []
+        case "full":
+            return [i for i in range(num_islands) if i != index]
+        case _:
+            raise ValueError('Unexpected migration topology {}. Try "ring" or "full"'.format(topology))
+
+
+def migration_sources(topology: str, index: int, num_islands: int) -> list[int]:
+    """
+    Get the islands an island receives immigrants from.
+
+    Parameters:
+        topology (str): "ring" or "full".
+        index (int): Index of the receiving island.
+        num_islands (int): Number of islands.
+
+    Returns:
+        list[int]: Indices of the sending islands.
+    """
+
+    return [i for i in range(num_islands) if index in migration_targets(topology, i, num_islands)]
+
+
+class IslandRun(EvolutionRun):
+    """
+    An EvolutionRun that swaps its best individuals with other islands every migration_interval generations.
+    Immigrants replace the worst individuals before breeding, so they can become elites.
+    """
+
+    mode = "islands"
+
+    def __init__(self, inbox: mp.Queue, outboxes: list, num_sources: int, migration_interval: int,
+                 migration_size: int, **settings):
+        """
+        Returns an IslandRun instance.
+
+        Parameters:
+            inbox (mp.Queue): Queue this island receives immigrants on.
+            outboxes (list[mp.Queue]): Queues of the islands this island sends emigrants to.
+            num_sources (int): Number of islands that send emigrants to this island.
+            migration_interval (int): Number of generations between migrations.
+            migration_size (int): Number of best individuals sent to each target island.
+            settings: Keyword arguments for EvolutionRun.
+        """
+
+        super().__init__(**settings)
+
+        self.inbox = inbox
+        self.outboxes = outboxes
+        self.num_sources = num_sources
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+
+    def step(self):
+        """
+        Run one generation, migrating between evaluation and breeding when one is due.
+        """
+
+        self.evaluate_generation()
+
+        last_gen = self.current_gen == self.generations - 1
+        if (self.current_gen + 1) % self.migration_interval == 0 and not last_gen:
+            self.migrate()
+
+        self.next_generation()
+
+    def migrate(self):
+        """
+        Send copies of the best individuals to the target islands, then replace the worst individuals with
+        the best immigrants.
+        """
+
+        emigrants = [[individual[GENOME_INDEX].to_dict(), individual[FITNESS_INDEX]]
+                     for individual in self.population[:self.migration_size]]
+
+        for outbox in self.outboxes:
+            outbox.put(emigrants)
+
+        immigrants = []
+        for i in range(self.num_sources):
+            immigrants.extend(self.inbox.get(timeout=MIGRATION_TIMEOUT))
+
+        immigrants.sort(key=lambda x: x[FITNESS_INDEX], reverse=self.sort_reverse)
+        immigrants = immigrants[:self.new_per_gen] # The local elites always survive migration
+
+        for i, (rules, fitness) in enumerate(immigrants):
+            genome = Grammar(self.alphabet, OPERATIONS)
+            genome.add_from_dict(rules)
+            self.population[-(i + 1)] = [genome, fitness]
+
+        self.sort_population()
+
+        print("Island received {} immigrants".format(len(immigrants)))
+
+
+def island_main(settings: dict, inbox: mp.Queue, outboxes: list, num_sources: int, migration_interval: int,
+                migration_size: int):
+    """
+    Entry point of an island process.
+
+    Parameters:
+        settings (dict): Keyword arguments for EvolutionRun.
+        inbox (mp.Queue): Queue this island receives immigrants on.
+        outboxes (list[mp.Queue]): Queues of the islands this island sends emigrants to.
+        num_sources (int): Number of islands that send emigrants to this island.
+        migration_interval (int): Number of generations between migrations.
+        migration_size (int): Number of best individuals sent to each target island.
+    """
+
+    island = IslandRun(inbox, outboxes, num_sources, migration_interval, migration_size, **settings)
+    island.run()
+
+
+def run_islands(settings: dict, num_islands: int, migration_interval: int, migration_size: int,
+                topology: str) -> str:
+    """
+    Run an island-model evolution. Each island is stored in an islandX folder under the run directory,
+    next to a summary.csv with every island's best fitness per generation and islands.json with the seeds.
+
+    Parameters:
+        settings (dict): Keyword arguments for EvolutionRun, see evolutionary_alg.run_settings(). run_name and
+                         data_path name the directory the islands are stored in, and seed is the seed the
+                         per-island seeds are derived from.
+        num_islands (int): Number of islands.
+        migration_interval (int): Number of generations between migrations.
+        migration_size (int): Number of best individuals each island sends to each of its targets.
+        topology (str): Migration topology, "ring" or "full".
+
+    Returns:
+        str: The directory the islands were stored in.
+    """
+
+    if topology not in TOPOLOGIES:
+        raise ValueError('Unexpected migration topology {}. Try "ring" or "full"'.format(topology))
+
+    if settings.get("resume"):
+        raise ValueError("Island runs can't be resumed, since migrants in transit aren't checkpointed.")
+
+    stopping = [settings.get("target_fitness") is not None, settings.get("patience", 0) > 0,
+                settings.get("max_evaluations", 0) > 0, settings.get("time_budget", 0) > 0]
+    if any(stopping):
+        raise ValueError("Island runs don't support stopping criteria, an island that stopped early would leave "
+                         "the others waiting for its migrants.")
+
+    if settings.get("novelty_weight", 0) > 0:
+        raise ValueError("Island runs don't support novelty search, immigrants arrive without behaviour descriptors.")
+
+    data_path = resolve_batch_path(settings["run_name"], settings["data_path"], default_folder="runs")
+
+    seed = settings["seed"]
+    if seed is None:
+        seed = derive_seeds(None, 1)[0]
+
+    seeds = derive_seeds(seed, num_islands)
+
+    inboxes = [mp.Queue() for i in range(num_islands)]
+    processes = []
+
+    for i in range(num_islands):
+        island_settings = dict(settings)
+        island_settings.update(run_name="island" + str(i), data_path=data_path, seed=seeds[i])
+
+        outboxes = [inboxes[target] for target in migration_targets(topology, i, num_islands)]
+        num_sources = len(migration_sources(topology, i, num_islands))
+
+        process = mp.Process(target=island_main, args=(island_settings, inboxes[i], outboxes, num_sources,
+                                                        migration_interval, migration_size))
+        process.start()
+        processes.append(process)
+
+    for process in processes:
+        process.join()
+
+    failed = [i for i, process in enumerate(processes) if process.exitcode != 0]
+    if failed:
+        raise RuntimeError("Islands {} exited with an error.".format(failed))
+
+    export_summary(data_path, num_islands, settings["sort_reverse"])
+
+    islands_info = {
+        "seed": seed,
+        "island_seeds": seeds,
+        "num_islands": num_islands,
+        "migration_interval": migration_interval,
+        "migration_size": migration_size,
+        "migration_topology": topology
+    }
+
+    with open(os.path.join(data_path, "islands.json"), 'w') as f:
+        json.dump(islands_info, f, indent=4)
+
+    return data_path
+
+
+def export_summary(data_path: str, num_islands: int, sort_reverse: bool):
+    """
+    Merges the run.csv files of all islands into summary.csv, with one column of best fitness per island
+    and the best across all islands.
+
+    Parameters:
+        data_path (str): Directory the islands are stored in.
+        num_islands (int): Number of islands.
+        sort_reverse (bool): Whether a higher fitness is better.
+    """
+
+    summary = None
+
+    for i in range(num_islands):
+        df = pd.read_csv(os.path.join(data_path, "island" + str(i), "run.csv"))
+        df = df[["generation", "fitness"]].rename(columns={"fitness": "island" + str(i)})
+        summary = df if summary is None else summary.merge(df, on="generation", how="outer")
+
+    island_columns = ["island" + str(i) for i in range(num_islands)]
+    if sort_reverse:
+        summary["best"] = summary[island_columns].max(axis=1)
+    else:
+        summary["best"] = summary[island_columns].min(axis=1)
+
+    summary.to_csv(os.path.join(data_path, "summary.csv"), index=False)
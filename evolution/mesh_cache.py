@@ -0,0 +1,145 @@
+"""
+Keep the grown meshes of the best individuals around so they can be exported without regrowing them.
+
+October 19th, 2026
+"""
+
+
+class MeshCache:
+    """
+    Holds the meshes of the top-k individuals seen so far, ranked by fitness.
+
+    Meshes are keyed by the content of their grammar, so an elite that survives into the next
+    generation still finds its mesh. Any mesh that drops out of the top-k has its release() method
+    called, which lets meshes backed by shared memory give their blocks back.
+
+    Attributes:
+        capacity (int): Maximum number of meshes to hold.
+        sort_reverse (bool): Whether a higher fitness is better.
+        entries (list): (fitness, key, mesh) triples, best first.
+    """
+
+    def __init__(self, capacity: int, sort_reverse: bool):
+        """
+        Returns an empty MeshCache.
+
+        Parameters:
+            capacity (int): Maximum number of meshes to hold.
+            sort_reverse (bool): Whether a higher fitness is better.
+        """
+
+        self.capacity = capacity
+        self.sort_reverse = sort_reverse
+        self.entries = []
+
+    def is_better(self, fitness: float, other_fitness: float) -> bool:
+        """
+        Whether one fitness is strictly better than another.
+
+        Parameters:
+            fitness (float): The fitness to compare.
+            other_fitness (float): The fitness to compare against.
+
+        Returns:
+            bool: True if fitness is strictly better than other_fitness.
+        """
+
+        if self.sort_reverse:
+            return fitness > other_fitness
+        return fitness < other_fitness
+
+    def accepts(self, key, fitness: float) -> bool:
+        """
+        Whether a mesh with this key and fitness would be kept. Lets callers skip building a
+        mesh snapshot that would be thrown away immediately.
+
+        Parameters:
+            key (Hashable): Key of the mesh's grammar.
+            fitness (float): Fitness of the mesh.
+
+        Returns:
+            bool: True if offer() would keep the mesh.
+        """
+
+        if self.capacity <= 0 or self.contains(key):
+            return False
+
+        if len(self.entries) < self.capacity:
+            return True
+
+        return self.is_better(fitness, self.entries[-1][0])
+
+    def offer(self, key, fitness: float, mesh) -> bool:
+        """
+        Offer a mesh to the cache. The mesh is released if it isn't kept, and whatever mesh it
+        pushes out of the top-k is released too.
+
+        Parameters:
+            key (Hashable): Key of the mesh's grammar.
+            fitness (float): Fitness of the mesh.
+            mesh (CompactMesh): The mesh. Must have a release() method.
+
+        Returns:
+            bool: True if the mesh was kept.
+        """
+
+        if not self.accepts(key, fitness):
+            mesh.release()
+            return False
+
+        # Insert after every entry that is at least as good, so earlier meshes win ties
+        position = len(self.entries)
+        for i, (other_fitness, _, _) in enumerate(self.entries):
+            if self.is_better(fitness, other_fitness):
+                position = i
+                break
+
+        self.entries.insert(position, (fitness, key, mesh))
+
+        while len(self.entries) > self.capacity:
+            self.entries.pop()[2].release()
+
+        return True
+
+    def contains(self, key) -> bool:
+        """
+        Whether a mesh is held for the given key.
+
+        Parameters:
+            key (Hashable): Key of the grammar.
+
+        Returns:
+            bool: True if a mesh is held for the key.
+        """
+
+        return any(entry_key == key for _, entry_key, _ in self.entries)
+
+    def get(self, key):
+        """
+        Get the mesh held for a key.
+
+        Parameters:
+            key (Hashable): Key of the grammar.
+
+        Returns:
+            CompactMesh: The mesh, or None if it isn't held.
+        """
+
+        for _, entry_key, mesh in self.entries:
+            if entry_key == key:
+                return mesh
+
+        return None
+
+    def clear(self):
+        """
+        Releases and forgets every held mesh.
+        """
+
+        for _, _, mesh in self.entries:
+            mesh.release()
+
+        self.entries = []
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,159 @@
+"""
+Novelty search. Each grown mesh is summarized by a behaviour descriptor, and an individual's novelty is
+its mean distance to the k nearest descriptors among an archive of earlier individuals and the rest of
+its generation. Rewarding novelty keeps the population from converging on the first local optimum of a
+deceptive fitness function.
+
+The archive is indexed by a scipy.spatial.cKDTree. Entries added since the tree was built are searched
+by brute force, and the tree is rebuilt once enough of them pile up, so scoring a generation stays
+sublinear in the size of the archive. scipy is imported when it is first needed, so runs without novelty
+search don't pay for loading it.
+
+October 19th, 2026
+"""
+
+import numpy as np
+
+DESCRIPTOR_SIZE = 8 # Bounding box extents (3), centroid (3), face count, hull volume
+INITIAL_CAPACITY = 1024
+
+
+def behaviour_descriptor(vertices: np.ndarray, num_faces: int) -> np.ndarray:
+    """
+    Describe the shape of a mesh.
+
+    Parameters:
+        vertices (np.ndarray): Array of shape (num_vertices, 3) with the mesh's vertices.
+        num_faces (int): Number of faces in the mesh.
+
+    Returns:
+        np.ndarray: The bounding box extents, the centroid, the face count and the convex hull volume.
+    """
+
+    from scipy.spatial import ConvexHull  # pylint: disable=import-outside-toplevel
+
+    try:
+        hull_volume = ConvexHull(vertices).volume
+    except Exception:  # pylint: disable=broad-except
+        hull_volume = 0.0 # Flat or degenerate meshes have no hull
+
+    return np.concatenate([vertices.max(axis=0) - vertices.min(axis=0), vertices.mean(axis=0),
+                           [num_faces, hull_volume]])
+
+
+class NoveltyArchive:
+    """
+    Archive of behaviour descriptors with batched k-nearest-neighbour novelty scoring.
+
+    Descriptors are divided by a per-dimension scale fixed from the first batch scored, so that face
+    counts don't drown out the coordinates. The scale can't change later without rebuilding the tree.
+
+    Attributes:
+        k (int): Number of nearest neighbours novelty is averaged over.
+        rebuild_interval (int): Number of unindexed entries that triggers a rebuild of the tree.
+        entries (np.ndarray): Scaled descriptors, the first size rows are in use.
+        size (int): Number of descriptors in the archive.
+        num_indexed (int): Number of descriptors in the tree, the first num_indexed entries.
+        tree (cKDTree): Tree over the indexed entries, None while there are none.
+        scale (np.ndarray): Per-dimension scale, None until the first batch.
+    """
+
+    def __init__(self, k: int = 15, rebuild_interval: int = 1000):
+        """
+        Returns an empty NoveltyArchive.
+
+        Parameters:
+            k (int): Number of nearest neighbours novelty is averaged over.
+            rebuild_interval (int): Number of unindexed entries that triggers a rebuild of the tree.
+        """
+
+        self.k = k
+        self.rebuild_interval = rebuild_interval
+        self.entries = np.empty((INITIAL_CAPACITY, DESCRIPTOR_SIZE))
+        self.size = 0
+        self.num_indexed = 0
+        self.tree = None
+        self.scale = None
+
+    def scaled(self, descriptors: np.ndarray) -> np.ndarray:
+        """
+        Parameters:
+            descriptors (np.ndarray): Array of shape (n, DESCRIPTOR_SIZE).
+
+        Returns:
+            np.ndarray: The descriptors divided by the archive's scale, fixing the scale on first use.
+        """
+
+        if self.scale is None:
+            scale = descriptors.std(axis=0)
+            self.scale = np.where(scale > 0, scale, 1.0)
+
+        return descriptors / self.scale
+
+    def novelty(self, descriptors: np.ndarray) -> np.ndarray:
+        """
+        Score a generation. Each descriptor's neighbours are the archive and the other descriptors of the
+        batch.
+
+        Parameters:
+            descriptors (np.ndarray): Array of shape (n, DESCRIPTOR_SIZE), one row per individual.
+
+        Returns:
+            np.ndarray: Mean distance of each descriptor to its k nearest neighbours.
+        """
+
+        from scipy.spatial.distance import cdist  # pylint: disable=import-outside-toplevel
+
+        points = self.scaled(descriptors)
+
+        # Distances to the rest of the batch and to the unindexed archive entries, by brute force
+        batch = cdist(points, points)
+        np.fill_diagonal(batch, np.inf)
+        candidates = [batch, cdist(points, self.entries[self.num_indexed:self.size])]
+
+        if self.tree is not None:
+            indexed, _ = self.tree.query(points, k=min(self.k, self.num_indexed))
+            candidates.append(indexed.reshape(len(points), -1))
+
+        distances = np.concatenate(candidates, axis=1)
+        k = min(self.k, distances.shape[1] - 1)
+
+        if k < 1:
+            return np.zeros(len(points))
+
+        nearest = np.partition(distances, k - 1, axis=1)[:, :k]
+
+        return nearest.mean(axis=1)
+
+    def add(self, descriptors: np.ndarray):
+        """
+        Add descriptors to the archive, rebuilding the tree if enough entries are unindexed.
+
+        Parameters:
+            descriptors (np.ndarray): Array of shape (n, DESCRIPTOR_SIZE).
+        """
+
+        points = self.scaled(descriptors)
+
+        if self.size + len(points) > len(self.entries):
+            capacity = max(2 * len(self.entries), self.size + len(points))
+            self.entries = np.concatenate([self.entries[:self.size], np.empty((capacity - self.size, DESCRIPTOR_SIZE))])
+
+        self.entries[self.size:self.size + len(points)] = points
+        self.size += len(points)
+
+        if self.size - self.num_indexed >= self.rebuild_interval:
+            self.rebuild()
+
+    def rebuild(self):
+        """
+        Rebuilds the tree over every entry in the archive.
+        """
+
+        from scipy.spatial import cKDTree  # pylint: disable=import-outside-toplevel
+
+        self.tree = cKDTree(self.entries[:self.size])
+        self.num_indexed = self.size
+
+    def __len__(self) -> int:
+        return self.size
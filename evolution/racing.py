@@ -0,0 +1,45 @@
+"""
+Racing (successive halving) of offspring over growth fidelities. Every offspring is first grown for a few
+iterations and scored, only the best fraction goes on to be grown further, and so on until the survivors
+are grown for the full iters_per_run. Growth is deterministic, so a mesh grown for k iterations is the
+start of the same mesh grown for more.
+
+October 19th, 2026
+"""
+
+import math
+
+
+def fidelity_levels(iters_per_run: int, levels: int) -> list[int]:
+    """
+    Get the number of iterations grown at each racing level. Each level grows twice as far as the one
+    before it, and the last grows the full iters_per_run.
+
+    Parameters:
+        iters_per_run (int): Number of grammar rules applied at full fidelity.
+        levels (int): Number of racing levels.
+
+    Returns:
+        list[int]: Increasing iteration counts, ending with iters_per_run.
+    """
+
+    iters = [max(iters_per_run // 2**(levels - 1 - level), 1) for level in range(levels)]
+
+    return sorted(set(iters))
+
+
+def num_survivors(count: int, keep: float, minimum: int = 1) -> int:
+    """
+    Get how many racers move on to the next level.
+
+    Parameters:
+        count (int): Number of racers at this level.
+        keep (float): Fraction of racers to keep.
+        minimum (int): Least number of racers to keep, so there are enough full-fidelity individuals to
+                       pick the elites from.
+
+    Returns:
+        int: Number of survivors.
+    """
+
+    return min(count, max(math.ceil(count * keep), minimum, 1))
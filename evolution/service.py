@@ -0,0 +1,331 @@
+"""
+A long-lived evaluation service. Keeps a pool of warm worker processes around so that scoring a few
+grammars from a script or notebook doesn't pay for a Python startup and the heavy imports every time.
+
+The service listens on a TCP ("host:port") or Unix ("unix:/path/to.sock") socket and speaks newline
+delimited JSON. A request is one line:
+    {"grammars": [{"lhs0": "A", "operation0": "grow", "rhs0": "BCD", ...}, ...],
+     "iters_per_run": 100, "check_collision": true, "fitness_function": "dist_to_point"}
+Grammars use the Grammar.to_dict() format, and the other keys default to default_args. The service
+answers with one {"index": i, "fitness": f} line per grammar as soon as it is scored ({"index": i,
+"error": "..."} if it failed), in completion order, followed by {"done": true}. A malformed request is
+answered with one {"error": "..."} line followed by {"done": true}, and the connection stays open.
+
+Start the service with:
+    python -m evolution.service --address 127.0.0.1:50800 --workers 8
+
+October 19th, 2026
+"""
+
+import json
+import socket
+import asyncio
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from model.grammar import Grammar
+from evolution.evaluator import evaluate_rules, warm_worker
+import default_args as D
+
+STREAM_LIMIT = 2**24 # Longest request line in bytes
+REQUEST_TYPES = {"iters_per_run": int, "check_collision": bool, "fitness_function": str} # Optional request keys
+
+
+def split_address(address: str) -> tuple:
+    """
+    Split a service address.
+
+    Parameters:
+        address (str): "host:port" or "unix:/path/to.sock".
+
+    Returns:
+        tuple: ("unix", path) or ("tcp", host, port).
+    """
+
+    if address.startswith("unix:"):
+        return ("unix", address[len("unix:"):])
+
+    host, port = address.rsplit(":", 1)
+    return ("tcp", host, int(port))
+
+
+def check_request(request) -> dict:
+    """
+    Checks a decoded request line before anything is evaluated.
+
+    Parameters:
+        request: The decoded request line.
+
+    Returns:
+        dict: The request.
+
+    Raises:
+        ValueError: If the request isn't an object with a list of grammar dicts, or an optional key has the
+                    wrong type.
+    """
+
+    if not isinstance(request, dict):
+        raise ValueError("Expected a JSON object, got {}".format(type(request).__name__))
+
+    grammars = request.get("grammars")
+    if not isinstance(grammars, list) or not all(isinstance(rules, dict) for rules in grammars):
+        raise ValueError('Expected "grammars" to be a list of grammars in the Grammar.to_dict() format')
+
+    for key, expected in REQUEST_TYPES.items():
+        if key in request and type(request[key]) is not expected:
+            raise ValueError('Expected "{}" to be {}, got {}'.format(key, expected.__name__, json.dumps(request[key])))
+
+    return request
+
+
+class EvaluationService:
+    """
+    asyncio server that evaluates batches of grammars on a pre-warmed process pool.
+    """
+
+    def __init__(self, address: str, workers: int):
+        """
+        Returns an EvaluationService and starts its workers.
+
+        Parameters:
+            address (str): "host:port" or "unix:/path/to.sock" to listen on.
+            workers (int): Number of worker processes.
+        """
+
+        self.address = address
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=warm_worker)
+
+        # Start every worker now rather than on the first request
+        for future in [self.executor.submit(warm_worker) for i in range(workers)]:
+            future.result()
+
+    async def serve(self):
+        """
+        Listen for clients until cancelled.
+        """
+
+        kind, *where = split_address(self.address)
+
+        if kind == "unix":
+            server = await asyncio.start_unix_server(self.handle_client, path=where[0], limit=STREAM_LIMIT)
+        else:
+            server = await asyncio.start_server(self.handle_client, host=where[0], port=where[1],
+                                                limit=STREAM_LIMIT)
+
+        print("Evaluation service listening on {}".format(self.address))
+
+        async with server:
+            await server.serve_forever()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Answer every request a client sends until it disconnects.
+
+        Parameters:
+            reader (asyncio.StreamReader): Stream the requests come in on.
+            writer (asyncio.StreamWriter): Stream the results go out on.
+        """
+
+        try:
+            while line := await reader.readline():
+                try:
+                    request = check_request(json.loads(line))
+                except ValueError as e: # Including json.JSONDecodeError
+                    writer.write((json.dumps({"error": "Bad request: {}".format(e)}) + "\n").encode())
+                    writer.write((json.dumps({"done": True}) + "\n").encode())
+                    await writer.drain()
+                    continue
+
+                await self.handle_request(request, writer)
+        except ConnectionError as e:
+            print("Dropped client: {}".format(e))
+        finally:
+            writer.close()
+
+    async def handle_request(self, request: dict, writer: asyncio.StreamWriter):
+        """
+        Evaluate one batch and stream the fitnesses back as they complete.
+
+        Parameters:
+            request (dict): The decoded request line, see check_request().
+            writer (asyncio.StreamWriter): Stream the results go out on.
+        """
+
+        loop = asyncio.get_running_loop()
+        iters_per_run = request.get("iters_per_run", D.ITERS_PER_RUN)
+        check_collision = request.get("check_collision", D.CHECK_COLLISION)
+        fitness_function = request.get("fitness_function", D.FITNESS_FUNCTION)
+
+        async def evaluate(index: int, rules: dict) -> dict:
+            try:
+                fitness, _ = await loop.run_in_executor(self.executor, evaluate_rules, rules, iters_per_run,
+                                                        check_collision, fitness_function)
+                return {"index": index, "fitness": fitness}
+            except Exception as e:  # pylint: disable=broad-except
+                return {"index": index, "error": repr(e)}
+
+        tasks = [evaluate(index, rules) for index, rules in enumerate(request["grammars"])]
+
+        for next_result in asyncio.as_completed(tasks):
+            writer.write((json.dumps(await next_result) + "\n").encode())
+            await writer.drain()
+
+        writer.write((json.dumps({"done": True}) + "\n").encode())
+        await writer.drain()
+
+    def shutdown(self):
+        """
+        Stops the worker processes.
+        """
+
+        self.executor.shutdown()
+
+
+class ServiceClient:
+    """
+    Blocking client for an EvaluationService.
+    """
+
+    def __init__(self, address: str):
+        """
+        Connects to a running service.
+
+        Parameters:
+            address (str): "host:port" or "unix:/path/to.sock" of the service.
+        """
+
+        kind, *where = split_address(address)
+
+        if kind == "unix":
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.connect(where[0])
+        else:
+            self.socket = socket.create_connection((where[0], where[1]))
+
+        self.stream = self.socket.makefile("rwb")
+
+    def evaluate(self, grammars: list, iters_per_run: int = None, check_collision: bool = None,
+                 fitness_function: str = None):
+        """
+        Evaluate grammars, yielding fitnesses as the service finishes them.
+
+        Parameters:
+            grammars (list): Grammar objects or dicts in the Grammar.to_dict() format.
+            iters_per_run (int): Number of grammar rules to apply. Defaults to the service's default.
+            check_collision (bool): Whether to check for collision. Defaults to the service's default.
+            fitness_function (str): What fitness function to use. Defaults to the service's default.
+
+        Yields:
+            tuple[int, float]: The index of a grammar in grammars and its fitness, in completion order.
+
+        Raises:
+            RuntimeError: If the service rejected the request or failed to evaluate a grammar. Raised once
+                          every response to the request was read, so the connection can take the next
+                          request.
+        """
+
+        request = {"grammars": [g.to_dict() if isinstance(g, Grammar) else g for g in grammars]}
+        optional = {"iters_per_run": iters_per_run, "check_collision": check_collision,
+                    "fitness_function": fitness_function}
+        request.update({key: value for key, value in optional.items() if value is not None})
+
+        self.stream.write((json.dumps(request) + "\n").encode())
+        self.stream.flush()
+
+        error = None
+        done = False
+
+        try:
+            for line in self.stream:
+                response = json.loads(line)
+
+                if response.get("done"):
+                    done = True
+                    break
+                if "error" in response:
+                    if error is None and "index" not in response:
+                        error = RuntimeError("Service rejected the request: {}".format(response["error"]))
+                    elif error is None:
+                        error = RuntimeError("Service failed to evaluate grammar {}: {}".format(
+                                             response["index"], response["error"]))
+                elif error is None:
+                    yield response["index"], response["fitness"]
+        finally:
+            if not done:
+                done = self.drain() # The caller stopped early, so skip the rest of this request's responses
+
+        if not done:
+            raise ConnectionError("Evaluation service closed the connection.")
+        if error is not None:
+            raise error
+
+    def drain(self) -> bool:
+        """
+        Reads and discards responses up to the end of the current request.
+
+        Returns:
+            bool: Whether the end of the request was reached, False if the connection closed first.
+        """
+
+        for line in self.stream:
+            if json.loads(line).get("done"):
+                return True
+
+        return False
+
+    def evaluate_all(self, grammars: list, iters_per_run: int = None, check_collision: bool = None,
+                     fitness_function: str = None) -> list[float]:
+        """
+        Evaluate grammars and wait for all of them.
+
+        Parameters:
+            grammars (list): Grammar objects or dicts in the Grammar.to_dict() format.
+            iters_per_run (int): Number of grammar rules to apply. Defaults to the service's default.
+            check_collision (bool): Whether to check for collision. Defaults to the service's default.
+            fitness_function (str): What fitness function to use. Defaults to the service's default.
+
+        Returns:
+            list[float]: The fitness of each grammar, in order.
+        """
+
+        fitnesses = [None] * len(grammars)
+
+        for index, fitness in self.evaluate(grammars, iters_per_run, check_collision, fitness_function):
+            fitnesses[index] = fitness
+
+        return fitnesses
+
+    def close(self):
+        """
+        Disconnects from the service.
+        """
+
+        self.stream.close()
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Serve grammar evaluations')
+    parser.add_argument('--address',
+                        type=str,
+                        help='"host:port" or "unix:/path/to.sock" to listen on',
+                        default=D.SERVICE_ADDRESS)
+    parser.add_argument('--workers',
+                        type=int,
+                        help='number of worker processes',
+                        default=D.SERVICE_WORKERS)
+    args = parser.parse_args()
+
+    service = EvaluationService(args.address, args.workers)
+
+    try:
+        asyncio.run(service.serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.shutdown()
@@ -0,0 +1,168 @@
+"""
+Pass grown meshes from worker processes to the parent through shared memory instead of pickling them.
+
+A worker writes a mesh's vertex and face arrays into one multiprocessing.shared_memory block and returns
+a small SharedMeshHandle. The parent attaches to the block with SharedMesh, reads the arrays without
+copying them, and unlinks the block with SharedMesh.release() once it is done.
+
+October 19th, 2026
+"""
+
+from dataclasses import dataclass
+from multiprocessing import shared_memory, resource_tracker
+import numpy as np
+from model.tetrahedral_mesh import CompactMesh, export_arrays
+
+VERTEX_DTYPE = np.float64
+FACE_DTYPE = np.int64
+
+
+@dataclass(frozen=True)
+class SharedMeshHandle:
+    """
+    Small, picklable reference to a mesh stored in a shared memory block.
+
+    Attributes:
+        name (str): Name of the shared memory block.
+        num_vertices (int): Number of vertices in the mesh. The block starts with num_vertices * 3 float64s.
+        num_faces (int): Number of faces in the mesh. The vertices are followed by num_faces * 3 int64s.
+    """
+    name: str
+    num_vertices: int
+    num_faces: int
+
+    def vertices_nbytes(self) -> int:
+        """
+        Returns:
+            int: Size of the vertex array in bytes.
+        """
+
+        return self.num_vertices * 3 * np.dtype(VERTEX_DTYPE).itemsize
+
+    def nbytes(self) -> int:
+        """
+        Returns:
+            int: Size of the whole mesh in bytes.
+        """
+
+        return self.vertices_nbytes() + self.num_faces * 3 * np.dtype(FACE_DTYPE).itemsize
+
+
+def share_mesh(mesh) -> SharedMeshHandle:
+    """
+    Copies a mesh into a new shared memory block. Called in the worker process. The block outlives the
+    worker and must be released by whoever receives the handle.
+
+    Parameters:
+        mesh (TetrahedralMesh): The mesh to share. Anything with collect_vertices() and collect_faces() works.
+
+    Returns:
+        SharedMeshHandle: Handle to the shared mesh.
+    """
+
+    vertices = np.asarray(mesh.collect_vertices(), dtype=VERTEX_DTYPE).reshape(-1, 3)
+    faces = np.asarray(mesh.collect_faces(), dtype=FACE_DTYPE).reshape(-1, 3)
+
+    handle_size = vertices.nbytes + faces.nbytes
+    shm = shared_memory.SharedMemory(create=True, size=max(handle_size, 1))
+
+    # The block belongs to the receiving process, so stop this process from unlinking it on exit
+    resource_tracker.unregister(shm._name, "shared_memory")  # pylint: disable=protected-access
+
+    handle = SharedMeshHandle(shm.name, len(vertices), len(faces))
+
+    np.ndarray(vertices.shape, VERTEX_DTYPE, buffer=shm.buf)[:] = vertices
+    np.ndarray(faces.shape, FACE_DTYPE, buffer=shm.buf, offset=handle.vertices_nbytes())[:] = faces
+
+    shm.close()
+
+    return handle
+
+
+class SharedMesh:
+    """
+    Parent-side, zero-copy view of a mesh in a shared memory block.
+
+    Attributes:
+        handle (SharedMeshHandle): Handle of the shared mesh.
+        vertices (np.ndarray): Array of shape (num_vertices, 3) backed by the shared block.
+        faces (np.ndarray): Array of shape (num_faces, 3) backed by the shared block.
+    """
+
+    def __init__(self, handle: SharedMeshHandle):
+        """
+        Attaches to the shared memory block of a handle.
+
+        Parameters:
+            handle (SharedMeshHandle): Handle returned by share_mesh().
+        """
+
+        self.handle = handle
+        self.shm = shared_memory.SharedMemory(name=handle.name)
+        self.vertices = np.ndarray((handle.num_vertices, 3), VERTEX_DTYPE, buffer=self.shm.buf)
+        self.faces = np.ndarray((handle.num_faces, 3), FACE_DTYPE, buffer=self.shm.buf,
+                                offset=handle.vertices_nbytes())
+
+    def get_num_faces(self) -> int:
+        """
+        Get the number of faces in the mesh.
+
+        Returns:
+            int: The number of faces in the mesh.
+        """
+
+        return self.handle.num_faces
+
+    def export(self, extension: str, filename: str, folder: str = None):
+        """
+        Export the mesh to a file.
+
+        Parameters:
+            extension (str): File extension to use. Supports .stl and .obj
+            filename (str): Name of the file to export.
+            folder (str): Optionally, a folder to put the file in.
+        """
+
+        export_arrays(self.vertices, self.faces, extension, filename, folder)
+
+    def to_compact(self) -> CompactMesh:
+        """
+        Copies the mesh out of shared memory.
+
+        Returns:
+            CompactMesh: A copy of the mesh that doesn't depend on the shared block.
+        """
+
+        return CompactMesh(self.vertices.copy(), self.faces.copy())
+
+    def release(self):
+        """
+        Detaches from and unlinks the shared block. The vertices and faces arrays are unusable afterwards.
+        Safe to call more than once.
+        """
+
+        if self.shm is None:
+            return
+
+        self.vertices = None
+        self.faces = None
+        self.shm.close()
+        self.shm.unlink()
+        self.shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+def release_handle(handle: SharedMeshHandle):
+    """
+    Unlinks the shared block of a handle that the parent doesn't want to read.
+
+    Parameters:
+        handle (SharedMeshHandle): Handle returned by share_mesh().
+    """
+
+    SharedMesh(handle).release()
@@ -0,0 +1,217 @@
+"""
+Asynchronous steady-state evolution.
+
+Instead of waiting for a whole generation to be evaluated, a new child is bred from the current elites
+and dispatched as soon as any worker finishes. Slow grammars then only hold up their own worker.
+
+October 19th, 2026
+"""
+
+import time
+import datetime as dt
+from concurrent.futures import FIRST_COMPLETED, wait
+from model.grammar import Grammar
+from model.tetrahedral_mesh import OPERATIONS
+from evolution.evaluator import ParallelEvaluator
+from evolutionary_alg import EvolutionRun, GENOME_INDEX, FITNESS_INDEX
+
+
+class SteadyStateRun(EvolutionRun):
+    """
+    A steady-state variant of EvolutionRun. Evaluates generations * population_size genomes in total.
+
+    The population holds the best population_size individuals evaluated so far. The first population_size
+    genomes are random, and every later genome is a child bred from the top num_elites individuals at the
+    moment it is dispatched. Progress is logged by evaluation count, once per population_size evaluations.
+    """
+
+    mode = "steady_state"
+    progress_column = "evaluation"
+    default_checkpoint_interval = 0
+
+    def __init__(self, *args, **kwargs):
+        """
+        Returns a SteadyStateRun instance. Takes the same arguments as EvolutionRun, but can't resume from a
+        checkpoint since the order evaluations finish in isn't reproducible. Settings the steady-state loop
+        doesn't implement raise a ValueError rather than being ignored.
+        """
+
+        if kwargs.get("resume"):
+            raise ValueError("Steady-state runs can't be resumed.")
+        if kwargs.get("checkpoint_interval") not in (None, 0):
+            raise ValueError("Steady-state runs can't be checkpointed, since they can't be resumed.")
+        if kwargs.get("novelty_weight", 0) > 0:
+            raise ValueError("Steady-state runs don't support novelty search, which ranks whole generations.")
+        if kwargs.get("warm_start"):
+            raise ValueError("Steady-state runs don't support warm starts, they start from random genomes.")
+        if kwargs.get("racing_levels", 1) > 1:
+            raise ValueError("Steady-state runs don't support racing, which races whole generations.")
+        if kwargs.get("surrogate_oversample", 1) > 1:
+            raise ValueError("Steady-state runs don't support the surrogate, which screens whole generations.")
+        if kwargs.get("broker_address") not in (None, "None"):
+            raise ValueError("Steady-state runs evaluate on local workers and don't support a broker.")
+        if kwargs.get("schedule", "fifo") != "fifo":
+            raise ValueError("Steady-state runs dispatch one genome at a time, so only the \"fifo\" schedule applies.")
+        if kwargs.get("export_queue", 0) > 0:
+            raise ValueError("Steady-state runs don't support the export queue.")
+
+        super().__init__(*args, **kwargs)
+
+        self.random_dispatched = 0
+        self.children = []
+
+    def run(self):
+        """
+        Run the steady-state evolutionary algorithm.
+        """
+
+        self.last_gen_clock = time.time()
+        self.run_start = time.time()
+        self.seed_generators()
+
+        self.evaluator = ParallelEvaluator(max(self.workers, 1), self.iters_per_run, self.check_collision,
+                                           self.fitness_function)
+
+        budget = self.generations * self.population_size
+        in_flight = {}
+        dispatched = 0
+
+        try:
+            # Fill every worker
+            while dispatched < min(max(self.workers, 1), budget):
+                self.dispatch(in_flight)
+                dispatched += 1
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    genome = in_flight.pop(future)
+                    fitness, handle = future.result()
+                    self.insert(genome, fitness, handle)
+
+                    if self.evaluations % self.population_size == 0:
+                        self.log_progress(budget)
+
+                    if self.stop_reason is None:
+                        self.stop_reason = self.check_stop()
+
+                    # After stopping, evaluations already in flight still finish
+                    if dispatched < budget and self.stop_reason is None:
+                        self.dispatch(in_flight)
+                        dispatched += 1
+
+            # A run that stopped early has evaluations since the last log
+            if self.evaluations % self.population_size != 0:
+                self.log_progress(budget)
+        finally:
+            self.close()
+
+        self.finish()
+
+    def dispatch(self, in_flight: dict):
+        """
+        Sends the next genome to the workers.
+
+        Parameters:
+            in_flight (dict): Maps futures of genomes being evaluated to their genomes. Updated in place.
+        """
+
+        genome = self.next_genome()
+        future = self.evaluator.submit(genome, share_mesh=self.mesh_cache is not None)
+        in_flight[future] = genome
+
+    def next_genome(self) -> Grammar:
+        """
+        Gets the next genome to evaluate: a random one while the initial population is being filled, and
+        a child of the current elites afterwards.
+
+        Returns:
+            Grammar: The genome to evaluate next.
+        """
+
+        # With more workers than population_size there's nothing to breed from until a result is in
+        if self.random_dispatched < self.population_size or not self.population:
+            self.random_dispatched += 1
+            return Grammar(self.alphabet, OPERATIONS).generate_random()
+
+        # Breed in pairs so crossover still happens
+        if not self.children:
+            elites = self.population[:self.num_elites]
+            self.children = [individual[GENOME_INDEX] for individual in self.breed(elites, 2)]
+
+        return self.children.pop()
+
+    def insert(self, genome: Grammar, fitness: float, handle):
+        """
+        Inserts an evaluated genome into the population, dropping the worst individual if it is full.
+
+        Parameters:
+            genome (Grammar): The evaluated genome.
+            fitness (float): The genome's fitness.
+            handle (SharedMeshHandle): Handle to the genome's shared mesh, or None.
+        """
+
+        self.population.append([genome, fitness])
+        self.sort_population()
+
+        if len(self.population) > self.population_size:
+            self.population.pop()
+
+        self.evaluations += 1
+        self.current_gen = self.evaluations // self.population_size
+        self.offer_shared_mesh(genome, fitness, handle)
+
+    def log_progress(self, budget: int):
+        """
+        Records, prints, and exports the current state of the population.
+
+        Parameters:
+            budget (int): Total number of evaluations in this run.
+        """
+
+        if self.export_generations:
+            self.export_current_population()
+
+        self.record_best(self.evaluations)
+
+        # Print fitnesses
+        print("")
+        print("Evaluations {}".format(self.evaluations))
+        print("Fitnesses:", [sublist[FITNESS_INDEX] for sublist in self.population])
+
+        # Print grammar
+        print(self.population[0][GENOME_INDEX])
+
+        # Export best mesh
+        if self.export_stl:
+            self.export_best_mesh()
+
+        ### Time estimate
+
+        last_log_time = time.time() - self.last_gen_clock
+        self.last_gen_clock = time.time()
+        logs_remaining = (budget - self.evaluations) // self.population_size
+        print("Last {} evals time: {} | Evals remaining: {} | Time est: {}".
+              format(self.population_size, dt.timedelta(seconds=int(last_log_time)), budget - self.evaluations,
+                     dt.timedelta(seconds=int(last_log_time * logs_remaining))))
+
+        self.export_run()
+
+    def log_name(self) -> str:
+        """
+        Name of the current point in the run, used to name exported files.
+
+        Returns:
+            str: "eval" followed by the current evaluation count.
+        """
+
+        return "eval" + str(self.evaluations)
+
+    def progress(self) -> int:
+        """
+        Returns:
+            int: The current evaluation count.
+        """
+
+        return self.evaluations
@@ -0,0 +1,159 @@
+"""
+A cheap surrogate of the fitness function. Offspring are bred in excess, the surrogate predicts their
+fitness from their rules alone, and only the most promising ones are grown and scored.
+
+The surrogate is ridge regression on a one-hot encoding of the rules, trained online on every
+(genome, fitness) pair evaluated so far. Only the normal equations are kept, so training costs the same
+no matter how many pairs were seen.
+
+October 19th, 2026
+"""
+
+import numpy as np
+from model.grammar import Grammar
+
+RIDGE_ALPHA = 1.0 # Strength of the ridge penalty
+
+
+class RuleEncoder:
+    """
+    Encodes a genome as one-hot vectors of each rule's operation and rhs labels, in alphabet order.
+    """
+
+    def __init__(self, alphabet: list[str], operations: dict[str, int]):
+        """
+        Returns a RuleEncoder.
+
+        Parameters:
+            alphabet (list[str]): Possible labels for faces.
+            operations (dict[str, int]): Operations with the number of rhs labels each takes.
+        """
+
+        self.alphabet = alphabet
+        self.operations = list(operations)
+        self.labels = {label: i for i, label in enumerate(alphabet)}
+        self.max_rhs = max(operations.values())
+        self.rule_size = len(self.operations) + self.max_rhs * len(alphabet)
+        self.size = len(alphabet) * self.rule_size + 1 # Plus a constant feature for the intercept
+
+    def encode(self, genome: Grammar) -> np.ndarray:
+        """
+        Encode one genome.
+
+        Parameters:
+            genome (Grammar): The genome to encode.
+
+        Returns:
+            np.ndarray: The encoding, a vector of length self.size.
+        """
+
+        features = np.zeros(self.size)
+        features[-1] = 1
+
+        for i, lhs in enumerate(self.alphabet):
+            start = i * self.rule_size
+            features[start + self.operations.index(genome.get_rule_operation(lhs))] = 1
+
+            for position, label in enumerate(genome.get_rule_rhs(lhs)):
+                features[start + len(self.operations) + position * len(self.alphabet) + self.labels[label]] = 1
+
+        return features
+
+    def encode_all(self, genomes: list[Grammar]) -> np.ndarray:
+        """
+        Encode several genomes.
+
+        Parameters:
+            genomes (list[Grammar]): The genomes to encode.
+
+        Returns:
+            np.ndarray: One row per genome.
+        """
+
+        return np.array([self.encode(genome) for genome in genomes]).reshape(len(genomes), self.size)
+
+
+class RidgeSurrogate:
+    """
+    Online ridge regression from rule encodings to fitness.
+    """
+
+    def __init__(self, encoder: RuleEncoder, alpha: float = RIDGE_ALPHA):
+        """
+        Returns an untrained RidgeSurrogate.
+
+        Parameters:
+            encoder (RuleEncoder): Encoder for the genomes.
+            alpha (float): Strength of the ridge penalty.
+        """
+
+        self.encoder = encoder
+        self.alpha = alpha
+        self.gram = np.zeros((encoder.size, encoder.size)) # Sum of x x^T
+        self.moment = np.zeros(encoder.size) # Sum of x * fitness
+        self.num_samples = 0
+        self.weights = None
+
+    def add(self, genomes: list[Grammar], fitnesses: list[float]):
+        """
+        Train on newly evaluated genomes.
+
+        Parameters:
+            genomes (list[Grammar]): The evaluated genomes.
+            fitnesses (list[float]): Their fitnesses.
+        """
+
+        if not genomes:
+            return
+
+        features = self.encoder.encode_all(genomes)
+        self.gram += features.T @ features
+        self.moment += features.T @ np.asarray(fitnesses, dtype=float)
+        self.num_samples += len(genomes)
+        self.weights = None
+
+    def predict(self, genomes: list[Grammar]) -> np.ndarray:
+        """
+        Predict the fitness of genomes.
+
+        Parameters:
+            genomes (list[Grammar]): The genomes to predict.
+
+        Returns:
+            np.ndarray: The predicted fitnesses.
+        """
+
+        if self.weights is None:
+            self.weights = np.linalg.solve(self.gram + self.alpha * np.eye(self.encoder.size), self.moment)
+
+        return self.encoder.encode_all(genomes) @ self.weights
+
+    def is_trained(self) -> bool:
+        """
+        Returns:
+            bool: Whether the surrogate has seen any samples.
+        """
+
+        return self.num_samples > 0
+
+
+def rank_correlation(predicted: list[float], actual: list[float]) -> float:
+    """
+    Spearman rank correlation between predicted and actual fitness. Screening only needs the surrogate to
+    order candidates, so this is the accuracy that matters.
+
+    Parameters:
+        predicted (list[float]): Predicted fitnesses.
+        actual (list[float]): Actual fitnesses.
+
+    Returns:
+        float: The correlation, or None if either side has fewer than two distinct values.
+    """
+
+    predicted_ranks = np.argsort(np.argsort(predicted))
+    actual_ranks = np.argsort(np.argsort(actual))
+
+    if len(set(predicted)) < 2 or len(set(actual)) < 2:
+        return None
+
+    return float(np.corrcoef(predicted_ranks, actual_ranks)[0, 1])
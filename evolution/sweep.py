@@ -0,0 +1,187 @@
+"""
+Hyperparameter sweeps. Every (configuration, repeat) pair is one EvolutionRun, and all of them are packed
+onto one process pool and stored under one batch directory.
+
+A sweep is described by a JSON spec, either a grid:
+    {"grid": {"mutation_rate": [0.1, 0.2], "crossover_strategy": ["one", "uniform"]}, "repeats": 3}
+or a random search:
+    {"random": {"mutation_rate": {"uniform": [0.05, 0.5]}, "num_elites": {"randint": [2, 10]},
+                "crossover_strategy": {"choice": ["one", "two", "uniform"]}},
+     "samples": 20, "repeats": 3}
+Keys are EvolutionRun arguments, see evolutionary_alg.run_settings(), with mutation_rate accepted for
+mutuation_rate. Random values are drawn from
+"uniform", "loguniform", "randint" (both ends included) or "choice". Settings not in the spec come from
+the command line. Repeat r of every configuration uses the same seed, so configurations are compared on
+the same random streams.
+
+October 19th, 2026
+"""
+
+import os
+import json
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from evolutionary_alg import (run_settings, derive_seeds, resolve_batch_path, perform_run, finished_summary,
+                              warm_worker)
+from evolution.checkpoint import is_finished
+
+ALIASES = {"mutation_rate": "mutuation_rate"} # EvolutionRun spells its mutation rate argument differently
+DISTRIBUTIONS = ["uniform", "loguniform", "randint", "choice"]
+
+
+def sample_value(distribution: dict, rng: np.random.Generator):
+    """
+    Draw one value for a random-search parameter.
+
+    Parameters:
+        distribution (dict): One of {"uniform": [low, high]}, {"loguniform": [low, high]},
+                             {"randint": [low, high]} or {"choice": [values]}.
+        rng (np.random.Generator): Generator to draw from.
+
+    Returns:
+        The drawn value, as a plain Python value.
+    """
+
+    (kind, values), = distribution.items()
+
+    match kind:
+        case "uniform":
+            return float(rng.uniform(values[0], values[1]))
+        case "loguniform":
+            return float(np.exp(rng.uniform(np.log(values[0]), np.log(values[1]))))
+        case "randint":
+            return int(rng.integers(values[0], values[1], endpoint=True))
+        case "choice":
+            return values[int(rng.integers(len(values)))]
+        case _:
+            raise ValueError("Unexpected distribution {}. Try one of {}".format(kind, DISTRIBUTIONS))
+
+
+def expand_spec(spec: dict, seed: int = None) -> list[dict]:
+    """
+    Turn a sweep spec into the configurations to run.
+
+    Parameters:
+        spec (dict): The sweep spec, see the module docstring.
+        seed (int): Seed for drawing random-search configurations.
+
+    Returns:
+        list[dict]: The configurations, each a dict of parameter names to values.
+    """
+
+    if "grid" in spec:
+        names = list(spec["grid"])
+        configs = [dict(zip(names, values)) for values in itertools.product(*spec["grid"].values())]
+    elif "random" in spec:
+        rng = np.random.default_rng(seed)
+        configs = [{name: sample_value(distribution, rng) for name, distribution in spec["random"].items()}
+                   for i in range(spec.get("samples", 10))]
+    else:
+        raise ValueError('Expected the sweep spec to have a "grid" or "random" key.')
+
+    valid = set(run_settings()) - {"run_name", "data_path", "seed", "resume"}
+    unknown = {name for config in configs for name in config if ALIASES.get(name, name) not in valid}
+    if unknown:
+        raise ValueError("Unexpected sweep parameters {}. Expected any of {}".format(sorted(unknown), sorted(valid)))
+
+    return configs
+
+
+def run_sweep(spec: dict, batch_name: str = None, batch_path: str = None, workers: int = 1, seed: int = None,
+              mode: str = "generational", resume: bool = False) -> str:
+    """
+    Run every (configuration, repeat) pair of a sweep on a process pool. Run i of configuration c is stored
+    in configC_runI under the batch directory, next to sweep.json with the spec and seeds, runs.csv with one
+    row per run, and summary.csv with the final and best fitness of each configuration.
+
+    Parameters:
+        spec (dict): The sweep spec, see the module docstring.
+        batch_name (str): Name of the batch directory. Defaults to timestamp.
+        batch_path (str): Where to save the batch. Defaults to /batches/.
+        workers (int): Number of runs to perform at once.
+        seed (int): Seed to derive the random-search configurations and per-repeat seeds from. Drawn at
+                    random when None.
+        mode (str): "generational" or "steady_state".
+        resume (bool): Whether to continue an interrupted sweep, skipping runs that finished.
+
+    Returns:
+        str: The batch directory.
+    """
+
+    data_path = resolve_batch_path(batch_name, batch_path)
+    sweep_file = os.path.join(data_path, "sweep.json")
+
+    if resume and seed is None and os.path.exists(sweep_file):
+        with open(sweep_file) as f:
+            seed = json.load(f)["seed"]
+
+    if seed is None:
+        seed = int(np.random.SeedSequence().generate_state(1)[0])
+
+    repeats = spec.get("repeats", 1)
+    config_seed, *seeds = derive_seeds(seed, repeats + 1)
+    configs = expand_spec(spec, config_seed)
+
+    with open(sweep_file, 'w') as f:
+        json.dump({"seed": seed, "repeat_seeds": seeds, "mode": mode, "spec": spec, "configs": configs}, f, indent=4)
+
+    all_settings = []
+    for c, config in enumerate(configs):
+        for r in range(repeats):
+            settings = run_settings()
+            settings.update({ALIASES.get(name, name): value for name, value in config.items()})
+            settings.update(run_name="config{}_run{}".format(c, r), data_path=data_path, seed=seeds[r],
+                            resume=resume)
+            all_settings.append((c, r, settings))
+
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_worker) as executor:
+        futures = []
+        for c, r, settings in all_settings:
+            if resume and is_finished(os.path.join(data_path, settings["run_name"])):
+                futures.append((c, r, None, finished_summary(settings)))
+            else:
+                futures.append((c, r, executor.submit(perform_run, settings, mode), None))
+
+        for c, r, future, summary in futures:
+            if future is not None:
+                summary = future.result()
+                print("{} finished with best fitness {}".format(summary["run_name"], summary["best_fitness"]))
+
+            rows.append(dict(configs[c], config=c, repeat=r, **summary))
+
+    sort_reverse = all_settings[0][2]["sort_reverse"] if all_settings else False
+    export_summary(data_path, pd.DataFrame(rows), list(configs[0]) if configs else [], sort_reverse)
+
+    return data_path
+
+
+def export_summary(data_path: str, runs: pd.DataFrame, parameters: list[str], sort_reverse: bool):
+    """
+    Writes runs.csv with one row per run, and summary.csv with the mean, spread and best of the final and
+    best-ever fitness of each configuration, best configuration first.
+
+    Parameters:
+        data_path (str): The batch directory.
+        runs (pd.DataFrame): One row per run, with the configuration's parameters and the run's summary.
+        parameters (list[str]): Names of the swept parameters.
+        sort_reverse (bool): Whether a higher fitness is better.
+    """
+
+    runs.to_csv(os.path.join(data_path, "runs.csv"), index=False)
+
+    best = "max" if sort_reverse else "min"
+    summary = runs.groupby("config").agg(
+        **{name: (name, "first") for name in parameters},
+        runs=("run_name", "count"),
+        final_mean=("best_fitness", "mean"),
+        final_std=("best_fitness", "std"),
+        final_best=("best_fitness", best),
+        best_mean=("best_ever_fitness", "mean"),
+        best_best=("best_ever_fitness", best)
+    ).reset_index()
+
+    summary = summary.sort_values("final_mean", ascending=not sort_reverse)
+    summary.to_csv(os.path.join(data_path, "summary.csv"), index=False)
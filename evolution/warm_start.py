@@ -0,0 +1,86 @@
+"""
+Seed the initial population of a run with grammars from earlier runs instead of starting from random.
+
+Grammars are read from run.csv or genX.csv files, the same format grow_mesh.read_csv() reads. The best
+ones across all files are kept, duplicates are dropped, and the fitnesses recorded next to them can be
+reused instead of evaluating the grammars again.
+
+October 19th, 2026
+"""
+
+from model.grammar import Grammar
+from model.tetrahedral_mesh import OPERATIONS
+
+
+def read_genomes(filepath: str, alphabet: list[str]) -> list:
+    """
+    Reads every grammar in a run.csv or genX.csv file. Grammars that don't have exactly one rule for each
+    label of the alphabet can't be grown by this run, and are skipped.
+
+    Parameters:
+        filepath (str): Path of the .csv file.
+        alphabet (list[str]): Possible labels for faces in this run.
+
+    Returns:
+        list[Grammar, float]: (genome, fitness) pairs in file order. The fitness is None if the file has no
+                              fitness column.
+    """
+
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    df = pd.read_csv(filepath, dtype=str, keep_default_na=False)
+    genomes = []
+    skipped = 0
+
+    for row in df.to_dict('records'):
+        genome = Grammar(alphabet, OPERATIONS)
+        genome.add_from_dict(row)
+
+        labels = set(alphabet)
+        rhs_labels = {label for lhs in genome.rules for label in genome.get_rule_rhs(lhs)}
+        if set(genome.rules) != labels or not rhs_labels <= labels:
+            skipped += 1
+            continue
+
+        fitness = float(row["fitness"]) if row.get("fitness", "") != "" else None
+        genomes.append([genome, fitness])
+
+    if skipped:
+        print("Skipped {} grammars in {} that don't match the alphabet {}".format(skipped, filepath, alphabet))
+
+    return genomes
+
+
+def load_seed_population(filepaths: list[str], count: int, alphabet: list[str], sort_reverse: bool) -> list:
+    """
+    Picks the best distinct grammars from earlier runs.
+
+    Parameters:
+        filepaths (list[str]): Paths of run.csv or genX.csv files.
+        count (int): Maximum number of grammars to pick.
+        alphabet (list[str]): Possible labels for faces in this run.
+        sort_reverse (bool): Whether a higher fitness is better.
+
+    Returns:
+        list[Grammar, float]: Up to count (genome, fitness) pairs, best first. Grammars without a recorded
+                              fitness come last, in file order.
+    """
+
+    best = {} # Genome key -> (genome, fitness), keeping the best fitness seen for each grammar
+    order = []
+
+    for filepath in filepaths:
+        for genome, fitness in read_genomes(filepath, alphabet):
+            if genome.key not in best:
+                best[genome.key] = [genome, fitness]
+                order.append(genome.key)
+            elif fitness is not None:
+                known = best[genome.key][1]
+                if known is None or (fitness > known if sort_reverse else fitness < known):
+                    best[genome.key][1] = fitness
+
+    scored = [best[key] for key in order if best[key][1] is not None]
+    unscored = [best[key] for key in order if best[key][1] is None]
+    scored.sort(key=lambda x: x[1], reverse=sort_reverse)
+
+    return (scored + unscored)[:count]
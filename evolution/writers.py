@@ -0,0 +1,138 @@
+"""
+Streaming .csv writers for run logs. run.csv gets one row appended per generation instead of being
+rewritten from the whole history, and generation files are written with the csv module instead of going
+through a pandas DataFrame.
+
+The files are byte-for-byte what DataFrame.to_csv(index=False) wrote before: a header row, "\n" line
+endings, floats in their shortest round-trip form and None as an empty field, so plot_utils and
+grow_mesh.py read them unchanged.
+
+October 19th, 2026
+"""
+
+import os
+import csv
+import numpy as np
+
+
+def csv_value(value):
+    """
+    Parameters:
+        value: A value to write to a .csv file.
+
+    Returns:
+        The value, with NumPy scalars turned into the Python number they hold so they are written the
+        way pandas writes them.
+    """
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    return value
+
+
+class CsvLog:
+    """
+    A .csv file that is created once and then only appended to.
+
+    Attributes:
+        file_path (str): Path of the file.
+        columns (list[str]): Column names, in order.
+        sync (bool): Whether to fsync after every write, so rows survive a crash of the machine.
+    """
+
+    def __init__(self, file_path: str, columns: list[str], sync: bool = True):
+        """
+        Returns a CsvLog. Nothing is written until create() or append().
+
+        Parameters:
+            file_path (str): Path of the file.
+            columns (list[str]): Column names, in order.
+            sync (bool): Whether to fsync after every write.
+        """
+
+        self.file_path = file_path
+        self.columns = columns
+        self.sync = sync
+
+    def create(self, rows: list[dict] = ()):
+        """
+        Writes the header and the given rows, replacing the file if it exists.
+
+        Parameters:
+            rows (list[dict]): Rows to start the file with. Missing columns are left empty.
+        """
+
+        self.write('w', rows, header=True)
+
+    def append(self, rows: list[dict]):
+        """
+        Appends rows to the file.
+
+        Parameters:
+            rows (list[dict]): Rows to append. Missing columns are left empty.
+        """
+
+        if rows:
+            self.write('a', rows)
+
+    def write(self, mode: str, rows: list[dict], header: bool = False):
+        """
+        Opens the file and writes rows to it, flushing them before it is closed.
+
+        Parameters:
+            mode (str): 'w' to replace the file, 'a' to append to it.
+            rows (list[dict]): Rows to write.
+            header (bool): Whether to write the header first.
+        """
+
+        with open(self.file_path, mode, newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=self.columns, lineterminator='\n')
+            if header:
+                writer.writeheader()
+            writer.writerows({column: csv_value(value) for column, value in row.items()} for row in rows)
+
+            f.flush()
+            if self.sync:
+                os.fsync(f.fileno())
+
+
+def write_csv(file_path: str, columns: list[str], rows: list[dict]):
+    """
+    Writes a whole .csv file at once, like DataFrame(rows, columns=columns).to_csv(file_path, index=False).
+
+    Parameters:
+        file_path (str): Path of the file.
+        columns (list[str]): Column names, in order.
+        rows (list[dict]): Rows of the file. Missing columns are left empty.
+    """
+
+    CsvLog(file_path, columns, sync=False).create(rows)
+
+
+def truncate_csv(file_path: str, column: str, end: int):
+    """
+    Drops the rows of a .csv log from a point on, leaving the header and earlier rows byte-for-byte as they
+    were. Does nothing if the file doesn't exist.
+
+    Parameters:
+        file_path (str): Path of the file.
+        column (str): Integer column the rows are logged by, like "generation".
+        end (int): Rows with column >= end are dropped.
+    """
+
+    if not os.path.exists(file_path):
+        return
+
+    with open(file_path, newline='') as f:
+        lines = f.read().splitlines(keepends=True)
+
+    if not lines:
+        return
+
+    index = next(csv.reader(lines[:1])).index(column)
+    kept = lines[:1] + [line for line in lines[1:] if int(next(csv.reader([line]))[index]) < end]
+
+    if len(kept) < len(lines):
+        with open(file_path, 'w', newline='') as f:
+            f.writelines(kept)
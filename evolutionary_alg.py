@@ -13,15 +13,33 @@ from datetime import datetime
 from pathlib import Path
 import os
 import json
+import csv
+import sqlite3
 import argparse
-import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from model.grammar import Grammar
 from model.tetrahedral_mesh import TetrahedralMesh, OPERATIONS
+from evolution.mesh_cache import MeshCache
+from evolution.evaluator import ParallelEvaluator, warm_worker
+from evolution.broker import BrokerEvaluator
+from evolution.shared_mesh import SharedMesh
+from evolution.racing import fidelity_levels, num_survivors
+from evolution.surrogate import RidgeSurrogate, RuleEncoder, rank_correlation
+from evolution.genome_matrix import GenomeMatrix, breed_genes
+from evolution.checkpoint import save_checkpoint, load_checkpoint, is_finished
+from evolution.warm_start import load_seed_population
+from evolution.novelty import NoveltyArchive, behaviour_descriptor
+from evolution.writers import CsvLog, write_csv, truncate_csv
+from evolution.archive import ArchiveWriter
+from evolution.export_queue import ExportQueue
+from evolution.catalog import register_run
 import default_args as D
 
 GENOME_INDEX = 0
 FITNESS_INDEX = 1
+INTEGER_FITNESS = ["num_faces"] # Fitness functions that return ints
+GENERATION_LOGS = ["racing.csv", "surrogate.csv", "novelty.csv", "costs.csv"] # Appended to once per generation
 
 def is_windows():
     """
@@ -55,15 +73,73 @@ def set_symlink(symlink_path: str, target_path: str):
             f"Warning: could not create symlink to latest_genome folder: {e}"
         )
 
+def genome_key(genome: Grammar) -> str:
+    """
+    Get a hashable key for a genome which is equal for genomes with identical rules.
+
+    Parameters:
+        genome (Grammar): The genome.
+
+    Returns:
+        str: The genome's packed key, cached on the genome.
+    """
+
+    return genome.key
+
+def compute_fitness(mesh: TetrahedralMesh, fitness_function: str) -> float:
+    """
+    Score a grown mesh.
+
+    Parameters:
+        mesh (TetrahedralMesh): The grown mesh.
+        fitness_function (str): What fitness function to use.
+
+    Returns:
+        float: The fitness of the mesh.
+    """
+
+    match fitness_function:
+        case "dist_to_point":
+            return mesh.dist_to_point(D.POINT)
+        case "out_there_score":
+            return mesh.out_there_score()
+        case "num_faces":
+            return mesh.get_num_faces()
+        case "hull_volume":
+            return mesh.get_hull()
+        case _:
+            raise ValueError("Unknown fitness function {}.".format(fitness_function))
+
 class EvolutionRun:
     """
     One run of an evolutionary algorithm to generate a tetrahedral mesh.
+
+    Attributes:
+        mode (str): Name of the evolution mode, saved in info.json.
+        progress_column (str): What the first column of run.csv counts.
+        default_checkpoint_interval (int): Checkpoint interval used when checkpoint_interval is None.
     """
 
+    mode = "generational"
+    progress_column = "generation"
+    default_checkpoint_interval = 5
+
     def __init__(self, generations: int, population_size: int, num_elites: int, iters_per_run: int, mutuation_rate: float, 
                  crossover_rate: float, crossover_strategy: str, fitness_function: str, sort_reverse: bool, check_collision: bool,
                  export_generations: bool, export_stl: bool, export_extension: str, alphabet: list[str], run_name: str = None,
-                 data_path: str = None):
+                 data_path: str = None, keep_meshes: int = D.KEEP_MESHES, workers: int = D.WORKERS, seed: int = None,
+                 broker_address: str = None, broker_authkey: str = D.BROKER_AUTHKEY,
+                 broker_timeout: float = D.BROKER_TIMEOUT, schedule: str = D.SCHEDULE, racing_levels: int = D.RACING_LEVELS,
+                 racing_keep: float = D.RACING_KEEP, surrogate_oversample: int = D.SURROGATE_OVERSAMPLE,
+                 genome_backend: str = D.GENOME_BACKEND, checkpoint_interval: int = D.CHECKPOINT_INTERVAL,
+                 resume: bool = False, target_fitness: float = D.TARGET_FITNESS, patience: int = D.PATIENCE,
+                 max_evaluations: int = D.MAX_EVALUATIONS, time_budget: float = D.TIME_BUDGET,
+                 warm_start: list[str] = D.WARM_START, warm_start_top: int = D.WARM_START_TOP,
+                 warm_start_fitness: bool = D.WARM_START_FITNESS, novelty_weight: float = D.NOVELTY_WEIGHT,
+                 novelty_k: int = D.NOVELTY_K, novelty_add: int = D.NOVELTY_ADD,
+                 novelty_rebuild: int = D.NOVELTY_REBUILD, generation_format: str = D.GENERATION_FORMAT,
+                 export_queue: int = D.EXPORT_QUEUE, export_backpressure: str = D.EXPORT_BACKPRESSURE,
+                 catalog: str = D.CATALOG, register_runs: bool = D.REGISTER_RUNS):
         """
         Returns an EvolutionRun instance.
 
@@ -84,6 +160,56 @@ class EvolutionRun:
             alphabet (list[str]): Possible labels for faces.
             run_name (str): Folder name to save run data under. Will save as timestamp otherwise.
             data_dir (str): Path to store run data in. Expects path-like string, defaults to /runs.
+            keep_meshes (int): Number of best meshes to keep in memory so the best mesh can be exported without
+                               regrowing it. 0 regrows the best mesh for export instead.
+            workers (int): Number of worker processes to evaluate the population on. 1 evaluates in this process.
+            seed (int): Seed for the random and NumPy generators. Left unseeded when None.
+            broker_address (str): "host:port" to serve an evaluation broker on. Workers on any machine can then
+                                  connect to it and evaluate the population. workers local workers are started
+                                  too. Evaluates without a broker when None.
+            broker_authkey (str): Key broker workers need to connect. Required when the broker isn't on
+                                  loopback, and generated and printed when None. Not saved to info.json.
+            broker_timeout (float): Seconds to wait for results with no live broker worker before failing.
+            schedule (str): Order workers evaluate a generation in, "fifo", "longest_first" or "chunked". The
+                            last two order genomes by predicted growth cost and log predicted against actual
+                            cost to costs.csv.
+            racing_levels (int): Number of fidelity levels to race offspring over. Each level grows twice as
+                                 far as the one before, up to iters_per_run. 1 grows every offspring fully.
+            racing_keep (float): Fraction of racers that move on to the next fidelity level.
+            surrogate_oversample (int): Breed this many times more offspring than needed and only evaluate
+                                        the ones a surrogate model predicts to be best. 1 disables the surrogate.
+            genome_backend (str): "grammar" to breed with Grammar methods, or "matrix" to breed the whole
+                                  population at once as an integer array, see evolution/genome_matrix.py.
+            checkpoint_interval (int): Number of generations between checkpoints. The last generation is
+                                       always checkpointed. 0 disables checkpoints, and None uses the
+                                       mode's default_checkpoint_interval.
+            resume (bool): Whether to continue from the checkpoint in the run directory, if it has one.
+                           Needs a run_name to find the directory.
+            target_fitness (float): Stop once the best fitness reaches this. Never stops for it when None.
+            patience (int): Stop after this many generations without a new best fitness. 0 disables.
+            max_evaluations (int): Stop once this many genomes were evaluated. 0 disables.
+            time_budget (float): Stop once this many seconds of wall-clock time passed. 0 disables.
+            warm_start (list[str]): run.csv or genX.csv files of earlier runs to seed the initial population
+                                    with. The best distinct grammars are used, and random ones fill the rest.
+            warm_start_top (int): Maximum number of grammars to seed with. 0 seeds up to population_size.
+            warm_start_fitness (bool): Whether to reuse the fitnesses recorded for seeded grammars instead of
+                                       evaluating them. Only valid if the earlier runs used the same growth
+                                       and fitness settings.
+            novelty_weight (float): Weight of novelty against fitness when ranking individuals for selection
+                                    and elitism, see evolution/novelty.py. 0 disables novelty search, 1
+                                    selects on novelty alone.
+            novelty_k (int): Number of nearest neighbours novelty is averaged over.
+            novelty_add (int): Number of most novel individuals added to the novelty archive per generation.
+            novelty_rebuild (int): Number of archive entries added between rebuilds of its k-d tree.
+            generation_format (str): "csv" to export each generation as a genX.csv file, or "archive" to
+                                     append them all to one binary archive, see evolution/archive.py.
+            export_queue (int): Number of exports that may wait for a background writer thread, so exporting a
+                                generation overlaps with evaluating the next one. 0 exports on the main thread.
+            export_backpressure (str): What to do when the export queue is full, "block" to wait for the
+                                       writer, or "drop" to skip mesh exports and progress printing.
+            catalog (str): Path of the SQLite run catalog, see evolution/catalog.py. Defaults to
+                           runs/catalog.sqlite, shared by single, batch, sweep and island runs, when None.
+            register_runs (bool): Whether to add the run to the catalog when it finishes.
         """
 
         # Args
@@ -102,10 +228,68 @@ class EvolutionRun:
         self.export_extension = export_extension
         self.alphabet = alphabet
         self.run_name = run_name
+        self.keep_meshes = keep_meshes
+        self.workers = workers
+        self.seed = seed
+        self.broker_address = broker_address
+        self.broker_authkey = broker_authkey
+        self.broker_timeout = broker_timeout
+        self.schedule = schedule
+        self.racing_levels = racing_levels
+        self.racing_keep = racing_keep
+        self.surrogate_oversample = surrogate_oversample
+        self.genome_backend = genome_backend
+        self.checkpoint_interval = self.default_checkpoint_interval if checkpoint_interval is None else checkpoint_interval
+        self.target_fitness = target_fitness
+        self.patience = patience
+        self.max_evaluations = max_evaluations
+        self.time_budget = time_budget
+        self.warm_start = warm_start
+        self.warm_start_top = warm_start_top
+        self.warm_start_fitness = warm_start_fitness
+        self.novelty_weight = novelty_weight
+        self.novelty_k = novelty_k
+        self.novelty_add = novelty_add
+        self.novelty_rebuild = novelty_rebuild
+        self.generation_format = generation_format
+        self.export_queue = export_queue
+        self.export_backpressure = export_backpressure
+        self.catalog = catalog
+        self.register_runs = register_runs
+
+        if genome_backend not in ("grammar", "matrix"):
+            raise ValueError('Unexpected genome backend {}. Try "grammar" or "matrix"'.format(genome_backend))
+
+        if generation_format not in ("csv", "archive"):
+            raise ValueError('Unexpected generation format {}. Try "csv" or "archive"'.format(generation_format))
+
+        if novelty_weight > 0 and (racing_levels > 1 or (broker_address is not None and broker_address != "None")):
+            raise ValueError("Novelty search needs every full-grown mesh, so it can't be used with racing or a broker.")
 
         # Book-keeping
         self.best_fitness = []
         self.best_individuals = []
+        self.best_progress = [] # Generation (or evaluation count) each best was recorded at
+        self.fidelities = {} # Genome key -> iterations the current fitness was grown for, when racing
+        self.racing_grown = 0 # Rule applications spent racing so far
+        self.racing_plain = 0 # Rule applications plain evaluation would have spent
+        self.surrogate_predictions = [] # Predicted fitness of the offspring picked by the surrogate, in order
+        self.surrogate_candidates = 0 # Offspring bred for the current generation
+        self.surrogate_saved = 0 # Evaluations the surrogate screened out so far
+        self.evaluations = 0 # Genomes evaluated so far
+        self.known_fitness = {} # Genome key -> fitness reused from a warm start instead of evaluating
+        self.elapsed = 0.0 # Wall-clock seconds spent by earlier sessions of a resumed run
+        self.stop_reason = None # Why the run stopped, "generations" if it ran them all
+        self.wall_time = None # Wall-clock seconds the run took, once finished
+        self.descriptors = {} # Genome key -> behaviour descriptor of its mesh, when novelty search is on
+        self.novelty = {} # Genome key -> novelty in the current generation
+        self.selection_scores = {} # Genome key -> rank-blended fitness and novelty, used for selection
+        self.run_log = None # run.csv, created by the first export_run()
+        self.run_rows = 0 # Rows of the best history already written to run.csv
+        self.archive = None # Generation archive, opened by the first export when generation_format is "archive"
+        self.exports = None # Background export queue while running, when export_queue > 0
+        self.genes = None # Genes of the current parents and offspring when genome_backend is "matrix"
+        self.gene_rows = {} # id() of each of their Grammars -> (Grammar, row of its genes)
 
         # Setup
         self.this_dir = Path(Path(__file__).resolve().parent)
@@ -114,6 +298,26 @@ class EvolutionRun:
         self.start_time = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
         self.data_path = self.resolve_data_path(run_name, data_path)
         self.population: list[Grammar, float] = []
+        self.mesh_cache = MeshCache(self.keep_meshes, self.sort_reverse) if self.export_stl else None
+        self.evaluator = None
+        self.surrogate = None
+        if self.surrogate_oversample > 1:
+            self.surrogate = RidgeSurrogate(RuleEncoder(self.alphabet, OPERATIONS))
+
+        self.novelty_archive = None
+        if self.novelty_weight > 0:
+            self.novelty_archive = NoveltyArchive(self.novelty_k, self.novelty_rebuild)
+
+        self.checkpoint = None
+        if resume:
+            if run_name is None or run_name == "None":
+                raise ValueError("Resuming needs the run_name of the run to resume.")
+            self.checkpoint = load_checkpoint(self.data_path)
+            if self.checkpoint is None:
+                print("No checkpoint in {}, starting a new run.".format(self.data_path))
+            else:
+                self.restore_history(self.checkpoint)
+
         self.export_info()
         self.export_run()
         set_symlink(os.path.join(self.this_dir, "latest_run"), os.path.join(self.data_path, "run.csv"))
@@ -135,7 +339,7 @@ class EvolutionRun:
         else:
             data_path = data_dir
 
-        if run_name is None or data_dir == "None":
+        if run_name is None or run_name == "None":
             data_path = os.path.join(data_path, self.start_time)
         else:
             data_path = os.path.join(data_path, self.run_name)
@@ -150,100 +354,919 @@ class EvolutionRun:
         """
 
         self.last_gen_clock = time.time()
+        self.run_start = time.time()
 
-        # Initialize random population, a list of (genome, fitness) pairs
-        for i in range(self.population_size):
-            self.population.append([Grammar(self.alphabet, OPERATIONS).generate_random(), None])
+        if self.checkpoint is not None:
+            self.restore_state(self.checkpoint)
+            print("Resuming {} at generation {}".format(self.data_path, self.current_gen))
+        else:
+            self.seed_generators()
+
+            if self.warm_start:
+                self.seed_population()
+
+            # Fill the rest of the population with random individuals, a list of (genome, fitness) pairs
+            remaining = self.population_size - len(self.population)
+            if self.genome_backend == "matrix":
+                genes = GenomeMatrix.random(self.alphabet, OPERATIONS, remaining)
+                genomes = genes.to_grammars()
+                self.keep_genes(genomes, genes.genes)
+                self.population.extend([genome, None] for genome in genomes)
+            else:
+                for i in range(remaining):
+                    self.population.append([Grammar(self.alphabet, OPERATIONS).generate_random(), None])
+
+        if self.broker_address is not None and self.broker_address != "None":
+            authkey = None if self.broker_authkey in (None, "None") else self.broker_authkey.encode()
+            self.evaluator = BrokerEvaluator(self.broker_address, authkey, self.iters_per_run, self.check_collision,
+                                             self.fitness_function, local_workers=self.workers,
+                                             worker_timeout=self.broker_timeout)
+        elif self.workers > 1:
+            self.evaluator = ParallelEvaluator(self.workers, self.iters_per_run, self.check_collision,
+                                               self.fitness_function, self.schedule)
+
+        if self.export_queue > 0:
+            self.exports = ExportQueue(self.export_queue, self.export_backpressure)
+
+        try:
+            while self.current_gen < self.generations and self.stop_reason is None:
+                self.step()
+                self.stop_reason = self.check_stop()
+
+                finished = self.stop_reason is not None or self.current_gen >= self.generations
+                if self.checkpoint_interval > 0 and (finished or self.current_gen % self.checkpoint_interval == 0):
+                    if self.exports is not None:
+                        self.exports.flush() # Files on disk must match the checkpoint
+                    save_checkpoint(self.data_path, self.checkpoint_state())
+        finally:
+            self.close()
+
+        self.finish()
+
+    def run_time(self) -> float:
+        """
+        Returns:
+            float: Wall-clock seconds this run has taken so far, including earlier sessions if it was resumed.
+        """
 
-        while self.current_gen < self.generations:
+        return self.elapsed + time.time() - self.run_start
 
-            ### Get & sort fitnesses
+    def check_stop(self) -> str:
+        """
+        Checks the stopping criteria.
 
-            for i, individual in enumerate(self.population):
-                genome = individual[GENOME_INDEX]
-                self.population[i][FITNESS_INDEX] = self.get_fitness(genome) 
-            
-            self.sort_population() # Sort population
+        Returns:
+            str: Why the run should stop, "target_fitness", "patience", "max_evaluations" or "time_budget",
+                 or None if it should go on.
+        """
 
-            ### Housekeeping
+        reason = None
 
-            # Export generation and extract best individual
-            if self.export_generations:
-                self.export_current_population()
+        if self.best_fitness:
+            best = max(self.best_fitness) if self.sort_reverse else min(self.best_fitness)
+            since_best = len(self.best_fitness) - 1 - self.best_fitness.index(best)
 
-            self.best_fitness.append(self.population[0][FITNESS_INDEX])
-            self.best_individuals.append(self.population[0][GENOME_INDEX].to_dict())
+            if self.target_fitness is not None and (best >= self.target_fitness if self.sort_reverse
+                                                    else best <= self.target_fitness):
+                reason = "target_fitness"
+            elif self.patience > 0 and since_best >= self.patience:
+                reason = "patience"
 
-            # Print fitnesses
-            print("")
-            print("Generation {}".format(self.current_gen))
-            print("Fitnesses:", [sublist[FITNESS_INDEX] for sublist in self.population])
+        if reason is None and self.max_evaluations > 0 and self.evaluations >= self.max_evaluations:
+            reason = "max_evaluations"
+        elif reason is None and self.time_budget > 0 and self.run_time() >= self.time_budget:
+            reason = "time_budget"
 
-            # Print grammar
-            print(self.population[0][GENOME_INDEX])
+        if reason is not None:
+            print("Stopping early: {}".format(reason))
 
-            # Export best mesh
-            if self.export_stl:
-                best_mesh = TetrahedralMesh(self.population[0][GENOME_INDEX], self.check_collision)
-                for i in range(self.iters_per_run):
-                    best_mesh.apply_rule()
-                best_mesh.export(self.export_extension, "gen{}_score{}".format(str(self.current_gen), 
-                                    self.population[0][FITNESS_INDEX]), self.data_path)
+        return reason
 
-            ### Make next generation
+    def finish(self):
+        """
+        Records why and after how long the run stopped in info.json, and adds the run to the catalog.
+        """
 
-            del self.population[-(self.new_per_gen):] # Delete all but the elites
+        if self.stop_reason is None:
+            self.stop_reason = "generations"
 
-            # Compute crossover selection rates
-            fitnesses = [sublist[FITNESS_INDEX] for sublist in self.population]
-            sum_fitness = sum(fitnesses)
-            selection_probs = [fitness/sum_fitness for fitness in fitnesses]
+        self.wall_time = self.run_time()
+        self.export_info()
 
-            new_individuals = []
+        if self.register_runs:
+            self.register()
 
-            # Fill rest of population
-            while len(new_individuals) < self.new_per_gen:
-                # Pick one parent
-                p1 = self.population[np.random.choice(len(self.population), p=selection_probs)][GENOME_INDEX].copy()
-                
-                if len(new_individuals) < self.new_per_gen - 1: # If we need more than 1 new individual, pick another and maybe crossover
-                    p2 = p1
-
-                    # Pick a different parent
-                    while p1 is p2:
-                        p2 = self.population[np.random.choice(len(self.population), p=selection_probs)][GENOME_INDEX].copy()
-
-                    # Choose selected crossover strategy
-                    if random.random() < self.crossover_rate:
-                        match self.crossover_strategy:
-                            case "one":
-                                p1.crossover(p2)
-                            case "two":
-                                p1.two_point_crossover(p2)
-                            case "uniform":
-                                p1.uniform_crossover(p2)
-                            case _:
-                                raise ValueError('Unexpected crossover strategy {}. Try "one", "two", or "uniform"'.
-                                                format(self.crossover_strategy))
-                    
-                    p2.regenerate_random(self.mutation_rate) # Mutate
-                    new_individuals.append([p2, None])
+    def register(self):
+        """
+        Adds the run's settings and summary to the catalog. A catalog that can't be written to is reported
+        rather than failing a run that already finished.
+        """
+
+        best_ever = None
+        if self.best_fitness:
+            best_ever = max(self.best_fitness) if self.sort_reverse else min(self.best_fitness)
+
+        summary = {
+            "best_fitness": self.best_fitness[-1] if self.best_fitness else None,
+            "best_ever_fitness": best_ever,
+            "generations_run": self.current_gen,
+            "evaluations": self.evaluations,
+            "stop_reason": self.stop_reason,
+            "wall_time": self.wall_time
+        }
+
+        try:
+            register_run(self.data_path, self.run_info(), summary, self.catalog)
+        except sqlite3.Error as e:
+            print("Could not register {} in the run catalog: {}".format(self.data_path, e))
+
+    def seed_population(self):
+        """
+        Adds the best distinct grammars of the warm start files to the population. Their recorded fitnesses
+        are remembered for reuse if warm_start_fitness is set.
+        """
+
+        count = self.population_size
+        if self.warm_start_top > 0:
+            count = min(self.warm_start_top, count)
+
+        seeds = load_seed_population(self.warm_start, count, self.alphabet, self.sort_reverse)
+
+        for genome, fitness in seeds:
+            self.population.append([genome, None])
+            if self.warm_start_fitness and fitness is not None:
+                self.known_fitness[genome.key] = fitness
+
+        print("Seeded {} individuals from {}".format(len(seeds), ", ".join(self.warm_start)))
+
+    def reuse_fitness(self, individual: list) -> bool:
+        """
+        Gives an individual its fitness from a warm start, if it has one.
+
+        Parameters:
+            individual (list[Grammar, float]): The individual.
+
+        Returns:
+            bool: Whether the fitness was reused, so the individual needs no evaluation.
+        """
+
+        fitness = self.known_fitness.get(genome_key(individual[GENOME_INDEX]))
+
+        if fitness is None:
+            return False
+
+        individual[FITNESS_INDEX] = fitness
+        return True
+
+    def checkpoint_state(self) -> dict:
+        """
+        Collects everything the next generation depends on, for a checkpoint.
+
+        Returns:
+            dict: The run's state.
+        """
+
+        return {
+            "finished": self.current_gen >= self.generations or self.stop_reason is not None,
+            "stop_reason": self.stop_reason,
+            "evaluations": self.evaluations,
+            "elapsed": self.run_time(),
+            "start_time": self.start_time,
+            "current_gen": self.current_gen,
+            "population": [[individual[GENOME_INDEX].to_dict(), individual[FITNESS_INDEX]]
+                           for individual in self.population],
+            "best_fitness": self.best_fitness,
+            "best_individuals": self.best_individuals,
+            "best_progress": self.best_progress,
+            "random_state": random.getstate(),
+            "numpy_state": np.random.get_state(),
+            "fidelities": self.fidelities,
+            "racing_grown": self.racing_grown,
+            "racing_plain": self.racing_plain,
+            "surrogate": self.surrogate,
+            "surrogate_predictions": self.surrogate_predictions,
+            "surrogate_candidates": self.surrogate_candidates,
+            "surrogate_saved": self.surrogate_saved,
+            "known_fitness": self.known_fitness,
+            "novelty_archive": self.novelty_archive
+        }
+
+    def restore_history(self, state: dict):
+        """
+        Restores the best-of-generation histories and start time from a checkpoint, so run.csv and
+        info.json are rewritten as they were.
+
+        Parameters:
+            state (dict): The run's state, see checkpoint_state().
+        """
+
+        self.start_time = state["start_time"]
+        self.best_fitness = state["best_fitness"]
+        self.best_individuals = state["best_individuals"]
+        self.best_progress = state["best_progress"]
+
+    def restore_state(self, state: dict):
+        """
+        Restores the population, counters and random generators from a checkpoint.
+
+        Parameters:
+            state (dict): The run's state, see checkpoint_state().
+        """
+
+        self.current_gen = state["current_gen"]
+        self.stop_reason = state["stop_reason"]
+        self.evaluations = state["evaluations"]
+        self.elapsed = state["elapsed"]
+        self.population = []
+
+        for rules, fitness in state["population"]:
+            genome = Grammar(self.alphabet, OPERATIONS)
+            genome.add_from_dict(rules)
+            self.population.append([genome, fitness])
+
+        random.setstate(state["random_state"])
+        np.random.set_state(state["numpy_state"])
+
+        self.fidelities = state["fidelities"]
+        self.racing_grown = state["racing_grown"]
+        self.racing_plain = state["racing_plain"]
+        self.surrogate = state["surrogate"]
+        self.surrogate_predictions = state["surrogate_predictions"]
+        self.surrogate_candidates = state["surrogate_candidates"]
+        self.surrogate_saved = state["surrogate_saved"]
+        self.known_fitness = state["known_fitness"]
+        self.novelty_archive = state["novelty_archive"]
+
+        # A resumed run may have logged generations past its checkpoint, which it is about to run again
+        for name in GENERATION_LOGS:
+            truncate_csv(os.path.join(self.data_path, name), "generation", self.current_gen)
+
+    def seed_generators(self):
+        """
+        Seeds the random and NumPy generators if this run has a seed.
+        """
+
+        if self.seed is not None:
+            random.seed(self.seed)
+            np.random.seed(self.seed)
+
+    def step(self):
+        """
+        Run one generation: evaluate and sort the population, export it, and breed the next generation.
+        """
+
+        self.evaluate_generation()
+        self.next_generation()
+
+    def evaluate_generation(self):
+        """
+        Evaluate and sort the current generation, then record and export it.
+        """
+
+        ### Get & sort fitnesses
+
+        self.evaluate_population()
+
+        if self.surrogate is not None:
+            self.update_surrogate()
+
+        if self.novelty_archive is not None:
+            self.update_novelty()
+
+        self.sort_population() # Sort population
+
+        ### Housekeeping
+
+        # Export generation and extract best individual
+        if self.export_generations:
+            self.export_current_population()
+
+        self.record_best(self.current_gen)
+
+        # Print fitnesses and grammar
+        self.defer(self.print_generation, self.current_gen, [sublist[FITNESS_INDEX] for sublist in self.population],
+                   self.best_individual()[GENOME_INDEX], droppable=True)
+
+        # Export best mesh
+        if self.export_stl:
+            self.export_best_mesh()
+
+    def print_generation(self, generation: int, fitnesses: list[float], genome: Grammar):
+        """
+        Prints the fitnesses of a generation and its best grammar.
+
+        Parameters:
+            generation (int): The generation.
+            fitnesses (list[float]): Fitness of each individual, in population order.
+            genome (Grammar): The best grammar.
+        """
+
+        print("")
+        print("Generation {}".format(generation))
+        print("Fitnesses:", fitnesses)
+        print(genome)
+
+    def defer(self, function, *args, droppable: bool = False):
+        """
+        Runs an export job on the background writer if there is one, and right away otherwise.
+
+        Parameters:
+            function: The job.
+            *args: Arguments to call it with. They must not be modified afterwards.
+            droppable (bool): Whether the job may be skipped when the export queue is full.
+        """
+
+        if self.exports is None:
+            function(*args)
+        else:
+            self.exports.submit(function, *args, droppable=droppable)
+
+    def next_generation(self):
+        """
+        Replace all but the elites with newly bred individuals and move on to the next generation.
+        """
+
+        ### Make next generation
+
+        del self.population[-(self.new_per_gen):] # Delete all but the elites
+
+        if self.surrogate is not None:
+            self.population.extend(self.screen_offspring(
+                self.breed(self.population, self.new_per_gen * self.surrogate_oversample)))
+        else:
+            self.population.extend(self.breed(self.population, self.new_per_gen))
+        self.current_gen += 1
+
+        ### Time estimate
+
+        last_gen_time = time.time() - self.last_gen_clock
+        self.last_gen_clock = time.time()
+        gens_remaining = self.generations - self.current_gen
+        print("Last gen time: {} | Gens remaining: {} | Time est: {}".
+              format(dt.timedelta(seconds=int(last_gen_time)), gens_remaining, dt.timedelta(seconds=int(last_gen_time* gens_remaining))))
+
+        self.export_run()
+
+    def record_best(self, progress: int):
+        """
+        Records the current best individual in the run history.
+
+        Parameters:
+            progress (int): How far the run is, in units of self.progress_column.
+        """
+
+        best = self.best_individual()
+        self.best_fitness.append(best[FITNESS_INDEX])
+        self.best_individuals.append(best[GENOME_INDEX].to_dict())
+        self.best_progress.append(progress)
+
+    def best_individual(self) -> list:
+        """
+        Returns:
+            list[Grammar, float]: The fittest individual of the sorted population. That's the first one unless
+                                  novelty search ranks the population by more than fitness.
+        """
+
+        if self.novelty_archive is None:
+            return self.population[0]
+
+        best = max if self.sort_reverse else min
+
+        return best(self.population, key=lambda x: x[FITNESS_INDEX])
+
+    def log_name(self) -> str:
+        """
+        Name of the current point in the run, used to name exported files.
+
+        Returns:
+            str: "gen" followed by the current generation.
+        """
+
+        return "gen" + str(self.current_gen)
+
+    def progress(self) -> int:
+        """
+        Returns:
+            int: The current generation, the number generation files are named and archived by.
+        """
+
+        return self.current_gen
+
+    def breed(self, parents: list, count: int) -> list:
+        """
+        Breed new individuals from parents by fitness-proportional selection, crossover, and mutation.
+
+        Parameters:
+            parents (list[Grammar, float]): Evaluated (genome, fitness) pairs to select parents from.
+            count (int): Number of new individuals to breed.
+
+        Returns:
+            list[Grammar, float]: The new (genome, None) pairs.
+        """
+
+        if self.genome_backend == "matrix":
+            return self.breed_matrix(parents, count)
+
+        # Compute crossover selection rates
+        fitnesses = self.selection_weights(parents)
+        sum_fitness = sum(fitnesses)
+        selection_probs = [fitness/sum_fitness for fitness in fitnesses]
+
+        new_individuals = []
+
+        # Fill rest of population
+        while len(new_individuals) < count:
+            # Pick one parent
+            p1 = parents[np.random.choice(len(parents), p=selection_probs)][GENOME_INDEX].copy()
+            
+            if len(new_individuals) < count - 1: # If we need more than 1 new individual, pick another and maybe crossover
+                p2 = p1
+
+                # Pick a different parent
+                while p1 is p2:
+                    p2 = parents[np.random.choice(len(parents), p=selection_probs)][GENOME_INDEX].copy()
+
+                # Choose selected crossover strategy
+                if random.random() < self.crossover_rate:
+                    match self.crossover_strategy:
+                        case "one":
+                            p1.crossover(p2)
+                        case "two":
+                            p1.two_point_crossover(p2)
+                        case "uniform":
+                            p1.uniform_crossover(p2)
+                        case _:
+                            raise ValueError('Unexpected crossover strategy {}. Try "one", "two", or "uniform"'.
+                                            format(self.crossover_strategy))
                 
-                p1.regenerate_random(self.mutation_rate)
-                new_individuals.append([p1, None])
-        
-            self.population.extend(new_individuals)
-            self.current_gen += 1
+                p2.regenerate_random(self.mutation_rate) # Mutate
+                new_individuals.append([p2, None])
+            
+            p1.regenerate_random(self.mutation_rate)
+            new_individuals.append([p1, None])
+
+        return new_individuals
+
+    def breed_matrix(self, parents: list, count: int) -> list:
+        """
+        Breed new individuals like breed(), with selection, crossover and mutation batched over the whole
+        population as NumPy operations. The genes of the parents and offspring are kept, so the next
+        generation's parents are gathered from them instead of being encoded again. Only the offspring are
+        decoded to Grammars, to be evaluated and exported.
+
+        Parameters:
+            parents (list[Grammar, float]): Evaluated (genome, fitness) pairs to select parents from.
+            count (int): Number of new individuals to breed.
+
+        Returns:
+            list[Grammar, float]: The new (genome, None) pairs.
+        """
+
+        genomes = self.population_genes([parent[GENOME_INDEX] for parent in parents])
+        fitnesses = np.array(self.selection_weights(parents), dtype=float)
+
+        offspring = breed_genes(genomes, fitnesses, count, self.crossover_rate, self.crossover_strategy,
+                                self.mutation_rate)
+        children = offspring.to_grammars()
+
+        self.genes = None
+        self.keep_genes([parent[GENOME_INDEX] for parent in parents] + children,
+                        np.concatenate([genomes.genes, offspring.genes]))
+
+        return [[genome, None] for genome in children]
+
+    def population_genes(self, genomes: list[Grammar]) -> GenomeMatrix:
+        """
+        Gathers the kept genes of some genomes. Genomes without kept genes, like warm-start seeds, migrants
+        and genomes restored from a checkpoint, are encoded and kept first.
+
+        Parameters:
+            genomes (list[Grammar]): The genomes.
+
+        Returns:
+            GenomeMatrix: Their genes, in order.
+        """
+
+        missing = [genome for genome in genomes if self.gene_rows.get(id(genome), (None,))[0] is not genome]
+        if missing:
+            self.keep_genes(missing, GenomeMatrix.from_grammars(missing, self.alphabet, OPERATIONS).genes)
+
+        rows = [self.gene_rows[id(genome)][1] for genome in genomes]
+
+        return GenomeMatrix(self.alphabet, OPERATIONS, self.genes[rows])
+
+    def keep_genes(self, genomes: list[Grammar], genes: np.ndarray):
+        """
+        Keeps the genes of some genomes, adding them to the ones already kept. The kept genes are replaced
+        by setting self.genes to None first.
+
+        Parameters:
+            genomes (list[Grammar]): The genomes.
+            genes (np.ndarray): Their (genomes, rules, fields) genes, in order.
+        """
+
+        if self.genes is None:
+            self.genes = genes[:0]
+            self.gene_rows = {}
+
+        offset = len(self.genes)
+        self.genes = np.concatenate([self.genes, genes])
+        # The Grammar is kept with its row so its id() can't be reused by another genome
+        self.gene_rows.update((id(genome), (genome, offset + i)) for i, genome in enumerate(genomes))
+
+    def selection_weights(self, parents: list) -> list[float]:
+        """
+        Weights for fitness-proportional selection of parents.
+
+        Parameters:
+            parents (list[Grammar, float]): Evaluated (genome, fitness) pairs.
+
+        Returns:
+            list[float]: The parents' fitnesses, or their selection scores when novelty search is on.
+        """
+
+        if self.novelty_archive is not None:
+            return [self.selection_scores[genome_key(parent[GENOME_INDEX])] for parent in parents]
+
+        return [parent[FITNESS_INDEX] for parent in parents]
+
+    def update_novelty(self):
+        """
+        Scores the novelty of every individual against the archive and the rest of the population, adds the
+        most novel ones to the archive, and appends the archive size and novelty to novelty.csv.
+        Individuals without a descriptor, like warm-start seeds that reused their fitness, are grown here.
+        """
+
+        keys = [genome_key(individual[GENOME_INDEX]) for individual in self.population]
+
+        for individual, key in zip(self.population, keys):
+            if key not in self.descriptors:
+                mesh = self.grow(individual[GENOME_INDEX])
+                self.descriptors[key] = behaviour_descriptor(mesh.collect_vertices(), mesh.get_num_faces())
+
+        # Only the current population's descriptors are needed again, elites are described when re-evaluated
+        self.descriptors = {key: self.descriptors[key] for key in keys}
+
+        descriptors = np.array([self.descriptors[key] for key in keys])
+        novelty = self.novelty_archive.novelty(descriptors)
+        self.novelty = dict(zip(keys, novelty.tolist()))
+
+        most_novel = np.argsort(-novelty, kind="stable")[:self.novelty_add]
+        self.novelty_archive.add(descriptors[most_novel])
+
+        row = {
+            "generation": self.current_gen,
+            "archive_size": len(self.novelty_archive),
+            "mean_novelty": float(novelty.mean()),
+            "max_novelty": float(novelty.max())
+        }
+
+        print("Novelty: mean {:.4f} | max {:.4f} | archive size {}".format(row["mean_novelty"], row["max_novelty"],
+                                                                          row["archive_size"]))
+
+        file_path = os.path.join(self.data_path, "novelty.csv")
+        new_file = not os.path.exists(file_path)
+
+        with open(file_path, 'a', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(row), lineterminator='\n')
+            if new_file:
+                writer.writeheader()
+            writer.writerow(row)
+
+    def screen_offspring(self, candidates: list) -> list:
+        """
+        Keep the offspring the surrogate predicts to be best.
+
+        Parameters:
+            candidates (list[Grammar, float]): Newly bred (genome, None) pairs.
+
+        Returns:
+            list[Grammar, float]: The new_per_gen most promising candidates.
+        """
+
+        self.surrogate_candidates = len(candidates)
+
+        if not self.surrogate.is_trained():
+            self.surrogate_predictions = []
+            return candidates[:self.new_per_gen]
+
+        predictions = self.surrogate.predict([individual[GENOME_INDEX] for individual in candidates])
+        order = np.argsort(predictions)
+        if self.sort_reverse:
+            order = order[::-1]
+
+        order = order[:self.new_per_gen]
+        self.surrogate_predictions = [float(predictions[i]) for i in order]
+
+        return [candidates[i] for i in order]
+
+    def update_surrogate(self):
+        """
+        Measures how well the surrogate predicted the offspring it picked, then trains it on them. Appends
+        the accuracy and evaluations saved to surrogate.csv. Must run before the population is sorted, while
+        the offspring are still behind the elites.
+        """
+
+        offspring = self.population if self.current_gen == 0 else self.population[self.num_elites:]
+
+        # Fitness of offspring eliminated early by racing isn't full-fidelity, so don't train on it
+        scored = [individual for individual in offspring
+                  if self.fidelities.get(genome_key(individual[GENOME_INDEX]), self.iters_per_run) == self.iters_per_run]
+
+        row = {
+            "generation": self.current_gen,
+            "samples": self.surrogate.num_samples,
+            "candidates": self.surrogate_candidates,
+            "evaluated": len(offspring),
+            "saved": 0,
+            "total_saved": self.surrogate_saved,
+            "rank_correlation": None,
+            "mean_absolute_error": None
+        }
+
+        if self.surrogate_predictions:
+            actual = [individual[FITNESS_INDEX] for individual in offspring]
+            predicted = self.surrogate_predictions
+            row["saved"] = self.surrogate_candidates - len(offspring)
+            self.surrogate_saved += row["saved"]
+            row["total_saved"] = self.surrogate_saved
+            row["rank_correlation"] = rank_correlation(predicted, actual)
+            row["mean_absolute_error"] = float(np.mean(np.abs(np.subtract(predicted, actual))))
+
+            print("Surrogate: rank correlation {} | Screened out {} evaluations, {} so far".format(
+                  row["rank_correlation"], row["saved"], row["total_saved"]))
+
+        self.surrogate.add([individual[GENOME_INDEX] for individual in scored],
+                           [individual[FITNESS_INDEX] for individual in scored])
+
+        file_path = os.path.join(self.data_path, "surrogate.csv")
+        new_file = not os.path.exists(file_path)
+
+        with open(file_path, 'a', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(row), lineterminator='\n')
+            if new_file:
+                writer.writeheader()
+            writer.writerow(row)
 
-            ### Time estimate
+    def close(self):
+        """
+        Stops the worker processes, finishes the queued exports, and frees the kept meshes.
+        """
+
+        if self.exports is not None:
+            exports, self.exports = self.exports, None
+            exports.close()
+            if exports.dropped:
+                print("Dropped {} exports while the export queue was full".format(exports.dropped))
+
+        if self.evaluator is not None:
+            self.evaluator.shutdown()
+            self.evaluator = None
+
+        if self.mesh_cache is not None:
+            self.mesh_cache.clear()
+
+    def evaluate_population(self):
+        """
+        Computes the fitness of every individual in the population. Meshes good enough to make the
+        mesh cache are kept for export.
+        """
+
+        if self.racing_levels > 1:
+            self.evaluate_population_racing()
+            return
+
+        pending = [individual for individual in self.population if not self.reuse_fitness(individual)]
+        self.evaluations += len(pending)
+
+        if self.evaluator is not None:
+            self.evaluate_population_parallel(pending)
+            return
+
+        for individual in pending:
+            genome = individual[GENOME_INDEX]
+            mesh = self.grow(genome)
+            fitness = self.score(mesh)
+            individual[FITNESS_INDEX] = fitness
+
+            if self.novelty_archive is not None:
+                self.descriptors[genome_key(genome)] = behaviour_descriptor(mesh.collect_vertices(),
+                                                                            mesh.get_num_faces())
+
+            if self.mesh_cache is not None:
+                key = genome_key(genome)
+                if self.mesh_cache.accepts(key, fitness):
+                    self.mesh_cache.offer(key, fitness, mesh.to_compact())
+
+    def evaluate_population_parallel(self, individuals: list):
+        """
+        Computes the fitness of individuals on the worker processes. Workers hand the grown meshes back
+        through shared memory when they are kept or described for novelty search, and meshes the mesh cache
+        doesn't keep are released.
+
+        Parameters:
+            individuals (list[Grammar, float]): The (genome, fitness) pairs to evaluate, updated in place.
+        """
+
+        genomes = [individual[GENOME_INDEX] for individual in individuals]
+        share = self.mesh_cache is not None or self.novelty_archive is not None
+        results = self.evaluator.evaluate(genomes, share_meshes=share)
+
+        for individual, (fitness, handle) in zip(individuals, results):
+            individual[FITNESS_INDEX] = fitness
+            self.offer_shared_mesh(individual[GENOME_INDEX], fitness, handle)
+
+        if getattr(self.evaluator, "cost_log", None):
+            self.export_costs(self.evaluator.cost_log)
+
+    def export_costs(self, cost_log: list[dict]):
+        """
+        Appends the predicted and actual evaluation cost of the current generation to costs.csv.
+
+        Parameters:
+            cost_log (list[dict]): ParallelEvaluator.cost_log of the generation, one entry per individual.
+        """
+
+        file_path = os.path.join(self.data_path, "costs.csv")
+        columns = ["generation", "id", "predicted_faces", "faces", "predicted_cost", "predicted_seconds", "seconds"]
+        new_file = not os.path.exists(file_path)
+
+        with open(file_path, 'a', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=columns, lineterminator='\n')
+            if new_file:
+                writer.writeheader()
+            for i, entry in enumerate(cost_log):
+                writer.writerow(dict(entry, generation=self.current_gen, id=i))
+
+    def evaluate_population_racing(self):
+        """
+        Races the population over the fidelity levels. Individuals that already have a full-fidelity fitness
+        keep it. Everyone else is grown for the first level's iterations and scored, the best racing_keep
+        of them are grown on to the next level, and so on up to iters_per_run. Only meshes grown to full
+        fidelity are offered to the mesh cache.
+        """
+
+        levels = fidelity_levels(self.iters_per_run, self.racing_levels)
+        fidelities = {}
+        racers = []
+
+        for individual in self.population:
+            key = genome_key(individual[GENOME_INDEX])
+            known = individual[FITNESS_INDEX] is not None and self.fidelities.get(key) == self.iters_per_run
+            if known or self.reuse_fitness(individual):
+                fidelities[key] = self.iters_per_run
+            else:
+                racers.append(individual)
+
+        self.evaluations += len(racers)
+
+        # Enough racers have to finish for the elites to all have full-fidelity fitness
+        minimum = self.num_elites - (len(self.population) - len(racers))
+        meshes = {} # id(individual) -> mesh grown so far, when evaluating in this process
+        counts = []
+        grown = 0
+        previous = 0
+
+        for level, iters in enumerate(levels):
+            last = level == len(levels) - 1
+            counts.append(len(racers))
+
+            if self.evaluator is not None:
+                genomes = [individual[GENOME_INDEX] for individual in racers]
+                share = last and self.mesh_cache is not None
+                results = self.evaluator.evaluate(genomes, share_meshes=share, iters_per_run=iters)
+                grown += iters * len(racers) # Workers can't resume growth, so every level starts over
+
+                for individual, (fitness, handle) in zip(racers, results):
+                    individual[FITNESS_INDEX] = fitness
+                    self.offer_shared_mesh(individual[GENOME_INDEX], fitness, handle)
+            else:
+                for individual in racers:
+                    genome = individual[GENOME_INDEX]
+                    mesh = meshes.get(id(individual))
+                    if mesh is None:
+                        mesh = TetrahedralMesh(genome, self.check_collision)
+                        meshes[id(individual)] = mesh
+
+                    for i in range(iters - previous):
+                        mesh.apply_rule()
+                    grown += iters - previous
+
+                    fitness = self.score(mesh)
+                    individual[FITNESS_INDEX] = fitness
+
+                    if last and self.mesh_cache is not None:
+                        key = genome_key(genome)
+                        if self.mesh_cache.accepts(key, fitness):
+                            self.mesh_cache.offer(key, fitness, mesh.to_compact())
+
+            for individual in racers:
+                fidelities[genome_key(individual[GENOME_INDEX])] = iters
+
+            if not last:
+                racers.sort(key = lambda x: x[FITNESS_INDEX], reverse=self.sort_reverse)
+                keep = num_survivors(len(racers), self.racing_keep, minimum)
+                for individual in racers[keep:]:
+                    meshes.pop(id(individual), None)
+                racers = racers[:keep]
+
+            previous = iters
+
+        self.fidelities = fidelities
+        self.log_racing(levels, counts, grown)
+
+    def log_racing(self, levels: list[int], counts: list[int], grown: int):
+        """
+        Prints and appends to racing.csv how many individuals raced at each level and how many rule
+        applications racing saved against growing the whole population fully.
+
+        Parameters:
+            levels (list[int]): Iterations grown at each level.
+            counts (list[int]): Number of racers at each level.
+            grown (int): Rule applications spent racing this generation.
+        """
+
+        plain = len(self.population) * self.iters_per_run
+        self.racing_grown += grown
+        self.racing_plain += plain
+
+        row = {
+            "generation": self.current_gen,
+            "racers": "/".join(str(count) for count in counts),
+            "levels": "/".join(str(iters) for iters in levels),
+            "iterations": grown,
+            "plain_iterations": plain,
+            "saved": 1 - grown / plain,
+            "total_saved": 1 - self.racing_grown / self.racing_plain
+        }
+
+        print("Racing: {} racers over {} iterations | Saved {:.1%} of growth, {:.1%} so far".format(
+              row["racers"], row["levels"], row["saved"], row["total_saved"]))
+
+        file_path = os.path.join(self.data_path, "racing.csv")
+        new_file = not os.path.exists(file_path)
+
+        with open(file_path, 'a', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(row), lineterminator='\n')
+            if new_file:
+                writer.writeheader()
+            writer.writerow(row)
+
+    def offer_shared_mesh(self, genome: Grammar, fitness: float, handle):
+        """
+        Offers a mesh returned by a worker to the mesh cache, and releases it if the cache doesn't keep it.
+        Describes the mesh first when novelty search is on.
+
+        Parameters:
+            genome (Grammar): The genome the mesh was grown from.
+            fitness (float): The genome's fitness.
+            handle (SharedMeshHandle): Handle to the shared mesh, or None if the worker didn't share it.
+        """
+
+        if handle is None:
+            return
+
+        key = genome_key(genome)
+        mesh = SharedMesh(handle)
+
+        if self.novelty_archive is not None:
+            self.descriptors[key] = behaviour_descriptor(mesh.vertices, mesh.get_num_faces())
+
+        if self.mesh_cache is not None and self.mesh_cache.accepts(key, fitness):
+            self.mesh_cache.offer(key, fitness, mesh)
+        else:
+            mesh.release()
+
+    def grow(self, genome: Grammar) -> TetrahedralMesh:
+        """
+        Grow a mesh from a genome.
+
+        Parameters:
+            genome (Grammar): Grammar object to grow.
+
+        Returns:
+            TetrahedralMesh: The grown mesh.
+        """
+
+        mesh = TetrahedralMesh(genome, self.check_collision)
 
-            last_gen_time = time.time() - self.last_gen_clock
-            self.last_gen_clock = time.time()
-            gens_remaining = self.generations - self.current_gen
-            print("Last gen time: {} | Gens remaining: {} | Time est: {}".
-                  format(dt.timedelta(seconds=int(last_gen_time)), gens_remaining, dt.timedelta(seconds=int(last_gen_time* gens_remaining))))
+        for i in range(self.iters_per_run):
+            mesh.apply_rule()
 
-            self.export_run()
+        return mesh
+
+    def score(self, mesh: TetrahedralMesh) -> float:
+        """
+        Score a grown mesh with this run's fitness function.
+
+        Parameters:
+            mesh (TetrahedralMesh): The grown mesh.
+
+        Returns:
+            float: The fitness of the mesh.
+        """
+
+        return compute_fitness(mesh, self.fitness_function)
 
     def get_fitness(self, genome: Grammar) -> float:
         """
@@ -256,77 +1279,156 @@ class EvolutionRun:
             float: The fitness of the grammar, in this case the volume of the resulting tetra.
         """
 
-        mesh = TetrahedralMesh(genome, self.check_collision)
+        return self.score(self.grow(genome))
 
-        for i in range(self.iters_per_run):
-            mesh.apply_rule()
+    def export_best_mesh(self):
+        """
+        Exports the mesh of the current best individual. Uses the mesh kept during evaluation if there
+        is one, and regrows it otherwise.
+        """
+
+        best = self.best_individual()
+        genome = best[GENOME_INDEX]
+        best_mesh = None
+
+        if self.mesh_cache is not None:
+            best_mesh = self.mesh_cache.get(genome_key(genome))
+
+        # The cache may release a shared mesh before the background writer gets to it
+        if self.exports is not None and isinstance(best_mesh, SharedMesh):
+            best_mesh = best_mesh.to_compact()
+
+        self.defer(self.write_mesh, genome, best_mesh, "{}_score{}".format(self.log_name(), best[FITNESS_INDEX]),
+                   droppable=True)
+
+    def write_mesh(self, genome: Grammar, mesh, filename: str):
+        """
+        Exports a mesh to the run directory.
+
+        Parameters:
+            genome (Grammar): The genome the mesh was grown from.
+            mesh (CompactMesh): The mesh, or None to regrow it from the genome.
+            filename (str): Name of the file, without extension.
+        """
+
+        if mesh is None:
+            mesh = self.grow(genome)
 
-        match self.fitness_function:
-            case "dist_to_point":
-                return mesh.dist_to_point(D.POINT)
-            case "out_there_score":
-                return mesh.out_there_score()
-            case "num_faces":
-                return mesh.get_num_faces()
-            case "hull_volume":
-                return mesh.get_hull()
-            case _:
-                raise ValueError("Unknown fitness function {}.".format(self.fitness_function))
+        mesh.export(self.export_extension, filename, self.data_path)
 
     def sort_population(self):
         """
-        Sorts the population.
+        Sorts the population. When racing, individuals scored at a higher fidelity rank above those
+        eliminated earlier, so selection uses full-fidelity fitness where it exists. With novelty search,
+        the population is sorted by selection score instead, so the elites are the best blend of fitness
+        and novelty.
         """
 
         self.population.sort(key = lambda x: x[FITNESS_INDEX], reverse=self.sort_reverse)
 
+        if self.novelty_archive is not None:
+            self.update_selection_scores()
+            self.population.sort(key = lambda x: -self.selection_scores[genome_key(x[GENOME_INDEX])])
+
+        if self.fidelities:
+            self.population.sort(key = lambda x: -self.fidelities.get(genome_key(x[GENOME_INDEX]), self.iters_per_run))
+
+    def update_selection_scores(self):
+        """
+        Blends each individual's fitness rank and novelty rank by novelty_weight. Ranks are scaled to (0, 1],
+        best last, so scores are positive weights for fitness-proportional selection. Expects the population
+        sorted by fitness, best first.
+        """
+
+        count = len(self.population)
+        keys = [genome_key(individual[GENOME_INDEX]) for individual in self.population]
+        fitness_rank = (count - np.arange(count)) / count
+        novelty_rank = np.empty(count)
+        novelty_rank[np.argsort([self.novelty.get(key, 0.0) for key in keys], kind="stable")] = np.arange(1, count + 1) / count
+
+        scores = (1 - self.novelty_weight) * fitness_rank + self.novelty_weight * novelty_rank
+        self.selection_scores = dict(zip(keys, scores.tolist()))
+
     def export_current_population(self):
         """
-        Exports current self.population as a .csv file.
+        Exports current self.population as a .csv file, or appends it to the generation archive.
+        """
+
+        population = [[individual[GENOME_INDEX], individual[FITNESS_INDEX]] for individual in self.population]
+
+        self.defer(self.write_population, self.progress(), self.log_name(), population)
+
+    def write_population(self, progress: int, name: str, population: list):
+        """
+        Writes a population to a .csv file, or appends it to the generation archive.
+
+        Parameters:
+            progress (int): Generation (or evaluation count) of the population.
+            name (str): Name of the .csv file, without extension.
+            population (list[Grammar, float]): The (genome, fitness) pairs.
         """
 
+        if self.generation_format == "archive":
+            if self.archive is None:
+                self.archive = ArchiveWriter(self.data_path, self.alphabet, OPERATIONS,
+                                             self.fitness_function in INTEGER_FITNESS)
+                self.archive.truncate(progress) # A resumed run may have archived past its checkpoint
+            self.archive.append(progress, population)
+            return
+
         # Init columns id, fitness, num_rules, lhs0, operation0, rhs0, lhs1, ...
-        columns = ["id", "fitness", "num_rules"]
-        columns += [item + str(i) for i in range(len(self.alphabet)) for item in ['lhs', 'operation', 'rhs']]
+        columns = ["id", "fitness", "num_rules"] + self.rule_columns()
         rows = []
 
-        for id, individual in enumerate(self.population):
+        for id, individual in enumerate(population):
             fitness = individual[FITNESS_INDEX]
             grammar = individual[GENOME_INDEX]
             row = {"id": id, "fitness": fitness, "num_rules": len(self.alphabet)}
             row.update(grammar.to_dict())
             rows.append(row)
 
-        file_path = os.path.join(self.data_path, "gen" + str(self.current_gen) + ".csv")
+        file_path = os.path.join(self.data_path, name + ".csv")
+
+        write_csv(file_path, columns, rows)
 
-        pd.DataFrame(rows, columns=columns).to_csv(file_path, index=False)
-    
     def export_run(self):
         """
-        Exports the run.csv file of the best fitness and grammars per generation.
+        Appends the best fitness and grammars recorded since the last call to run.csv. The first call
+        creates run.csv with the whole history, which is empty unless the run was resumed.
         """
 
-        columns = ["generation", "fitness", "num_rules"]
-        columns += [item + str(i) for i in range(len(self.alphabet)) for item in ['lhs', 'operation', 'rhs']]
-        rows = []
+        if self.run_log is None:
+            columns = [self.progress_column, "fitness", "num_rules"] + self.rule_columns()
+            self.run_log = CsvLog(os.path.join(self.data_path, "run.csv"), columns)
+            self.run_log.create()
+            self.run_rows = 0
 
+        rows = []
         num_rules = len(self.alphabet)
 
-        for generation, individual in enumerate(self.best_individuals):
-            row = {"generation": generation, "fitness": self.best_fitness[generation], "num_rules": num_rules}
-            row.update(individual)
+        for i in range(self.run_rows, len(self.best_individuals)):
+            row = {self.progress_column: self.best_progress[i], "fitness": self.best_fitness[i], "num_rules": num_rules}
+            row.update(self.best_individuals[i])
             rows.append(row)
 
-        file_path = os.path.join(self.data_path, "run.csv")
+        self.defer(self.run_log.append, rows)
+        self.run_rows = len(self.best_individuals)
+
+    def rule_columns(self) -> list[str]:
+        """
+        Returns:
+            list[str]: The grammar columns of run.csv and generation files, lhs0, operation0, rhs0, lhs1, ...
+        """
 
-        pd.DataFrame(rows, columns=columns).to_csv(file_path, index=False)
+        return [item + str(i) for i in range(len(self.alphabet)) for item in ['lhs', 'operation', 'rhs']]
 
-    def export_info(self):
+    def run_info(self) -> dict:
         """
-        Exports info.json.
+        Returns:
+            dict: The run's settings and progress, as written to info.json.
         """
 
-        info = {
+        return {
             "time": self.start_time,
             "generations": self.generations,
             "population_size": self.population_size, 
@@ -338,30 +1440,197 @@ class EvolutionRun:
             "fitness_function": self.fitness_function,
             "sort_reverse": self.sort_reverse,
             "check_collsion": self.check_collision,
-            "alphabet": self.alphabet
+            "alphabet": self.alphabet,
+            "seed": self.seed,
+            "mode": self.mode,
+            "schedule": self.schedule,
+            "racing_levels": self.racing_levels,
+            "racing_keep": self.racing_keep,
+            "surrogate_oversample": self.surrogate_oversample,
+            "genome_backend": self.genome_backend,
+            "target_fitness": self.target_fitness,
+            "patience": self.patience,
+            "max_evaluations": self.max_evaluations,
+            "time_budget": self.time_budget,
+            "stop_reason": self.stop_reason,
+            "generations_run": self.current_gen,
+            "evaluations": self.evaluations,
+            "wall_time": self.wall_time,
+            "warm_start": self.warm_start,
+            "warm_start_top": self.warm_start_top,
+            "warm_start_fitness": self.warm_start_fitness,
+            "novelty_weight": self.novelty_weight,
+            "novelty_k": self.novelty_k,
+            "novelty_add": self.novelty_add,
+            "novelty_rebuild": self.novelty_rebuild,
+            "generation_format": self.generation_format,
+            "export_queue": self.export_queue,
+            "export_backpressure": self.export_backpressure
         }
 
+    def export_info(self):
+        """
+        Exports info.json.
+        """
+
         filepath = os.path.join(self.data_path, "info.json")
 
         with open(filepath, 'w') as f:
-            json.dump(info, f, indent=4)
+            json.dump(self.run_info(), f, indent=4)
         
 
-def run_batch(runs: int, batch_name: str = None, batch_path: str = None):
+def run_settings() -> dict:
+    """
+    Collects the EvolutionRun arguments from default_args, which the command line may have overridden.
+    Passing them explicitly lets runs in worker processes use the same settings as the parent.
+
+    Returns:
+        dict: Keyword arguments for EvolutionRun.
     """
-    Runs a batch of EvolutionRun Experiments.
+
+    return {
+        "generations": D.GENERATIONS,
+        "population_size": D.POPULATION_SIZE,
+        "num_elites": D.NUM_ELITES,
+        "iters_per_run": D.ITERS_PER_RUN,
+        "mutuation_rate": D.MUTATION_RATE,
+        "crossover_rate": D.CROSSOVER_RATE,
+        "crossover_strategy": D.CROSSOVER_STRATEGY,
+        "fitness_function": D.FITNESS_FUNCTION,
+        "sort_reverse": D.SORT_REVERSE,
+        "check_collision": D.CHECK_COLLISION,
+        "export_generations": D.EXPORT_GENERATIONS,
+        "export_stl": D.EXPORT_STL,
+        "export_extension": D.EXPORT_EXTENSION,
+        "alphabet": D.ALPHABET,
+        "run_name": D.RUN_NAME,
+        "data_path": D.DATA_PATH,
+        "keep_meshes": D.KEEP_MESHES,
+        "workers": D.WORKERS,
+        "seed": D.SEED,
+        "broker_address": D.BROKER_ADDRESS,
+        "broker_authkey": D.BROKER_AUTHKEY,
+        "broker_timeout": D.BROKER_TIMEOUT,
+        "schedule": D.SCHEDULE,
+        "racing_levels": D.RACING_LEVELS,
+        "racing_keep": D.RACING_KEEP,
+        "surrogate_oversample": D.SURROGATE_OVERSAMPLE,
+        "genome_backend": D.GENOME_BACKEND,
+        "checkpoint_interval": D.CHECKPOINT_INTERVAL,
+        "resume": D.RESUME,
+        "target_fitness": D.TARGET_FITNESS,
+        "patience": D.PATIENCE,
+        "max_evaluations": D.MAX_EVALUATIONS,
+        "time_budget": D.TIME_BUDGET,
+        "warm_start": D.WARM_START,
+        "warm_start_top": D.WARM_START_TOP,
+        "warm_start_fitness": D.WARM_START_FITNESS,
+        "novelty_weight": D.NOVELTY_WEIGHT,
+        "novelty_k": D.NOVELTY_K,
+        "novelty_add": D.NOVELTY_ADD,
+        "novelty_rebuild": D.NOVELTY_REBUILD,
+        "generation_format": D.GENERATION_FORMAT,
+        "export_queue": D.EXPORT_QUEUE,
+        "export_backpressure": D.EXPORT_BACKPRESSURE,
+        "catalog": D.CATALOG,
+        "register_runs": D.REGISTER_RUNS
+    }
+
+def derive_seeds(seed: int, count: int) -> list[int]:
+    """
+    Derives independent seeds from one seed.
 
     Parameters:
-        runs (int): Number of runs to perform.
-        batch_name (str): Name of run. Defaults to timestamp.
-        batch_path (str): Where to save run data. Defaults to /batches/.
+        seed (int): The seed to derive from.
+        count (int): Number of seeds to derive.
+
+    Returns:
+        list[int]: The derived seeds.
+    """
+
+    return [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(seed).spawn(count)]
+
+def make_run(settings: dict, mode: str = "generational") -> EvolutionRun:
+    """
+    Makes a run of the given evolution mode.
+
+    Parameters:
+        settings (dict): Keyword arguments for EvolutionRun.
+        mode (str): "generational" or "steady_state".
+
+    Returns:
+        EvolutionRun: The run, ready to be run.
+    """
+
+    match mode:
+        case "generational":
+            return EvolutionRun(**settings)
+        case "steady_state":
+            from evolution.steady_state import SteadyStateRun  # pylint: disable=import-outside-toplevel
+            return SteadyStateRun(**settings)
+        case "islands":
+            raise ValueError("Island runs are started with evolution.islands.run_islands() and can't be batched.")
+        case _:
+            raise ValueError('Unexpected mode {}. Try "generational", "steady_state", or "islands"'.format(mode))
+
+def perform_run(settings: dict, mode: str = "generational") -> dict:
+    """
+    Performs one EvolutionRun. Module-level so that it can run in a worker process.
+
+    Parameters:
+        settings (dict): Keyword arguments for EvolutionRun.
+        mode (str): "generational" or "steady_state".
+
+    Returns:
+        dict: Summary of the run with its name, seed, final best fitness, and best fitness of any generation.
+    """
+
+    my_run = make_run(settings, mode)
+    my_run.run()
+
+    return summarize_run(settings, my_run.best_fitness)
+
+def summarize_run(settings: dict, best_fitness: list[float]) -> dict:
+    """
+    Summarizes a run by its best-of-generation fitnesses.
+
+    Parameters:
+        settings (dict): Keyword arguments the run was started with.
+        best_fitness (list[float]): Best fitness of each generation.
+
+    Returns:
+        dict: Summary of the run with its name, seed, final best fitness, and best fitness of any generation.
+    """
+
+    best_ever = None
+    if best_fitness:
+        best_ever = max(best_fitness) if settings["sort_reverse"] else min(best_fitness)
+
+    return {
+        "run_name": settings["run_name"],
+        "seed": settings["seed"],
+        "best_fitness": best_fitness[-1] if best_fitness else None,
+        "best_ever_fitness": best_ever
+    }
+
+def resolve_batch_path(batch_name: str = None, batch_path: str = None, default_folder: str = "batches") -> str:
+    """
+    Resolves and creates the directory a batch will be stored in.
+
+    Parameters:
+        batch_name (str): Name of batch. Defaults to timestamp.
+        batch_path (str): Where to save batch data. Defaults to /batches/.
+        default_folder (str): Folder next to this file to use when batch_path is None.
+
+    Returns:
+        str: The directory where batch data should be stored.
     """
 
     start_time = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
 
     if batch_path is None or batch_path == "None":
         this_dir = Path(Path(__file__).resolve().parent)
-        data_path = os.path.join(this_dir, "batches")
+        data_path = os.path.join(this_dir, default_folder)
     else:
         data_path = batch_path
 
@@ -372,26 +1641,94 @@ def run_batch(runs: int, batch_name: str = None, batch_path: str = None):
 
     Path(data_path).mkdir(parents=True, exist_ok=True)
 
+    return data_path
+
+def finished_summary(settings: dict) -> dict:
+    """
+    Summarizes a run that already finished from its checkpoint, like perform_run() would.
+
+    Parameters:
+        settings (dict): Keyword arguments the run was started with.
+
+    Returns:
+        dict: Summary of the run with its name, seed, final best fitness, and best fitness of any generation.
+    """
+
+    state = load_checkpoint(os.path.join(settings["data_path"], settings["run_name"]))
+
+    return summarize_run(settings, state["best_fitness"])
+
+def run_batch(runs: int, batch_name: str = None, batch_path: str = None, batch_workers: int = D.BATCH_WORKERS,
+              batch_seed: int = None, resume: bool = False):
+    """
+    Runs a batch of EvolutionRun Experiments. Runs are spread over a pool of worker processes, and each
+    run gets its own seed derived from the batch seed. The seeds are recorded in batch.json so any run
+    can be reproduced by passing its seed to a single run.
+
+    Parameters:
+        runs (int): Number of runs to perform.
+        batch_name (str): Name of run. Defaults to timestamp.
+        batch_path (str): Where to save run data. Defaults to /batches/.
+        batch_workers (int): Number of runs to perform at once.
+        batch_seed (int): Seed to derive the per-run seeds from. Drawn at random when None.
+        resume (bool): Whether to continue an interrupted batch. Runs that finished are skipped, the others
+                       continue from their checkpoints, and the batch seed is read from batch.json.
+    """
+
+    data_path = resolve_batch_path(batch_name, batch_path)
+    batch_file = os.path.join(data_path, "batch.json")
+
+    if resume and batch_seed is None and os.path.exists(batch_file):
+        with open(batch_file) as f:
+            batch_seed = json.load(f)["batch_seed"]
+
+    if batch_seed is None:
+        batch_seed = int(np.random.SeedSequence().generate_state(1)[0])
+
+    seeds = derive_seeds(batch_seed, runs)
+
+    all_settings = []
     for i in range(runs):
-        run_name = "run" + str(i)
-        print("RUN {} ---------------------------------------".format(i))
-        my_run = EvolutionRun(generations=D.GENERATIONS, 
-                            population_size=D.POPULATION_SIZE, 
-                            num_elites=D.NUM_ELITES,
-                            iters_per_run=D.ITERS_PER_RUN, 
-                            mutuation_rate=D.MUTATION_RATE, 
-                            crossover_rate=D.CROSSOVER_RATE,
-                            crossover_strategy=D.CROSSOVER_STRATEGY,
-                            fitness_function=D.FITNESS_FUNCTION,
-                            sort_reverse=D.SORT_REVERSE,
-                            check_collision=D.CHECK_COLLISION,
-                            export_generations=D.EXPORT_GENERATIONS,
-                            export_stl=D.EXPORT_STL,
-                            alphabet=D.ALPHABET,
-                            run_name=run_name,
-                            data_path=data_path)
-        my_run.run()
-        del my_run
+        settings = run_settings()
+        settings.update(run_name="run" + str(i), data_path=data_path, seed=seeds[i], resume=resume)
+        all_settings.append(settings)
+
+    batch_info = {
+        "batch_seed": batch_seed,
+        "runs": [],
+        "mode": D.MODE,
+        "settings": {key: value for key, value in run_settings().items()
+                     if key not in ("run_name", "data_path", "seed", "resume", "broker_authkey")}
+    }
+
+    # Record the batch seed before any run starts, so an interrupted batch can be resumed
+    with open(batch_file, 'w') as f:
+        json.dump(batch_info, f, indent=4)
+
+    summaries = [None] * runs
+    pending = []
+    for i, settings in enumerate(all_settings):
+        if resume and is_finished(os.path.join(data_path, settings["run_name"])):
+            summaries[i] = finished_summary(settings)
+            print("RUN {} already finished, skipping".format(i))
+        else:
+            pending.append(i)
+
+    if batch_workers > 1:
+        with ProcessPoolExecutor(max_workers=batch_workers, initializer=warm_worker) as executor:
+            futures = {i: executor.submit(perform_run, all_settings[i], D.MODE) for i in pending}
+            for i, future in futures.items():
+                summaries[i] = future.result()
+                print("RUN {} finished with best fitness {}".format(i, summaries[i]["best_fitness"]))
+    else:
+        for i in pending:
+            print("RUN {} ---------------------------------------".format(i))
+            summaries[i] = perform_run(all_settings[i], D.MODE)
+
+    batch_info["runs"] = summaries
+
+    with open(batch_file, 'w') as f:
+        json.dump(batch_info, f, indent=4)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='RL')
@@ -443,6 +1780,26 @@ if __name__ == "__main__":
                         default=D.EXPORT_GENERATIONS,
                         type=str,
                         help="whether to generate a .csv file for each generation ('t'/'f')")
+    parser.add_argument('--generation_format',
+                        type=str,
+                        help='how to export generations, options: "csv", "archive"',
+                        default=D.GENERATION_FORMAT)
+    parser.add_argument('--export_queue',
+                        type=int,
+                        help='number of exports that may wait for a background writer thread, 0 exports on the main thread',
+                        default=D.EXPORT_QUEUE)
+    parser.add_argument('--export_backpressure',
+                        type=str,
+                        help='what to do when the export queue is full, options: "block", "drop"',
+                        default=D.EXPORT_BACKPRESSURE)
+    parser.add_argument('--catalog',
+                        type=str,
+                        help='path of the SQLite run catalog shared by every run, defaults to runs/catalog.sqlite',
+                        default=D.CATALOG)
+    parser.add_argument('--register_runs',
+                        type=str,
+                        help="whether finished runs add themselves to the run catalog ('t'/'f')",
+                        default=D.REGISTER_RUNS)
     parser.add_argument('--export_stl',
                         default=D.EXPORT_STL,
                         type=str,
@@ -451,6 +1808,123 @@ if __name__ == "__main__":
                         default=D.EXPORT_EXTENSION,
                         type=str,
                         help='what file extension to save meshes as, supports ".stl" and ".obj"')
+    parser.add_argument('--keep_meshes',
+                        type=int,
+                        help='number of best meshes to keep in memory for export instead of regrowing them, 0 to regrow',
+                        default=D.KEEP_MESHES)
+    parser.add_argument('--mode',
+                        type=str,
+                        help='evolution mode, options: "generational", "steady_state", "islands"',
+                        default=D.MODE)
+    parser.add_argument('--islands',
+                        type=int,
+                        help='number of island populations in islands mode',
+                        default=D.ISLANDS)
+    parser.add_argument('--migration_interval',
+                        type=int,
+                        help='number of generations between migrations in islands mode',
+                        default=D.MIGRATION_INTERVAL)
+    parser.add_argument('--migration_size',
+                        type=int,
+                        help='number of best individuals each island sends to each of its targets',
+                        default=D.MIGRATION_SIZE)
+    parser.add_argument('--migration_topology',
+                        type=str,
+                        help='which islands exchange individuals, options: "ring", "full"',
+                        default=D.MIGRATION_TOPOLOGY)
+    parser.add_argument('--workers',
+                        type=int,
+                        help='number of worker processes to evaluate each generation on',
+                        default=D.WORKERS)
+    parser.add_argument('--schedule',
+                        type=str,
+                        help='order workers evaluate a generation in, options: "fifo", "longest_first", "chunked"',
+                        default=D.SCHEDULE)
+    parser.add_argument('--racing_levels',
+                        type=int,
+                        help='number of fidelity levels to race offspring over, 1 grows every offspring fully',
+                        default=D.RACING_LEVELS)
+    parser.add_argument('--racing_keep',
+                        type=float,
+                        help='fraction of racers that move on to the next fidelity level',
+                        default=D.RACING_KEEP)
+    parser.add_argument('--surrogate_oversample',
+                        type=int,
+                        help='breed this many times more offspring and evaluate the ones a surrogate predicts best, 1 disables',
+                        default=D.SURROGATE_OVERSAMPLE)
+    parser.add_argument('--genome_backend',
+                        type=str,
+                        help='how to breed genomes, options: "grammar", "matrix"',
+                        default=D.GENOME_BACKEND)
+    parser.add_argument('--checkpoint_interval',
+                        type=int,
+                        help='number of generations between checkpoints, 0 disables them, defaults to 5 (0 in steady_state mode)',
+                        default=D.CHECKPOINT_INTERVAL)
+    parser.add_argument('--resume',
+                        type=str,
+                        help='continue the run named by --run_name, or the batch named by --batch_name, from its checkpoints',
+                        default=D.RESUME)
+    parser.add_argument('--target_fitness',
+                        type=str,
+                        help='stop once the best fitness reaches this',
+                        default=D.TARGET_FITNESS)
+    parser.add_argument('--patience',
+                        type=int,
+                        help='stop after this many generations without a new best fitness, 0 disables',
+                        default=D.PATIENCE)
+    parser.add_argument('--max_evaluations',
+                        type=int,
+                        help='stop once this many genomes were evaluated, 0 disables',
+                        default=D.MAX_EVALUATIONS)
+    parser.add_argument('--time_budget',
+                        type=float,
+                        help='stop once this many seconds of wall-clock time passed, 0 disables',
+                        default=D.TIME_BUDGET)
+    parser.add_argument('--warm_start',
+                        type=str,
+                        nargs='+',
+                        help='run.csv or genX.csv files of earlier runs to seed the initial population with',
+                        default=D.WARM_START)
+    parser.add_argument('--warm_start_top',
+                        type=int,
+                        help='maximum number of grammars to seed with, 0 seeds up to the population size',
+                        default=D.WARM_START_TOP)
+    parser.add_argument('--warm_start_fitness',
+                        type=str,
+                        help='whether to reuse the recorded fitnesses of seeded grammars instead of evaluating them',
+                        default=D.WARM_START_FITNESS)
+    parser.add_argument('--novelty_weight',
+                        type=float,
+                        help='weight of novelty against fitness in selection, 0 disables novelty search, 1 selects on novelty alone',
+                        default=D.NOVELTY_WEIGHT)
+    parser.add_argument('--novelty_k',
+                        type=int,
+                        help='number of nearest neighbours novelty is averaged over',
+                        default=D.NOVELTY_K)
+    parser.add_argument('--novelty_add',
+                        type=int,
+                        help='number of most novel individuals added to the novelty archive per generation',
+                        default=D.NOVELTY_ADD)
+    parser.add_argument('--novelty_rebuild',
+                        type=int,
+                        help="number of novelty archive entries added between rebuilds of its k-d tree",
+                        default=D.NOVELTY_REBUILD)
+    parser.add_argument('--broker_address',
+                        type=str,
+                        help='"host:port" to serve an evaluation broker on for workers on other machines',
+                        default=D.BROKER_ADDRESS)
+    parser.add_argument('--broker_authkey',
+                        type=str,
+                        help='key broker workers need to connect, required unless the broker address is loopback',
+                        default=D.BROKER_AUTHKEY)
+    parser.add_argument('--broker_timeout',
+                        type=float,
+                        help='seconds to wait for results with no live broker worker before failing the run',
+                        default=D.BROKER_TIMEOUT)
+    parser.add_argument('--seed',
+                        type=int,
+                        help='seed for a single run, or the seed to derive per-run seeds from in a batch',
+                        default=D.SEED)
     parser.add_argument('--run_name',
                         type=str,
                         help='name of directory to store run data in',
@@ -459,6 +1933,14 @@ if __name__ == "__main__":
                         type=str,
                         help='path to save run data in',
                         default=D.DATA_PATH)
+    parser.add_argument('--sweep',
+                        type=str,
+                        help='JSON spec of a hyperparameter sweep to run as a batch, see evolution/sweep.py',
+                        default=D.SWEEP)
+    parser.add_argument('--batch_workers',
+                        type=int,
+                        help='number of runs in a batch to perform at once',
+                        default=D.BATCH_WORKERS)
     parser.add_argument('--batch_name',
                         type=str,
                         help='name of directory to save runs in',
@@ -496,32 +1978,60 @@ if __name__ == "__main__":
     D.SORT_REVERSE = bool_map[args.sort_reverse]
     D.CHECK_COLLISION = bool_map[args.check_collision]
     D.EXPORT_GENERATIONS = bool_map[args.export_generations]
+    D.GENERATION_FORMAT = str(args.generation_format)
+    D.EXPORT_QUEUE = int(args.export_queue)
+    D.EXPORT_BACKPRESSURE = str(args.export_backpressure)
+    D.CATALOG = None if args.catalog in (None, "None") else str(args.catalog)
+    D.REGISTER_RUNS = bool_map[args.register_runs]
     D.EXPORT_STL = bool_map[args.export_stl]
     D.EXPORT_EXTENSION = args.export_extension
+    D.KEEP_MESHES = int(args.keep_meshes)
+    D.MODE = str(args.mode)
+    D.ISLANDS = int(args.islands)
+    D.MIGRATION_INTERVAL = int(args.migration_interval)
+    D.MIGRATION_SIZE = int(args.migration_size)
+    D.MIGRATION_TOPOLOGY = str(args.migration_topology)
+    D.WORKERS = int(args.workers)
+    D.SCHEDULE = str(args.schedule)
+    D.RACING_LEVELS = int(args.racing_levels)
+    D.RACING_KEEP = float(args.racing_keep)
+    D.SURROGATE_OVERSAMPLE = int(args.surrogate_oversample)
+    D.GENOME_BACKEND = str(args.genome_backend)
+    D.CHECKPOINT_INTERVAL = None if args.checkpoint_interval in (None, "None") else int(args.checkpoint_interval)
+    D.RESUME = bool_map[args.resume]
+    D.TARGET_FITNESS = None if args.target_fitness in (None, "None") else float(args.target_fitness)
+    D.PATIENCE = int(args.patience)
+    D.MAX_EVALUATIONS = int(args.max_evaluations)
+    D.TIME_BUDGET = float(args.time_budget)
+    D.WARM_START = args.warm_start
+    D.WARM_START_TOP = int(args.warm_start_top)
+    D.WARM_START_FITNESS = bool_map[args.warm_start_fitness]
+    D.NOVELTY_WEIGHT = float(args.novelty_weight)
+    D.NOVELTY_K = int(args.novelty_k)
+    D.NOVELTY_ADD = int(args.novelty_add)
+    D.NOVELTY_REBUILD = int(args.novelty_rebuild)
+    D.SEED = args.seed
+    D.BROKER_ADDRESS = args.broker_address
+    D.BROKER_AUTHKEY = None if args.broker_authkey in (None, "None") else str(args.broker_authkey)
+    D.BROKER_TIMEOUT = float(args.broker_timeout)
+    D.BATCH_WORKERS = int(args.batch_workers)
+    D.SWEEP = args.sweep
     D.RUN_NAME = str(args.run_name)
     D.DATA_PATH = str(args.data_path)
     D.BATCH_PATH = str(args.batch_path)
     D.BATCH_NAME = str(args.batch_name)
 
-    if D.RUNS > 1:
-        run_batch(D.RUNS, D.BATCH_NAME, D.BATCH_PATH)
+    if D.SWEEP is not None and D.SWEEP != "None":
+        from evolution.sweep import run_sweep  # pylint: disable=import-outside-toplevel
+        with open(D.SWEEP) as f:
+            run_sweep(json.load(f), D.BATCH_NAME, D.BATCH_PATH, D.BATCH_WORKERS, D.SEED, D.MODE, D.RESUME)
+    elif D.MODE == "islands":
+        from evolution.islands import run_islands  # pylint: disable=import-outside-toplevel
+        run_islands(run_settings(), D.ISLANDS, D.MIGRATION_INTERVAL, D.MIGRATION_SIZE, D.MIGRATION_TOPOLOGY)
+    elif D.RUNS > 1:
+        run_batch(D.RUNS, D.BATCH_NAME, D.BATCH_PATH, D.BATCH_WORKERS, D.SEED, D.RESUME)
     elif D.RUNS == 1:
-        my_run = EvolutionRun(generations=D.GENERATIONS, 
-                            population_size=D.POPULATION_SIZE, 
-                            num_elites=D.NUM_ELITES,
-                            iters_per_run=D.ITERS_PER_RUN, 
-                            mutuation_rate=D.MUTATION_RATE, 
-                            crossover_rate=D.CROSSOVER_RATE,
-                            crossover_strategy=D.CROSSOVER_STRATEGY,
-                            fitness_function=D.FITNESS_FUNCTION,
-                            sort_reverse=D.SORT_REVERSE,
-                            check_collision=D.CHECK_COLLISION,
-                            export_generations=D.EXPORT_GENERATIONS,
-                            export_stl=D.EXPORT_STL,
-                            export_extension=D.EXPORT_EXTENSION,
-                            alphabet=D.ALPHABET,
-                            run_name=D.RUN_NAME,
-                            data_path=D.DATA_PATH)
+        my_run = make_run(run_settings(), D.MODE)
         my_run.run()
     else:
-        ValueError("Specified number of runs {} is invalid.".format(args.runs))
\ No newline at end of file
+        ValueError("Specified number of runs {} is invalid.".format(args.runs))
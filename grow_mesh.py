@@ -1,20 +1,27 @@
 """
 Grow and display and save a mesh using a Grammar from a saved .csv file.
 
+In batch mode, selected by --ids or several --filepath files, every selected Grammar is grown and exported
+on a pool of worker processes, and a summary of face counts and timings is printed.
+
 Author: Thomas Breimer
 July 28th, 2025
 """
 
 import os
+import time
 import argparse
 from pathlib import Path
-import pandas as pd
-import trimesh
+from concurrent.futures import ProcessPoolExecutor
 from model.grammar import Grammar
 from model.tetrahedral_mesh import TetrahedralMesh
+from model.growth_cost import predict_growth
 
 FILEPATH = "runs/2025-07-28_14-09-23/gen0.csv"
 ID = 0 # genome id in csv file or generation if looking at a run.csv file
+GENERATION = 0 # generation to read the genome from when FILEPATH is an archive.bin file
+IDS = None # Batch mode: "all", or ids and inclusive ranges like "0-10,15". None grows only ID
+WORKERS = os.cpu_count() or 1 # Number of worker processes in batch mode
 SHOW_MESH = True # Whether to display the mesh after it is saved.
 
 EXPORT_FILEPATH = "meshes" # Export filepath
@@ -25,6 +32,9 @@ EXPORT_EXTENSION = ".stl"
 ITERS = 100
 CHECK_COLLISION = True
 
+SERVICE = None # Address of an evaluation service to score the grammar with instead of growing it, see evolution/service.py
+FITNESS_FUNCTION = "dist_to_point" # Fitness function the service scores with
+
 MY_PATH = Path(__file__).resolve().parent
 
 def read_csv(filepath: Path, id: int) -> Grammar:
@@ -33,26 +43,119 @@ def read_csv(filepath: Path, id: int) -> Grammar:
 
     Parameters:
         filepath (Path): Path of the .csv file.
-        id (int): The id or generation number of the grammar to read.
+        id (int): The id, generation number, or evaluation count of the grammar to read.
 
     Returns:
         Grammar: The Grammar object specified.
     """
 
-    df = pd.read_csv(os.path.join(MY_PATH, filepath))
+    import pandas as pd  # pylint: disable=import-outside-toplevel
 
-    if "id" in df.columns:
-        row = df[df['id'] == id]
-    elif "generation" in df.columns:
-        row = df[df['generation'] == id]
-    else:
-        raise ValueError("Expected .csv file {} to have an 'id' or 'generations' column, but it didn't have either!".format(filepath))
+    df = pd.read_csv(os.path.join(MY_PATH, filepath))
+    row = df[df[id_column(df.columns, filepath)] == id]
     
     grammar = Grammar()
     grammar.add_from_dict(row.iloc[0].to_dict())
 
     return grammar
 
+def id_column(columns: list[str], filepath: Path) -> str:
+    """
+    Finds the column grammars in a .csv file are selected by.
+
+    Parameters:
+        columns (list[str]): Columns of the .csv file.
+        filepath (Path): Path of the .csv file, for the error message.
+
+    Returns:
+        str: "id", "generation" or "evaluation".
+    """
+
+    for column in ["id", "generation", "evaluation"]:
+        if column in columns:
+            return column
+
+    raise ValueError("Expected .csv file {} to have an 'id', 'generation' or 'evaluation' column, but it didn't have any!".format(filepath))
+
+def parse_ids(spec: str, available: list[int]) -> list[int]:
+    """
+    Selects ids with a spec like "all" or "0-10,15".
+
+    Parameters:
+        spec (str): "all", or comma-separated ids and inclusive ranges.
+        available (list[int]): Ids in the file, in file order.
+
+    Returns:
+        list[int]: The selected ids that are in the file, in file order.
+    """
+
+    if spec == "all":
+        return list(available)
+
+    selected = set()
+    for part in spec.split(","):
+        if "-" in part:
+            start, end = part.split("-")
+            selected.update(range(int(start), int(end) + 1))
+        else:
+            selected.add(int(part))
+
+    return [id for id in available if id in selected]
+
+def read_grammars(filepath: Path, spec: str) -> list[tuple[int, Grammar]]:
+    """
+    Reads every selected Grammar of a .csv or archive.bin file, reading the file once.
+
+    Parameters:
+        filepath (Path): Path of the .csv or archive.bin file.
+        spec (str): Ids to select, see parse_ids(). Ids of an archive.bin are within GENERATION.
+
+    Returns:
+        list[tuple[int, Grammar]]: (id, Grammar) pairs in file order.
+    """
+
+    if str(filepath).endswith(".bin"):
+        from evolution.archive import ArchiveReader  # pylint: disable=import-outside-toplevel
+
+        reader = ArchiveReader(os.path.join(MY_PATH, filepath))
+        population = reader.decode(reader.generation(GENERATION))
+        ids = parse_ids(spec, list(range(len(population))))
+
+        return [(id, population[id][0]) for id in ids]
+
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    df = pd.read_csv(os.path.join(MY_PATH, filepath), dtype=str, keep_default_na=False)
+    column = id_column(df.columns, filepath)
+    rows = {int(row[column]): row for row in df.to_dict('records')}
+    grammars = []
+
+    for id in parse_ids(spec, list(rows)):
+        grammar = Grammar()
+        grammar.add_from_dict(rows[id])
+        grammars.append((id, grammar))
+
+    return grammars
+
+def read_archive(filepath: Path, generation: int, id: int) -> Grammar:
+    """
+    Reads one Grammar from a run's generation archive, see evolution/archive.py.
+
+    Parameters:
+        filepath (Path): Path of the archive.bin file.
+        generation (int): The generation, or evaluation count, the grammar is from.
+        id (int): The id of the grammar within its generation.
+
+    Returns:
+        Grammar: The Grammar object specified.
+    """
+
+    from evolution.archive import ArchiveReader  # pylint: disable=import-outside-toplevel
+
+    genome, fitness = ArchiveReader(os.path.join(MY_PATH, filepath)).get(generation, id)
+
+    return genome
+
 def apply_rules(grammar: Grammar, iters: int, check_collision: bool) -> TetrahedralMesh:
     """
     Builds a mesh by applying rules from a grammar.
@@ -72,29 +175,137 @@ def apply_rules(grammar: Grammar, iters: int, check_collision: bool) -> Tetrahed
 
     return mesh
 
+def warm_exporter():
+    """
+    Imports trimesh once when a batch worker starts, so the first export of each worker isn't slowed down.
+    """
+
+    import trimesh  # pylint: disable=import-outside-toplevel,unused-import
+
+def grow_and_export(rules: dict, iters: int, check_collision: bool, extension: str, filename: str,
+                    folder: str) -> dict:
+    """
+    Grows and exports one mesh. Runs in a worker process.
+
+    Parameters:
+        rules (dict): The Grammar in Grammar.to_dict() form.
+        iters (int): The number of Grammar productions to perform.
+        check_collision (bool): Whether to check for collision.
+        extension (str): File extension to export with.
+        filename (str): Name to store the mesh as.
+        folder (str): Where to store the mesh.
+
+    Returns:
+        dict: The mesh's filename, number of faces, and seconds spent growing and exporting it.
+    """
+
+    start = time.perf_counter()
+    grammar = Grammar()
+    grammar.add_from_dict(rules)
+    mesh = apply_rules(grammar, iters, check_collision)
+    grown = time.perf_counter()
+
+    mesh.export(extension, filename, folder)
+
+    return {"filename": filename + extension, "faces": mesh.get_num_faces(), "grow_seconds": grown - start,
+            "export_seconds": time.perf_counter() - grown}
+
+def grow_batch(filepaths: list[Path], spec: str, workers: int) -> list[dict]:
+    """
+    Grows and exports every selected Grammar of several files on a process pool, the most expensive first
+    by predicted growth cost, and prints a summary.
+
+    Parameters:
+        filepaths (list[Path]): Paths of .csv or archive.bin files.
+        spec (str): Ids to select in each file, see parse_ids().
+        workers (int): Number of worker processes.
+
+    Returns:
+        list[dict]: One summary per mesh, in file and id order.
+    """
+
+    start = time.perf_counter()
+    tasks = []
+
+    for filepath in filepaths:
+        source = "{}_{}".format(Path(filepath).parent.name, Path(filepath).stem)
+        if str(filepath).endswith(".bin"):
+            source += "_gen{}".format(GENERATION)
+        for id, grammar in read_grammars(filepath, spec):
+            filename = "{}_{}_{}".format(EXPORT_FILENAME, source, id)
+            cost = predict_growth(grammar, ITERS, CHECK_COLLISION)[1]
+            tasks.append({"file": str(filepath), "id": id, "rules": grammar.to_dict(), "filename": filename,
+                          "cost": cost})
+
+    folder = os.path.join(MY_PATH, EXPORT_FILEPATH)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_exporter) as executor:
+        order = sorted(range(len(tasks)), key=lambda i: -tasks[i]["cost"])
+        futures = {i: executor.submit(grow_and_export, tasks[i]["rules"], ITERS, CHECK_COLLISION, EXPORT_EXTENSION,
+                                      tasks[i]["filename"], folder) for i in order}
+        results = [dict(futures[i].result(), file=task["file"], id=task["id"]) for i, task in enumerate(tasks)]
+
+    print("{:<40} {:>6} {:>8} {:>10} {:>10}  {}".format("file", "id", "faces", "grow (s)", "export (s)", "mesh"))
+    for result in results:
+        print("{:<40} {:>6} {:>8} {:>10.3f} {:>10.3f}  {}".format(result["file"][-40:], result["id"], result["faces"],
+                                                                 result["grow_seconds"], result["export_seconds"],
+                                                                 result["filename"]))
+
+    print("Grew {} meshes with {} faces in total on {} workers in {:.2f}s ({:.2f}s of growth, {:.2f}s of export)".format(
+          len(results), sum(result["faces"] for result in results), workers, time.perf_counter() - start,
+          sum(result["grow_seconds"] for result in results), sum(result["export_seconds"] for result in results)))
+
+    return results
+
 def grow_mesh():
     """
     Grow a mesh.
     """
     
-    grammar = read_csv(filepath=FILEPATH, id=ID)
+    if str(FILEPATH).endswith(".bin"):
+        grammar = read_archive(filepath=FILEPATH, generation=GENERATION, id=ID)
+    else:
+        grammar = read_csv(filepath=FILEPATH, id=ID)
+
+    # The service grows the grammar itself, so growing it here as well would do the work twice
+    if SERVICE is not None and SERVICE != "None":
+        from evolution.service import ServiceClient  # pylint: disable=import-outside-toplevel
+        with ServiceClient(SERVICE) as client:
+            fitness = client.evaluate_all([grammar], ITERS, CHECK_COLLISION, FITNESS_FUNCTION)[0]
+        print("Fitness ({}): {}".format(FITNESS_FUNCTION, fitness))
+        return
+
     mesh = apply_rules(grammar, ITERS, CHECK_COLLISION)
 
     mesh.export(EXPORT_EXTENSION, EXPORT_FILENAME, os.path.join(MY_PATH, EXPORT_FILEPATH))
 
     if SHOW_MESH:
+        import trimesh  # pylint: disable=import-outside-toplevel
         trimesh.load_mesh(os.path.join(MY_PATH, EXPORT_FILEPATH, EXPORT_FILENAME + EXPORT_EXTENSION)).show()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='RL')
     parser.add_argument('--filepath',
                         type=str,
-                        help='path of .csv file to read from',
-                        default=FILEPATH)
+                        nargs='+',
+                        help='path of .csv or archive.bin file to read from, several files grow in batch mode',
+                        default=[FILEPATH])
     parser.add_argument('--id',
                         type=int,
                         help='genome id in csv file or generation if looking at a run.csv file',
                         default=ID)
+    parser.add_argument('--ids',
+                        type=str,
+                        help='batch mode: "all", or ids and inclusive ranges like "0-10,15"',
+                        default=IDS)
+    parser.add_argument('--workers',
+                        type=int,
+                        help='number of worker processes in batch mode',
+                        default=WORKERS)
+    parser.add_argument('--generation',
+                        type=int,
+                        help='generation to read the genome from when reading an archive.bin file',
+                        default=GENERATION)
     parser.add_argument('--show_mesh',
                         type=str,
                         help="whether to display the mesh after it is saved ('t'/'f')",
@@ -119,6 +330,14 @@ if __name__ == "__main__":
                         type=str,
                         help='what file extension to use for mesh export, supports ".stl" and ".obj"',
                         default=EXPORT_EXTENSION)
+    parser.add_argument('--service',
+                        type=str,
+                        help='address of a running evaluation service to score the grammar with instead of growing and exporting it',
+                        default=SERVICE)
+    parser.add_argument('--fitness_function',
+                        type=str,
+                        help='fitness function the service scores the grammar with',
+                        default=FITNESS_FUNCTION)
     args = parser.parse_args()
 
     bool_map = {
@@ -135,8 +354,11 @@ if __name__ == "__main__":
         True: True,
         False: False}
     
-    FILEPATH = args.filepath
+    FILEPATH = args.filepath[0]
     ID = args.id
+    IDS = args.ids
+    WORKERS = args.workers
+    GENERATION = args.generation
     SHOW_MESH = bool_map[args.show_mesh]
 
     EXPORT_FILEPATH = args.export_filepath
@@ -146,4 +368,10 @@ if __name__ == "__main__":
     ITERS = args.iters
     CHECK_COLLISION = bool_map[args.check_collision]
 
-    grow_mesh()
+    SERVICE = args.service
+    FITNESS_FUNCTION = args.fitness_function
+
+    if IDS is not None or len(args.filepath) > 1:
+        grow_batch(args.filepath, IDS if IDS is not None else str(ID), WORKERS)
+    else:
+        grow_mesh()
@@ -8,28 +8,32 @@ July 9th, 2025
 
 from dataclasses import dataclass
 import random
-import copy
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Rule:
     """
-    A single Rule.
+    A single Rule. Rules are immutable, so grammars can share them.
     
     Attributes:
         operation (str): Operation to be preformd on the lhs. Can be "rename", "grow", or "split". 
-        rhs (str): Symbols on the right hand side of the rule.
+        rhs (tuple[str]): Symbols on the right hand side of the rule.
     """
     operation: str
-    rhs: list[str]
+    rhs: tuple[str, ...]
 
 
-@dataclass
 class Grammar:
     """
     A collection of Rules.
+
+    Grammars with the same rules are equal and hash the same, so they can key caches and be deduplicated.
+    The hash is computed from a packed key of the rules, which is cached until the rules change. Don't
+    change a grammar's rules while it is a key in a dict or set.
     """
 
+    __slots__ = ("alphabet", "operations", "rules", "_key")
+
     def __init__(self, alphabet: list = None, operations: dict[str, int] = None):
         """
         Initialize an empty grammar.
@@ -43,6 +47,7 @@ class Grammar:
         self.alphabet = alphabet
         self.operations = operations
         self.rules = {}
+        self._key = None
 
     def add_rule(self, lhs: str, func: str, rhs: list[str]):
         """
@@ -53,8 +58,9 @@ class Grammar:
             func (str): Operation to be preformed on the lhs. Can be "relabel", "grow", or "divide". 
             rhs (list[str]): Face labels to be generated on application of the rule.
         """
-        new_rule = Rule(func, rhs)
+        new_rule = Rule(func, tuple(rhs))
         self.rules[lhs] = new_rule
+        self._key = None
 
     def add_from_dict(self, new_rules: dict):
         """
@@ -63,7 +69,7 @@ class Grammar:
 
         for i in range(len(new_rules)):
             if "lhs" + str(i) in new_rules.keys():
-                rhs = list(new_rules["rhs" + str(i)])
+                rhs = tuple(new_rules["rhs" + str(i)])
                 self.add_rule(new_rules["lhs" + str(i)], new_rules["operation" + str(i)], rhs)
             else:
                 break
@@ -74,6 +80,7 @@ class Grammar:
         """
 
         self.rules = {}
+        self._key = None
 
     def get_rule_operation(self, label: str) -> str:
         """
@@ -96,7 +103,7 @@ class Grammar:
             label (str): LHS of rule rhs to get.
 
         Return:
-            list[str]: The face labels resulting from the operation, the rhs.
+            tuple[str]: The face labels resulting from the operation, the rhs.
         """
 
         return self.rules[label].rhs
@@ -113,7 +120,8 @@ class Grammar:
             if random.random() < probability:
                 operation = random.choice(list(self.operations.keys()))  # Get random operation
                 rhs = random.sample(self.alphabet, self.operations[operation])  # Get random labels for rhs
-                self.rules[lhs] = Rule(operation, rhs)
+                self.rules[lhs] = Rule(operation, tuple(rhs))
+                self._key = None
 
     def generate_random(self):
         """
@@ -203,6 +211,9 @@ class Grammar:
                 other_grammar.rules[lhs] = rule
                 self.rules[lhs] = other_rule
 
+        self._key = None
+        other_grammar._key = None
+
     def set_rules_from_list(self, new_rules):
         """
         Set grammar rules from list.
@@ -212,6 +223,7 @@ class Grammar:
         """
 
         self.rules = dict(new_rules)
+        self._key = None
 
     def get_rules_list(self):
         """
@@ -225,19 +237,42 @@ class Grammar:
 
     def copy(self):
         """
-        Copies this grammar and returns a new identical grammar.
+        Copies this grammar and returns a new identical grammar. Rules are immutable, so the copy shares them.
 
         Returns:
             Grammar: A new identical Grammar.
         """
 
         new_grammar = Grammar(self.alphabet, self.operations)
-
-        for lhs, rule in self.rules.items():
-            new_grammar.add_rule(lhs[:], rule.operation[:], copy.deepcopy(rule.rhs))
+        new_grammar.rules = dict(self.rules)
+        new_grammar._key = self._key
 
         return new_grammar
 
+    @property
+    def key(self) -> str:
+        """
+        A packed string of the rules, equal for grammars with the same rules in the same order.
+
+        Returns:
+            str: The key, like "A:grow:BCD;B:relabel:A;".
+        """
+
+        if self._key is None:
+            self._key = "".join("{}:{}:{};".format(lhs, rule.operation, "".join(rule.rhs))
+                                for lhs, rule in self.rules.items())
+
+        return self._key
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Grammar):
+            return NotImplemented
+
+        return self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
     def to_dict(self):
         """
         Returns a dict representation of the Grammar in the form of {lhs0:"A", operation0:"grow", rhs0:"BCD", lhs1:...}
@@ -264,7 +299,7 @@ class Grammar:
         to_return = "Grammar Object\n"
 
         for lhs, rule in self.rules.items():
-            newln = "{} -> {} {}\n".format(lhs, rule.operation, rule.rhs)
+            newln = "{} -> {} {}\n".format(lhs, rule.operation, list(rule.rhs))
             to_return += newln
 
         return to_return
@@ -0,0 +1,66 @@
+"""
+Predict how expensive a grammar is to grow without doing any geometry.
+
+Growing a mesh only depends on geometry when a grow is blocked by a collision, so replaying the grammar on
+a queue of face labels predicts the number of faces, and from that the cost of the collision checks and
+vertex lookups. Collisions are ignored, so the prediction is an upper bound.
+
+October 19th, 2026
+"""
+
+from collections import deque
+from model.grammar import Grammar
+
+SEED_LABELS = ["A", "B", "C", "D"] # Face labels of the seed tetrahedron
+SEED_VERTICES = 4
+
+
+def predict_growth(grammar: Grammar, iters: int, check_collision: bool = True) -> tuple[int, float]:
+    """
+    Simulate growing a mesh on face labels only.
+
+    The cost is in units of face or vertex comparisons. With collision checks, a grow compares each of its
+    3 new faces with every face in the mesh. Every new face also looks its 3 vertices up among the mesh's
+    vertices, which is linear in the number of vertices.
+
+    Parameters:
+        grammar (Grammar): Grammar to simulate.
+        iters (int): Number of grammar rules to apply.
+        check_collision (bool): Whether grows are checked for collisions.
+
+    Returns:
+        tuple[int, float]: Predicted number of faces and predicted cost.
+    """
+
+    queue = deque(SEED_LABELS)
+    faces = len(SEED_LABELS)
+    vertices = SEED_VERTICES
+    cost = 0.0
+
+    for i in range(iters):
+        if not queue:
+            break
+
+        label = queue.popleft()
+        operation = grammar.get_rule_operation(label)
+        rhs = grammar.get_rule_rhs(label)
+
+        if operation == "relabel":
+            queue.append(rhs[0])
+            cost += 1
+        elif operation == "grow":
+            if check_collision:
+                cost += 3 * faces
+            cost += 9 * vertices
+            faces += 2
+            vertices += 1
+            queue.extend(rhs)
+        elif operation == "divide":
+            cost += 15 * vertices
+            faces += 3
+            vertices += 3
+            queue.extend(rhs)
+        else:
+            raise ValueError("Unexpected operation {} in rule.".format(operation))
+
+    return faces, cost
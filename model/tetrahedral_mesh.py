@@ -7,9 +7,7 @@ July 7th, 2025
 
 import math
 from dataclasses import dataclass
-import trimesh
 import numpy as np
-from scipy.spatial import ConvexHull
 import os
 from collections import deque
 from pathlib import Path
@@ -420,17 +418,17 @@ class TetrahedralMesh:
             folder (str): Optionally, a folder to put the file in.      
         """
 
-        my_trimesh = self.get_trimesh()
+        export_arrays(self.collect_vertices(), self.collect_faces(), extension, filename, folder)
 
-        current_file_path = Path(__file__).resolve().parent
+    def to_compact(self):
+        """
+        Gets a compact, geometry-only snapshot of this mesh which can still be exported.
 
-        if folder is None:
-            my_trimesh.export(
-                os.path.join(current_file_path, "meshes", filename + extension))
-        else:
-            directory_path = Path(folder)
-            directory_path.mkdir(parents=True, exist_ok=True)
-            my_trimesh.export(os.path.join(directory_path, filename + extension))
+        Returns:
+            CompactMesh: The vertex and face arrays of this mesh.
+        """
+
+        return CompactMesh(self.collect_vertices(), self.collect_faces())
 
     def collect_vertices(self) -> np.ndarray:
         """
@@ -499,13 +497,15 @@ class TetrahedralMesh:
             raise ValueError(
                 "Unexpected operation {} in rule.".format(operation))
 
-    def get_trimesh(self) -> trimesh.Trimesh:
+    def get_trimesh(self) -> "trimesh.Trimesh":
         """
         Gets this mesh as a Trimesh object.
         
         Returns:
             trimesh.Trimesh: This mesh as a Trimesh object.
         """
+        import trimesh  # pylint: disable=import-outside-toplevel
+
         return trimesh.Trimesh(vertices=self.collect_vertices(),
                                faces=self.collect_faces(),
                                process=False,
@@ -570,10 +570,80 @@ class TetrahedralMesh:
             float: The volume of the convex hull of this mesh.
         """
 
+        from scipy.spatial import ConvexHull  # pylint: disable=import-outside-toplevel
+
         hull = ConvexHull(self.collect_vertices())
         return hull.volume
 
 
+@dataclass
+class CompactMesh:
+    """
+    A grown mesh reduced to the arrays needed to export it. Much smaller than a TetrahedralMesh since
+    it drops the Face objects, planes and queue.
+
+    Attributes:
+        vertices (np.ndarray): Array of shape (num_vertices, 3) with the coordinates of each vertex.
+        faces (np.ndarray): Array of shape (num_faces, 3) with the vertex indices of each face.
+    """
+    vertices: np.ndarray
+    faces: np.ndarray
+
+    def get_num_faces(self) -> int:
+        """
+        Get the number of faces in the mesh.
+
+        Returns:
+            int: The number of faces in the mesh.
+        """
+
+        return len(self.faces)
+
+    def export(self, extension: str, filename: str, folder: str = None):
+        """
+        Export the mesh to a file.
+
+        Parameters:
+            extension (str): File extension to use. Supports .stl and .obj
+            filename (str): Name of the file to export.
+            folder (str): Optionally, a folder to put the file in.
+        """
+
+        export_arrays(self.vertices, self.faces, extension, filename, folder)
+
+    def release(self):
+        """
+        Frees the mesh. A CompactMesh owns ordinary arrays, so there is nothing to do.
+        """
+
+
+def export_arrays(vertices: np.ndarray, faces: np.ndarray, extension: str, filename: str, folder: str = None):
+    """
+    Export a mesh given as vertex and face arrays.
+
+    Parameters:
+        vertices (np.ndarray): Array of shape (num_vertices, 3) with the coordinates of each vertex.
+        faces (np.ndarray): Array of shape (num_faces, 3) with the vertex indices of each face.
+        extension (str): File extension to use. Supports .stl and .obj
+        filename (str): Name of the file to export.
+        folder (str): Optionally, a folder to put the file in. Defaults to the meshes directory.
+    """
+
+    import trimesh  # pylint: disable=import-outside-toplevel
+
+    my_trimesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False, validate=False)
+
+    current_file_path = Path(__file__).resolve().parent
+
+    if folder is None:
+        my_trimesh.export(
+            os.path.join(current_file_path, "meshes", filename + extension))
+    else:
+        directory_path = Path(folder)
+        directory_path.mkdir(parents=True, exist_ok=True)
+        my_trimesh.export(os.path.join(directory_path, filename + extension))
+
+
 def make_tetra(mesh_filename: str = DEFAULT_MESH_FILENAME) -> TetrahedralMesh:
     """
     Make a simple mesh with a single tetrahedron, with faces named "A", "B", "C", "D".
@@ -13,7 +13,6 @@ July 17th, 2025
 """
 
 import numpy as np
-import trimesh
 import os
 from pathlib import Path
 
@@ -64,6 +63,8 @@ def export_triangles(t1: np.ndarray, t2: np.ndarray):
         t2 (np.ndarray): np.ndarry of shape (3, 3) with each row representing a point in a triangle.
     """
 
+    import trimesh  # pylint: disable=import-outside-toplevel
+
     my_mesh = trimesh.Trimesh(vertices=np.concatenate((t1, t2), axis=0),
                               faces=[[0, 1, 2], [3, 4, 5]],
                               process=False,
@@ -0,0 +1,203 @@
+"""
+Load the best-fitness histories of a batch of runs as one runs x generations NumPy array.
+
+Runs are read in parallel, and the aligned arrays are cached in batch_cache.npz in the batch directory. The
+cache is reused as long as the same run folders exist and none of their run.csv or info.json files was
+modified since, so replotting a batch of hundreds of runs doesn't read them all again. Runs compared from
+different directories are read in parallel by the same reader, but not cached, as they have no shared
+directory to keep a cache in.
+
+October 19th, 2026
+"""
+
+import os
+import json
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+CACHE_FILE = "batch_cache.npz"
+CACHE_VERSION = 1
+WORKERS = 8
+
+
+def read_run(run_path: Path, run_csv_path: Path = None) -> dict:
+    """
+    Reads the best fitness history and settings of one run.
+
+    Parameters:
+        run_path (Path): Directory of the run, with run.csv and info.json.
+        run_csv_path (Path): The run's best fitness history. Defaults to run.csv in run_path.
+
+    Returns:
+        dict: The run's name, progress column ("generation" or "evaluation"), progress and fitness arrays,
+              population size and sort_reverse. None if the run couldn't be read.
+    """
+
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    run_csv_path = run_path / "run.csv" if run_csv_path is None else run_csv_path
+    info_path = run_path / "info.json"
+
+    try:
+        with open(info_path, 'r') as file:
+            info = json.load(file)
+
+        df = pd.read_csv(run_csv_path)
+        column = "evaluation" if "evaluation" in df.columns else "generation"
+
+        return {
+            "name": run_path.name,
+            "progress_column": column,
+            "progress": df[column].to_numpy(dtype=np.int64),
+            "fitness": df["fitness"].to_numpy(dtype=float),
+            "population_size": int(info["population_size"]),
+            "sort_reverse": bool(info["sort_reverse"])
+        }
+    except Exception as e:  # pylint: disable=broad-except
+        print(f"Could not read {run_path}: {e}")
+        return None
+
+
+def load_runs(paths: list[str], workers: int = WORKERS) -> list[dict]:
+    """
+    Reads the best fitness histories of some runs in parallel.
+
+    Parameters:
+        paths (list[str]): Path-like strings to run.csv files, each next to its run's info.json.
+        workers (int): Number of runs to read at once.
+
+    Returns:
+        list[dict]: The runs that could be read, in order, see read_run().
+    """
+
+    csv_paths = [Path(path).resolve() for path in paths]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        runs = executor.map(read_run, [csv_path.parent for csv_path in csv_paths], csv_paths)
+
+    return [run for run in runs if run is not None]
+
+
+def x_values(run: dict, compute_evals: bool) -> np.ndarray:
+    """
+    Parameters:
+        run (dict): A run, see read_run().
+        compute_evals (bool): Whether the x-axis counts evaluations instead of generations.
+
+    Returns:
+        np.ndarray: The x value of each row of the run's history.
+    """
+
+    if run["progress_column"] == "evaluation": # Steady-state runs already log evaluations
+        return run["progress"] if compute_evals else run["progress"] // run["population_size"]
+
+    return run["progress"] * run["population_size"] if compute_evals else run["progress"]
+
+
+def align(runs: list[dict], compute_evals: bool) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Aligns run histories on the union of their x values.
+
+    Parameters:
+        runs (list[dict]): Runs, see read_run().
+        compute_evals (bool): Whether the x-axis counts evaluations instead of generations.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The sorted x values, and a runs x len(x) array of fitness, NaN where
+                                       a run has no value.
+    """
+
+    xs = [x_values(run, compute_evals) for run in runs]
+    x = np.unique(np.concatenate(xs)) if xs else np.zeros(0, dtype=np.int64)
+    fitness = np.full((len(runs), len(x)), np.nan)
+
+    for i, (run, run_x) in enumerate(zip(runs, xs)):
+        fitness[i, np.searchsorted(x, run_x)] = run["fitness"]
+
+    return x, fitness
+
+
+def run_signature(run_folders: list[Path]) -> str:
+    """
+    Parameters:
+        run_folders (list[Path]): Directories of the runs.
+
+    Returns:
+        str: The run names and the modification times of their files, which change whenever a run does.
+    """
+
+    signature = []
+
+    for run_path in run_folders:
+        mtimes = []
+        for filename in ["run.csv", "info.json"]:
+            file_path = run_path / filename
+            mtimes.append(os.stat(file_path).st_mtime_ns if file_path.exists() else None)
+        signature.append([run_path.name] + mtimes)
+
+    return json.dumps([CACHE_VERSION, signature])
+
+
+def load_batch(path: str, compute_evals: bool = True, workers: int = WORKERS, use_cache: bool = True) -> dict:
+    """
+    Loads the best fitness history of every run in a batch, from the cache if it is up to date.
+
+    Parameters:
+        path (str): A path-like string to a batch folder with run0, run1, ... subfolders.
+        compute_evals (bool): Whether the x-axis counts evaluations instead of generations.
+        workers (int): Number of runs to read at once.
+        use_cache (bool): Whether to read and write batch_cache.npz.
+
+    Returns:
+        dict: "x", the sorted x values, "fitness", a runs x len(x) array with NaN where a run has no value,
+              "runs", the run names, and "sort_reverse".
+    """
+
+    batch_path = Path(path).resolve()
+    run_folders = [run_path for run_path in sorted(batch_path.glob("run*")) if run_path.is_dir()]
+    cache_path = batch_path / CACHE_FILE
+    signature = run_signature(run_folders)
+    key = "evals" if compute_evals else "generations"
+
+    if use_cache and cache_path.exists():
+        with np.load(cache_path) as cache:
+            if str(cache["signature"]) == signature:
+                return {"x": cache["x_" + key], "fitness": cache["fitness_" + key], "runs": cache["runs"].tolist(),
+                        "sort_reverse": bool(cache["sort_reverse"])}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        runs = [run for run in executor.map(read_run, run_folders) if run is not None]
+
+    x_evals, fitness_evals = align(runs, True)
+    x_generations, fitness_generations = align(runs, False)
+    sort_reverse = runs[0]["sort_reverse"] if runs else False
+    names = np.array([run["name"] for run in runs], dtype=str)
+
+    if use_cache:
+        temp_path = batch_path / (".tmp_" + CACHE_FILE)
+        with open(temp_path, 'wb') as f:
+            np.savez(f, signature=signature, runs=names, sort_reverse=sort_reverse, x_evals=x_evals,
+                     fitness_evals=fitness_evals, x_generations=x_generations, fitness_generations=fitness_generations)
+        os.replace(temp_path, cache_path)
+
+    x, fitness = (x_evals, fitness_evals) if compute_evals else (x_generations, fitness_generations)
+
+    return {"x": x, "fitness": fitness, "runs": names.tolist(), "sort_reverse": sort_reverse}
+
+
+def batch_stats(fitness: np.ndarray) -> dict:
+    """
+    Statistics of each column of a runs x generations array, ignoring NaN.
+
+    Parameters:
+        fitness (np.ndarray): Array from load_batch().
+
+    Returns:
+        dict: "mean", "min", "max", "q25" and "q75" arrays, one value per column.
+    """
+
+    q25, q75 = np.nanpercentile(fitness, [25, 75], axis=0)
+
+    return {"mean": np.nanmean(fitness, axis=0), "min": np.nanmin(fitness, axis=0), "max": np.nanmax(fitness, axis=0),
+            "q25": q25, "q75": q75}
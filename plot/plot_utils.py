@@ -5,56 +5,41 @@ Author: Thomas Breimer
 July 15th, 2025
 """
 
-import os
 import argparse
 from pathlib import Path
 from matplotlib.cm import *
-import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.style as style
-import numpy as np
-import json
+from plot.batch_cache import load_batch, load_runs, x_values, batch_stats, WORKERS
 
 
-def plot_runs(paths, compute_evals=True):
+def plot_runs(paths, compute_evals=True, workers=WORKERS):
     """
     Plot fitness over evaluations or generations given a list of run.csv's.
 
-    If an info.json file is in the same directory as the run.csv and the compute_evals flag is true, 
-    number of evaluations is computed and plotted. Otherwise, the x-axis will be generations.
+    An info.json file is expected in the same directory as each run.csv. If the compute_evals flag is true,
+    number of evaluations is computed from its population size and plotted. Otherwise, the x-axis will be
+    generations.
+
+    Runs are read in parallel with the same reader as plot_batch, but not cached, since they needn't share
+    a folder. See plot/batch_cache.py.
 
     Arguments:
     paths (list[str]): A list of path-like strings to run.csv files to plot. Include multiple to compare between runs.
     compute_evals (bool): Whether to compute and plot evaluations instead of generations.
+    workers (int): Number of runs to read at once.
     """
 
     plt.figure(figsize=(8, 5))
     plt.ylabel("Best Fitness")
     style.use('tableau-colorblind10')
 
-    for path in paths:
-        path = Path(path).resolve()
-        df = pd.read_csv(path)
-        
-        if compute_evals: # Get population
-            info_path = os.path.join(path.parent, "info.json")
-            try:
-                with open(info_path, 'r') as file:
-                    info = json.load(file)
-                    population_size = int(info["population_size"])
-            except:
-                print("Expected to find", info_path, " but it was not found.")
-        else:
-            population_size = 1
-
-        parent_path = os.path.dirname(path)
-        parent_name = os.path.basename(parent_path)
-
-        plt.plot(np.array(df["generation"]*population_size),
-                np.array(df["fitness"]),
+    for run in load_runs(paths, workers):
+        plt.plot(x_values(run, compute_evals),
+                run["fitness"],
                 marker='o',
                 linestyle='-',
-                label=str(parent_name))
+                label=run["name"])
 
     if compute_evals:
         x_label = "Evaluations"
@@ -67,7 +52,7 @@ def plot_runs(paths, compute_evals=True):
     plt.grid()
     plt.show()
 
-def plot_batch(path, compute_evals=True):
+def plot_batch(path, compute_evals=True, workers=WORKERS, use_cache=True):
     """
     Plot fitness over evaluations or generations given a batch of runs.
 
@@ -79,9 +64,14 @@ def plot_batch(path, compute_evals=True):
     sort_reverse flag for the run. If sort_reverse is True, the max will be plotted, and otherwise
     the min is plotted. 
 
+    Runs are read in parallel and cached as one runs x generations array in batch_cache.npz in the batch
+    folder, which is reused until a run changes. See plot/batch_cache.py.
+
     Arguments:
     paths (str): A path-like string to a batch folder. run0, run1, run2, ... directories should exist as subfolders.
     compute_evals (bool): Whether to compute and plot evaluations instead of generations.
+    workers (int): Number of runs to read at once.
+    use_cache (bool): Whether to read and write the batch_cache.npz cache.
     """
 
     avg_color = '#ff871d'  # Orange for average best fitness
@@ -94,46 +84,12 @@ def plot_batch(path, compute_evals=True):
         ValueError(f"Path '{batch_path}' does not exist or is not a directory.")
         return
 
-    run_folders = list(batch_path.glob("run*"))
-    num_files = len(run_folders)
-
-    all_data = []
+    batch = load_batch(batch_path, compute_evals, workers, use_cache)
+    num_files = len(batch["runs"])
+    sort_reverse = batch["sort_reverse"]
 
-    for run_path in run_folders:
-        run_path = Path(run_path)
-        run_csv_path = Path(os.path.join(run_path, "run.csv"))
-        info_path = Path(os.path.join(run_path, "info.json"))
-        
-        # Get data from info.json
-        try:
-            with open(info_path, 'r') as file:
-                info = json.load(file)
-                sort_reverse = info["sort_reverse"]
-                if compute_evals: # Get population
-                    population_size = int(info["population_size"])
-                else:
-                    population_size = 1
-        except:
-            print("Expected to find", info_path, " but it was not found.")
-
-        try:
-            df = pd.read_csv(run_csv_path)
-            if 'generation' in df.columns and 'fitness' in df.columns:
-                df = df[['generation', 'fitness']]
-                df["generation"] = df["generation"] * population_size
-                df['run'] = run_csv_path.name
-                all_data.append(df)
-        except Exception as e:
-            print(f"Could not read {run_csv_path}: {e}")
-
-    combined = pd.concat(all_data, ignore_index=True)
-
-    stats = combined.groupby('generation')['fitness'].agg([
-        'mean', 'min', 'max', lambda x: x.quantile(0.25), lambda x: x.quantile(0.75)
-    ]).rename(columns={
-        '<lambda_0>': 'q25',
-        '<lambda_1>': 'q75'
-    }).reset_index()
+    stats = batch_stats(batch["fitness"])
+    stats['generation'] = batch["x"]
 
     plt.plot(stats['generation'], stats['mean'], marker='o', label="Mean Best Fitness", linewidth=2, color=avg_color)
     if sort_reverse:
@@ -0,0 +1,29 @@
+"""
+Shared fixtures for tests that perform small evolution runs.
+
+October 19th, 2026
+"""
+
+import pytest
+import evolutionary_alg
+from evolutionary_alg import run_settings
+
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch) -> dict:
+    """
+    Settings for a small, fast, seeded run saved under a temporary directory.
+
+    Returns:
+        dict: Keyword arguments for EvolutionRun.
+    """
+
+    # Keep the repository's latest_run symlink pointing where it was
+    monkeypatch.setattr(evolutionary_alg, "set_symlink", lambda symlink_path, target_path: None)
+
+    result = run_settings()
+    result.update(generations=4, population_size=6, num_elites=3, iters_per_run=3, fitness_function="num_faces",
+                  sort_reverse=True, export_generations=True, export_stl=False, run_name="run",
+                  data_path=str(tmp_path), workers=1, seed=7, catalog=str(tmp_path / "catalog.sqlite"))
+
+    return result
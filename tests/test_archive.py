@@ -0,0 +1,29 @@
+"""
+Tests for the binary generation archive.
+
+October 19th, 2026
+"""
+
+import os
+import pytest
+from evolution.archive import ArchiveReader
+from evolutionary_alg import EvolutionRun
+
+
+@pytest.mark.parametrize("fitness_function", ["num_faces", "hull_volume"])
+def test_export_csv_matches_run_files(settings, tmp_path, fitness_function):
+    settings.update(fitness_function=fitness_function)
+    EvolutionRun(**dict(settings, run_name="csv")).run()
+    EvolutionRun(**dict(settings, run_name="archive", generation_format="archive")).run()
+
+    reader = ArchiveReader(str(tmp_path / "archive"))
+    assert reader.generations() == list(range(settings["generations"]))
+
+    for generation in reader.generations():
+        name = "gen{}.csv".format(generation)
+        reader.export_csv(generation, str(tmp_path / name))
+
+        with open(tmp_path / name) as exported, open(tmp_path / "csv" / name) as written:
+            assert exported.read() == written.read()
+
+    assert not os.path.exists(tmp_path / "archive" / "gen0.csv")
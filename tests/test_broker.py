@@ -0,0 +1,64 @@
+"""
+Tests for the multi-node evaluation broker.
+
+October 19th, 2026
+"""
+
+import pytest
+from model.grammar import Grammar
+from model.tetrahedral_mesh import OPERATIONS
+from evolution.broker import BrokerEvaluator, resolve_authkey
+from evolutionary_alg import EvolutionRun
+
+ALPHABET = ["A", "B", "C", "D", "E", "F", "G"]
+
+
+def random_grammars(count: int) -> list[Grammar]:
+    return [Grammar(ALPHABET, OPERATIONS).generate_random() for i in range(count)]
+
+
+def test_public_broker_needs_authkey():
+    with pytest.raises(ValueError):
+        resolve_authkey("0.0.0.0:50000")
+
+    assert resolve_authkey("0.0.0.0:50000", b"key") == b"key"
+
+
+def test_loopback_broker_gets_random_authkey():
+    first = resolve_authkey("127.0.0.1:0")
+    second = resolve_authkey("localhost:0")
+
+    assert len(first) == 32
+    assert first != second
+
+
+def test_evaluate_without_workers_times_out():
+    evaluator = BrokerEvaluator("127.0.0.1:0", None, 10, False, "num_faces", local_workers=0, worker_timeout=0.5)
+
+    try:
+        with pytest.raises(RuntimeError, match="No live broker workers"):
+            evaluator.evaluate(random_grammars(2))
+    finally:
+        evaluator.shutdown()
+
+
+def test_evaluate_with_local_workers():
+    evaluator = BrokerEvaluator("127.0.0.1:0", None, 10, False, "num_faces", local_workers=1, worker_timeout=30)
+
+    try:
+        results = evaluator.evaluate(random_grammars(3))
+    finally:
+        evaluator.shutdown()
+
+    assert len(results) == 3
+    assert all(fitness >= 4 and mesh is None for fitness, mesh in results)
+
+
+def test_run_uses_its_broker_settings(settings):
+    settings.update(broker_address="0.0.0.0:0", workers=0)
+    with pytest.raises(ValueError):
+        EvolutionRun(**settings).run()
+
+    settings.update(broker_address="127.0.0.1:0", broker_authkey="key", broker_timeout=0.5)
+    with pytest.raises(RuntimeError, match="No live broker workers"):
+        EvolutionRun(**settings).run()
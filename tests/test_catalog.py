@@ -0,0 +1,28 @@
+"""
+Tests for the run catalog.
+
+October 19th, 2026
+"""
+
+from evolution import catalog
+from evolution.catalog import register_run, find_runs
+
+
+def test_runs_from_every_data_root_share_the_default_catalog(tmp_path, monkeypatch):
+    monkeypatch.setattr(catalog, "DEFAULT_CATALOG", str(tmp_path / "runs" / "catalog.sqlite"))
+
+    summary = {"best_fitness": 12, "generations_run": 4}
+    register_run(tmp_path / "runs" / "single", {"fitness_function": "num_faces"}, summary)
+    register_run(tmp_path / "batches" / "batch" / "run0", {"fitness_function": "num_faces"}, summary)
+    register_run(tmp_path / "islands" / "island0", {"fitness_function": "hull_volume"}, summary)
+
+    assert [run["run_name"] for run in find_runs(fitness_function="num_faces")] == ["single", "run0"]
+    assert len(find_runs()) == 3
+
+
+def test_catalog_override(tmp_path):
+    other = str(tmp_path / "other.sqlite")
+    register_run(tmp_path / "run", {"seed": 3}, {}, other)
+
+    assert [run["seed"] for run in find_runs(other)] == [3]
+    assert find_runs(str(tmp_path)) == []
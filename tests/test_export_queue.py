@@ -0,0 +1,30 @@
+"""
+Tests for the background export queue.
+
+October 19th, 2026
+"""
+
+import pytest
+from evolution.export_queue import ExportQueue
+
+
+def fail():
+    raise OSError("disk full")
+
+
+def test_jobs_after_a_failure_are_skipped():
+    exports = ExportQueue(4)
+    written = []
+
+    exports.submit(written.append, 0)
+    exports.submit(fail)
+    exports.submit(written.append, 1)
+
+    with pytest.raises(RuntimeError, match="An export job failed"):
+        exports.flush()
+
+    # Raised once, but later jobs, including the ones close() runs, still never write
+    exports.submit(written.append, 2)
+    exports.close()
+
+    assert written == [0]
@@ -0,0 +1,55 @@
+"""
+Tests for the integer-array genome backend.
+
+October 19th, 2026
+"""
+
+import os
+import numpy as np
+from model.grammar import Grammar
+from model.tetrahedral_mesh import OPERATIONS
+from evolution.genome_matrix import GenomeMatrix
+from evolutionary_alg import EvolutionRun
+
+ALPHABET = ["A", "B", "C", "D", "E", "F", "G"]
+
+
+def read_files(data_path: str) -> dict:
+    """
+    Returns:
+        dict: Contents of every .csv file in a run directory by file name.
+    """
+
+    files = {}
+
+    for name in sorted(os.listdir(data_path)):
+        if name.endswith(".csv"):
+            with open(os.path.join(data_path, name)) as f:
+                files[name] = f.read()
+
+    return files
+
+
+def test_round_trip():
+    grammars = [Grammar(ALPHABET, OPERATIONS).generate_random() for i in range(50)]
+
+    genes = GenomeMatrix.from_grammars(grammars, ALPHABET, OPERATIONS)
+    decoded = genes.to_grammars()
+
+    assert [grammar.to_dict() for grammar in decoded] == [grammar.to_dict() for grammar in grammars]
+    assert decoded[3].to_dict() == genes.to_grammar(3).to_dict()
+    assert np.array_equal(GenomeMatrix.from_grammars(decoded, ALPHABET, OPERATIONS).genes, genes.genes)
+
+
+def test_kept_genes_match_encoding_the_population(settings, tmp_path, monkeypatch):
+    settings.update(genome_backend="matrix", generations=6, surrogate_oversample=2)
+    EvolutionRun(**dict(settings, run_name="kept")).run()
+
+    # Encode every generation's parents from their Grammars instead of gathering their kept genes
+    monkeypatch.setattr(EvolutionRun, "population_genes",
+                        lambda run, genomes: GenomeMatrix.from_grammars(genomes, run.alphabet, OPERATIONS))
+    EvolutionRun(**dict(settings, run_name="encoded")).run()
+
+    kept = read_files(tmp_path / "kept")
+    assert len(kept) == 8 # gen0.csv to gen5.csv, run.csv and surrogate.csv
+    assert kept == read_files(tmp_path / "encoded")
@@ -0,0 +1,61 @@
+"""
+Tests for resuming interrupted runs from their checkpoints.
+
+October 19th, 2026
+"""
+
+import csv
+import os
+import pytest
+from evolutionary_alg import EvolutionRun
+
+TIMED_COLUMNS = ["predicted_seconds", "seconds"] # Wall-clock columns that differ between any two runs
+
+
+def read_logs(data_path: str) -> dict:
+    """
+    Returns:
+        dict: Rows of every .csv file in a run directory by file name, without wall-clock columns.
+    """
+
+    logs = {}
+
+    for name in sorted(os.listdir(data_path)):
+        if name.endswith(".csv"):
+            with open(os.path.join(data_path, name), newline='') as f:
+                logs[name] = [{key: value for key, value in row.items() if key not in TIMED_COLUMNS}
+                              for row in csv.DictReader(f)]
+
+    return logs
+
+
+@pytest.mark.parametrize("options, logs", [
+    ({"racing_levels": 2, "surrogate_oversample": 2}, {"racing.csv", "surrogate.csv"}),
+    ({"novelty_weight": 0.5, "schedule": "longest_first"}, {"novelty.csv", "costs.csv"})
+])
+def test_resumed_run_matches_uninterrupted_run(settings, tmp_path, monkeypatch, options, logs):
+    settings.update(options, generations=6, workers=2, checkpoint_interval=2)
+    EvolutionRun(**dict(settings, run_name="uninterrupted")).run()
+
+    # Interrupt after generation 3 is logged, past the checkpoint after generation 1
+    next_generation = EvolutionRun.next_generation
+
+    def interrupt(run):
+        if run.current_gen == 3:
+            raise KeyboardInterrupt
+        next_generation(run)
+
+    monkeypatch.setattr(EvolutionRun, "next_generation", interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        EvolutionRun(**settings).run()
+    monkeypatch.setattr(EvolutionRun, "next_generation", next_generation)
+
+    EvolutionRun(**dict(settings, resume=True)).run()
+
+    expected = read_logs(tmp_path / "uninterrupted")
+    resumed = read_logs(tmp_path / "run")
+
+    assert set(expected) >= logs | {"run.csv"}
+    assert resumed == expected
+    for name in logs - {"costs.csv"}:
+        assert [row["generation"] for row in resumed[name]] == [str(generation) for generation in range(6)]
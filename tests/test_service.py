@@ -0,0 +1,82 @@
+"""
+Tests for the long-lived evaluation service and its client.
+
+October 19th, 2026
+"""
+
+import json
+import time
+import asyncio
+import threading
+import pytest
+from model.grammar import Grammar
+from model.tetrahedral_mesh import OPERATIONS
+from evolution.service import EvaluationService, ServiceClient
+from evolution.evaluator import evaluate_rules
+
+ALPHABET = ["A", "B", "C", "D", "E", "F", "G"]
+
+
+@pytest.fixture
+def address(tmp_path):
+    address = "unix:" + str(tmp_path / "service.sock")
+    service = EvaluationService(address, 2)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_until_complete, args=(service.serve(),), daemon=True)
+    thread.start()
+
+    while not (tmp_path / "service.sock").exists():
+        time.sleep(0.01)
+
+    yield address
+
+    service.shutdown()
+
+
+def test_request_after_failed_request(address):
+    grammars = [Grammar(ALPHABET, OPERATIONS).generate_random() for i in range(4)]
+    expected = [evaluate_rules(grammar.to_dict(), 20, False, "num_faces")[0] for grammar in grammars]
+
+    with ServiceClient(address) as client:
+        with pytest.raises(RuntimeError, match="Service failed"):
+            client.evaluate_all(grammars, 20, False, "no_such_fitness")
+
+        assert client.evaluate_all(grammars, 20, False, "num_faces") == expected
+
+
+def test_request_after_stopping_early(address):
+    grammars = [Grammar(ALPHABET, OPERATIONS).generate_random() for i in range(4)]
+    expected = [evaluate_rules(grammar.to_dict(), 20, False, "num_faces")[0] for grammar in grammars]
+
+    with ServiceClient(address) as client:
+        results = client.evaluate(grammars, 20, False, "num_faces")
+        next(results)
+        results.close()
+
+        assert client.evaluate_all(grammars, 20, False, "num_faces") == expected
+
+
+@pytest.mark.parametrize("line", [b'{"iters_per_run": 20}\n', b'{"grammars": [1, 2]}\n', b'[1, 2]\n', b'not json\n',
+                                  b'{"grammars": [], "iters_per_run": "20"}\n'])
+def test_malformed_request(address, line):
+    grammars = [Grammar(ALPHABET, OPERATIONS).generate_random() for i in range(4)]
+    expected = [evaluate_rules(grammar.to_dict(), 20, False, "num_faces")[0] for grammar in grammars]
+
+    with ServiceClient(address) as client:
+        client.stream.write(line)
+        client.stream.flush()
+
+        assert "Bad request" in json.loads(client.stream.readline())["error"]
+        assert json.loads(client.stream.readline()) == {"done": True}
+
+        assert client.evaluate_all(grammars, 20, False, "num_faces") == expected
+
+
+def test_client_raises_rejected_request(address):
+    grammars = [Grammar(ALPHABET, OPERATIONS).generate_random() for i in range(4)]
+
+    with ServiceClient(address) as client:
+        with pytest.raises(RuntimeError, match="Service rejected the request"):
+            client.evaluate_all(grammars, "20", False, "num_faces")
+
+        assert len(client.evaluate_all(grammars, 20, False, "num_faces")) == 4
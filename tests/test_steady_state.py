@@ -0,0 +1,21 @@
+"""
+Tests for asynchronous steady-state evolution.
+
+October 19th, 2026
+"""
+
+import csv
+import os
+from evolution.steady_state import SteadyStateRun
+
+
+def test_more_workers_than_population(settings):
+    settings.update(workers=6, population_size=4, num_elites=2, generations=3)
+    run = SteadyStateRun(**settings)
+    run.run()
+
+    assert run.evaluations == 12
+    assert len(run.population) == 4
+
+    with open(os.path.join(run.data_path, "run.csv"), newline='') as f:
+        assert [row["evaluation"] for row in csv.DictReader(f)] == ["4", "8", "12"]